@@ -0,0 +1,31 @@
+"""Slučajevi iz modula ``merifib.benchmark`` za dodatak pytest-benchmark.
+
+Fajl se ne pokreće sa ostalim testovima, već eksplicitno::
+
+    $ PYTHONPATH=. pytest benchmarks/bench_fibonacci.py
+
+"""
+
+import pytest
+
+from merifib import benchmark
+from merifib.cache import checkpoints
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize("case,size", [
+    (case, size)
+    for case, (_, sizes) in benchmark.CASES.items()
+    for size in sizes
+])
+def test_case(benchmark_fixture, case, size):
+    setup, _ = benchmark.CASES[case]
+    benchmark_fixture.pedantic(setup(size), setup=checkpoints.clear,
+                               rounds=5)
+
+
+@pytest.fixture
+def benchmark_fixture(benchmark):
+    # Ime "benchmark" je zauzeto modulom merifib.benchmark.
+    return benchmark
@@ -0,0 +1,8 @@
+"""Pokretanje interfejsa komandne linije: ``python3 -m merifib``."""
+
+import sys
+
+from merifib.cli import main
+
+
+sys.exit(main())
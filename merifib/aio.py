@@ -0,0 +1,229 @@
+"""Modul implementira asinhronu iteraciju kroz Fibonačijev niz, u delovima.
+
+Namenjen je servisima zasnovanim na ``asyncio`` biblioteci: niz (i
+beskonačan) se dobija kao asinhroni iterator delova (lista brojeva), tako da
+se petlja događaja ne blokira generisanjem, niti se za svaki broj prelazi u
+drugu nit::
+
+    >>> async def main():
+    ...     async with Fibonacci().aiter_batches(batch_size=1000) as batches:
+    ...         async for batch in batches:
+    ...             await send(batch)
+    ...             if done():
+    ...                 break
+    ...         save(batches.checkpoint.to_json())
+
+Delove računa pozadinski zadatak (``asyncio.Task``) i stavlja ih u red
+ograničene veličine, pa se računanje zaustavlja kada potrošač kasni (ne
+računa se više od ``queue_size`` delova unapred).  Deo sa velikim brojevima
+se računa u izvršiocu (podrazumevano nit petlje događaja, a može se zadati
+i ``ProcessPoolExecutor``), dok se mali delovi računaju odmah, jer bi
+prelazak u drugu nit bio skuplji od samog računanja.
+
+Posle svakog preuzetog dela, ``checkpoint`` je stanje iteracije (indeks k
+sledećeg broja i par (F(k), F(k+1))), iz kog se iteracija može nastaviti i
+u drugom procesu: ``AsyncBatches(Checkpoint.from_json(data))``.
+
+"""
+
+import asyncio
+import collections
+import json
+
+from merifib.fibonacci import _signed_pair
+
+
+# Podrazumevani broj brojeva niza u jednom delu.
+BATCH_SIZE = 1000
+
+# Podrazumevani najveći broj gotovih delova koji čekaju potrošača.
+QUEUE_SIZE = 4
+
+# Deo se računa u izvršiocu ukoliko je posao (broj brojeva u delu puta broj
+# bitova brojeva) veći od ovoga, tj. ukoliko traje duže od oko jedne
+# milisekunde.
+OFFLOAD_BITS = 2**22
+
+
+class Checkpoint(collections.namedtuple("Checkpoint",
+                                        "index value next_value")):
+    """Stanje iteracije: indeks k i par (F(k), F(k+1)).
+
+    Kao tuple se može direktno serijalizovati (npr. ``pickle``), a metodi
+    ``to_json`` i ``from_json`` ga zapisuju kao JSON, sa brojevima kao
+    heksadecimalnim stringovima (bez ograničenja broja cifara pri konverziji
+    velikih brojeva, i bez kvadratne složenosti decimalne konverzije).
+
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def at(cls, index):
+        """Vrati stanje na indeksu k, skokom do para (F(k), F(k+1))."""
+        value, next_value = _signed_pair(index)
+        return cls(index, value, next_value)
+
+    def to_json(self):
+        """Vrati stanje kao JSON string."""
+        return json.dumps({
+            "index": self.index,
+            "value": format(self.value, "x"),
+            "next_value": format(self.next_value, "x"),
+        })
+
+    @classmethod
+    def from_json(cls, data):
+        """Vrati stanje zapisano metodom ``to_json``.
+
+        Raises:
+            ValueError: Ukoliko zapis nije ispravan.
+
+        """
+        try:
+            fields = json.loads(data)
+            return cls(int(fields["index"]), int(fields["value"], 16),
+                       int(fields["next_value"], 16))
+        except (KeyError, TypeError) as e:
+            raise ValueError("Neispravan zapis stanja.") from e
+
+
+def _batch(a, b, count):
+    # Pomoćna funkcija koja vraća count brojeva niza od para (a, b) i par
+    # koji sledi iza njih.  Funkcija je na nivou modula da bi mogla da se
+    # izvrši i u drugom procesu.
+    #
+    # Argumenti:
+    #   a (int): Prvi broj dela.
+    #   b (int): Broj koji sledi iza prvog.
+    #   count (int): Broj brojeva dela.
+    #
+    # Vraća:
+    #   tuple: Lista brojeva i sledeći par.
+    batch = []
+    for _ in range(count):
+        batch.append(a)
+        a, b = b, a + b
+    return batch, (a, b)
+
+
+class AsyncBatches:
+    """Asinhroni iterator delova niza (lista uzastopnih brojeva).
+
+    Iteracija počinje od zadatog stanja, a pozadinski zadatak se pokreće
+    tek pri prvom traženju dela.  Iterator treba zatvoriti (``aclose`` ili
+    ``async with``) kada se iteracija prekine pre kraja, da bi se pozadinski
+    zadatak zaustavio.
+
+    Atributi:
+        checkpoint: Stanje iteracije posle poslednjeg preuzetog dela
+            (``Checkpoint``).
+        remaining: Broj brojeva koji još nisu preuzeti, ili None za
+            beskonačan niz.
+
+    """
+
+    def __init__(self, checkpoint, count=None, batch_size=BATCH_SIZE,
+                 queue_size=QUEUE_SIZE, executor=None):
+        """Inicijalizuj iterator, bez pokretanja računanja.
+
+        Args:
+            checkpoint (Checkpoint or tuple): Stanje od kog počinje
+                iteracija, (k, F(k), F(k+1)).
+            count (int or None): Broj brojeva, ili None za beskonačan niz.
+            batch_size (int): Broj brojeva u jednom delu (poslednji deo može
+                biti kraći).
+            queue_size (int): Najveći broj gotovih delova koji čekaju.
+            executor (concurrent.futures.Executor or None): Izvršilac za
+                delove sa velikim brojevima.  Podrazumevano None, tj.
+                podrazumevani izvršilac petlje događaja.
+
+        Raises:
+            ValueError: Ukoliko je broj brojeva negativan, ili veličina dela
+                ili reda nije pozitivna.
+
+        """
+        if count is not None and count < 0:
+            raise ValueError("Broj brojeva ne sme biti negativan.")
+        if batch_size < 1 or queue_size < 1:
+            raise ValueError("Veličina dela i reda mora biti pozitivna.")
+
+        self.checkpoint = Checkpoint(*checkpoint)
+        self.remaining = count
+        self._batch_size = batch_size
+        self._queue_size = queue_size
+        self._executor = executor
+        self._queue = None
+        self._task = None
+        self._done = count == 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._done:
+            raise StopAsyncIteration
+        if self._task is None:
+            self._queue = asyncio.Queue(self._queue_size)
+            self._task = asyncio.ensure_future(self._produce())
+
+        item = await self._queue.get()
+        if item is None:
+            self._done = True
+            raise StopAsyncIteration
+        if isinstance(item, BaseException):
+            self._done = True
+            raise item
+
+        batch, self.checkpoint = item
+        if self.remaining is not None:
+            self.remaining -= len(batch)
+        return batch
+
+    async def _produce(self):
+        # Pozadinski zadatak: računa delove i stavlja ih u red, zajedno sa
+        # stanjem posle dela.  Kada je red pun, čeka potrošača.  Na kraju
+        # stavlja None, a u slučaju greške izuzetak.
+        loop = asyncio.get_running_loop()
+        index, a, b = self.checkpoint
+        remaining = self.remaining
+        try:
+            while remaining is None or remaining > 0:
+                count = (self._batch_size if remaining is None
+                         else min(self._batch_size, remaining))
+                if b.bit_length() * count > OFFLOAD_BITS:
+                    batch, (a, b) = await loop.run_in_executor(
+                        self._executor, _batch, a, b, count)
+                else:
+                    batch, (a, b) = _batch(a, b, count)
+                    # Mali delovi se računaju odmah, pa petlji događaja
+                    # ustupamo red posle svakog dela.
+                    await asyncio.sleep(0)
+
+                index += count
+                if remaining is not None:
+                    remaining -= count
+                await self._queue.put((batch, Checkpoint(index, a, b)))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await self._queue.put(e)
+        else:
+            await self._queue.put(None)
+
+    async def aclose(self):
+        """Zaustavi pozadinski zadatak.  Stanje (``checkpoint``) ostaje
+        stanje posle poslednjeg preuzetog dela."""
+        self._done = True
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
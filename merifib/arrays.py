@@ -0,0 +1,124 @@
+"""Modul implementira izlaz Fibonačijevih nizova kao NumPy nizova.
+
+NumPy biblioteka nije deo standardne biblioteke i nije neophodna za ostatak
+paketa, zato se ovaj modul uvozi tek kada se zatraži izlaz u obliku NumPy
+niza, a ukoliko biblioteka nije instalirana, podiže se ``ImportError`` sa
+objašnjenjem.
+
+"""
+
+from merifib import modular
+from merifib.fibonacci import _fib_pair
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _require_numpy():
+    # Pomoćna funkcija koja proverava da je NumPy dostupan.
+    if numpy is None:
+        raise ImportError("Za izlaz u obliku niza potrebna je biblioteka "
+                          "NumPy.")
+
+
+def _fits(lo, hi, dtype):
+    # Pomoćna funkcija koja proverava da li svi brojevi F(lo) .. F(hi) mogu
+    # da se predstave celobrojnim tipom dtype.  Apsolutna vrednost F(k) raste
+    # sa |k|, pa je dovoljno proveriti broj sa najvećim |k|, a levo od nule
+    # prvi negativan broj je F(-2) = -1.  Nijedan 64-bitni tip ne može da
+    # predstavi F(94).
+    info = numpy.iinfo(dtype)
+    if info.min == 0 and lo <= -2:
+        return False
+
+    k = max(abs(lo), abs(hi))
+    return k < 94 and _fib_pair(k)[0] <= info.max
+
+
+def sequence_array(fib, dtype=None):
+    """Vrati niz konačne dužine kao NumPy niz.
+
+    Niz sadrži iste brojeve, istim redom, kao ``fib.sequence()``.
+    Podrazumevani tip je ``int64``, ili ``uint64`` ukoliko brojevi ne staju u
+    ``int64`` a nisu negativni, što važi za nizove do F(92), odnosno F(93).
+    Za veće brojeve se podiže ``OverflowError``, a ukoliko se eksplicitno
+    zada ``dtype=object``, vraća se niz Pythonovih celih brojeva.
+
+    Args:
+        fib (Fibonacci): Niz konačne dužine.
+        dtype: NumPy tip elemenata niza.  Podrazumevano None (automatski
+            izbor između ``int64`` i ``uint64``).
+
+    Returns:
+        numpy.ndarray: Brojevi niza.
+
+    Raises:
+        ImportError: Ukoliko NumPy nije instaliran.
+        ValueError: Ukoliko dužina niza nije definisana.
+        OverflowError: Ukoliko brojevi ne staju u zadati tip.
+
+    """
+    _require_numpy()
+    if fib.length is None:
+        raise ValueError("Niz mora imati dužinu.")
+
+    lo, hi = fib._bounds()
+
+    if dtype is None:
+        if _fits(lo, hi, numpy.int64):
+            dtype = numpy.int64
+        elif _fits(lo, hi, numpy.uint64):
+            dtype = numpy.uint64
+        else:
+            raise OverflowError("Brojevi niza ne staju u 64 bita.")
+    elif numpy.dtype(dtype).kind in "iu" and not _fits(lo, hi, dtype):
+        raise OverflowError("Brojevi niza ne staju u zadati tip.")
+
+    return numpy.array(fib.sequence(), dtype=dtype)
+
+
+def sequence_mod_array(fib, m):
+    """Vrati niz konačne dužine po modulu m kao NumPy niz tipa ``uint64``.
+
+    Niz sadrži iste ostatke kao ``fib.sequence_mod(m)``.  Za module za koje
+    postoji tabela ostataka (videti modul ``merifib.modular``) niz se
+    dobija vektorski, indeksiranjem tabele nizom indeksa, a inače se
+    ostaci generišu redom.
+
+    Args:
+        fib (Fibonacci): Niz konačne dužine.
+        m (int): Modul, između 1 i 2^64.
+
+    Returns:
+        numpy.ndarray: Ostaci brojeva niza.
+
+    Raises:
+        ImportError: Ukoliko NumPy nije instaliran.
+        ValueError: Ukoliko dužina niza nije definisana, ili ukoliko modul
+            nije pozitivan.
+        OverflowError: Ukoliko je modul veći od 2^64.
+
+    """
+    _require_numpy()
+    if fib.length is None:
+        raise ValueError("Niz mora imati dužinu.")
+    if m > 2**64:
+        raise OverflowError("Ostaci po modulu većem od 2^64 ne staju u 64 "
+                            "bita.")
+
+    lo, hi = fib._bounds()
+    table = modular.pisano.table(m)
+
+    if table is not None:
+        residues = numpy.frombuffer(table, dtype=numpy.uint64)
+        # Indeksi se svode po periodu pre pravljenja niza, jer granice niza
+        # ne moraju stati u 64 bita.
+        base = lo % len(table)
+        indices = ((numpy.arange(hi - lo + 1, dtype=numpy.int64) + base)
+                   % len(table))
+        return residues[indices]
+
+    return numpy.fromiter(modular.iter_mod(lo, m), dtype=numpy.uint64,
+                          count=hi - lo + 1)
@@ -0,0 +1,150 @@
+"""Modul implementira izbor aritmetike velikih celih brojeva.
+
+Skokovi kroz niz (brzo udvostručavanje i sabiranje indeksa, videti
+``merifib.fibonacci``) se svode na množenja velikih celih brojeva, koja za
+brojeve od više stotina hiljada cifara određuju vreme izvršavanja.
+Pythonovi celi brojevi množe Karacubinim algoritmom, a biblioteka GMP (kroz
+Python biblioteku gmpy2, ukoliko je instalirana) asimptotski bržim
+algoritmima, pa je za F(10^6) oko deset puta brža.  Za male brojeve je
+pretvaranje u ``gmpy2.mpz`` i nazad skuplje od samog računanja, zato se
+ubrzana aritmetika koristi tek za brojeve od ``CROSSOVER_BITS`` bitova
+naviše (videti ``python3 -m merifib.benchmark backends``).
+
+Aritmetika se bira funkcijom ``use``, ili promenljivom okruženja
+``MERIFIB_BACKEND`` (``auto``, ``int`` ili ``gmpy2``), koju nasleđuju i
+procesi pokrenuti iz programa.  Podrazumevano (``auto``) se koristi gmpy2
+ukoliko je instaliran, a za nepoznatu ili nedostupnu aritmetiku iz
+promenljive okruženja se izdaje upozorenje i koristi ``int``.  Rezultati
+metoda klase ``Fibonacci`` su uvek Pythonovi celi brojevi::
+
+    >>> from merifib import backend
+    >>> backend.use("int").name
+    'int'
+
+"""
+
+import os
+import warnings
+
+try:
+    import gmpy2
+except ImportError:
+    gmpy2 = None
+
+
+# Broj bitova od kog je množenje pomoću gmpy2, zajedno sa pretvaranjem
+# brojeva, brže od množenja Pythonovih celih brojeva.  Izmereno je da je
+# prelaz oko F(3000), tj. oko 2000 bitova.
+CROSSOVER_BITS = 2048
+
+
+class Backend:
+    """Aritmetika Pythonovih celih brojeva (podrazumevana).
+
+    Aritmetika je opisana pretvaranjem brojeva: brojevi se pre računanja
+    pretvaraju metodom ``convert``, računa se uobičajenim operatorima, a
+    rezultat se metodom ``to_int`` vraća u Pythonov ceo broj.
+
+    Atributi:
+        name: Ime aritmetike.
+        min_bits: Najmanja veličina brojeva (u bitovima) za koju se
+            aritmetika koristi; za manje brojeve se računa Pythonovim celim
+            brojevima.
+
+    """
+
+    name = "int"
+
+    def __init__(self, min_bits=0):
+        self.min_bits = min_bits
+
+    def convert(self, n):
+        """Pretvori ceo broj u tip ove aritmetike."""
+        return n
+
+    def to_int(self, x):
+        """Pretvori broj tipa ove aritmetike u Pythonov ceo broj."""
+        return x
+
+    def __repr__(self):
+        return "{}(min_bits={})".format(type(self).__name__, self.min_bits)
+
+
+class GmpyBackend(Backend):
+    """Aritmetika biblioteke GMP, kroz ``gmpy2.mpz``."""
+
+    name = "gmpy2"
+
+    def __init__(self, min_bits=CROSSOVER_BITS):
+        """Inicijalizuj aritmetiku.
+
+        Raises:
+            ImportError: Ukoliko biblioteka gmpy2 nije instalirana.
+
+        """
+        if gmpy2 is None:
+            raise ImportError("Za aritmetiku gmpy2 potrebna je biblioteka "
+                              "gmpy2.")
+        super().__init__(min_bits)
+
+    def convert(self, n):
+        return gmpy2.mpz(n)
+
+    def to_int(self, x):
+        return int(x)
+
+
+BACKENDS = {
+    "int": Backend,
+    "gmpy2": GmpyBackend,
+}
+
+
+def available():
+    """Vrati imena aritmetika koje se mogu koristiti."""
+    return [name for name in BACKENDS if name != "gmpy2" or gmpy2 is not None]
+
+
+def use(name="auto", min_bits=None):
+    """Izaberi aritmetiku koju koristi ceo proces.
+
+    Args:
+        name (str): Ime aritmetike (``int`` ili ``gmpy2``), ili ``auto``
+            za gmpy2 ukoliko je instaliran, a inače ``int``.
+        min_bits (int or None): Najmanja veličina brojeva za koju se
+            aritmetika koristi.  Podrazumevano None, tj. ``CROSSOVER_BITS``
+            za gmpy2.
+
+    Returns:
+        Backend: Izabrana aritmetika.
+
+    Raises:
+        ValueError: Ukoliko aritmetika ne postoji.
+        ImportError: Ukoliko biblioteka potrebna za aritmetiku nije
+            instalirana.
+
+    """
+    global _current
+    if name == "auto":
+        name = "gmpy2" if gmpy2 is not None else "int"
+    if name not in BACKENDS:
+        raise ValueError("Nepoznata aritmetika: {}".format(name))
+
+    _current = (BACKENDS[name]() if min_bits is None
+                else BACKENDS[name](min_bits))
+    return _current
+
+
+def current():
+    """Vrati aritmetiku koju proces trenutno koristi."""
+    return _current
+
+
+_current = Backend()
+try:
+    use(os.environ.get("MERIFIB_BACKEND", "auto"))
+except (ValueError, ImportError) as e:
+    # Pogrešna vrednost promenljive okruženja ne sme da spreči učitavanje
+    # modula, pa se koristi podrazumevana aritmetika.
+    warnings.warn("Aritmetika iz MERIFIB_BACKEND se ne može koristiti "
+                  "({}), koristi se int.".format(e), RuntimeWarning)
@@ -0,0 +1,334 @@
+"""Modul implementira merenje performansi metoda klase ``Fibonacci``.
+
+Za svaki slučaj (metod) i svaku veličinu ulaza meri se vreme izvršavanja i
+najveće zauzeće memorije (``tracemalloc``), a rezultati se čuvaju u JSON
+fajlu.  Dva fajla sa rezultatima se mogu uporediti, pri čemu se označavaju
+slučajevi koji su sporiji ili zauzimaju više memorije od zadatog praga::
+
+    $ python3 -m merifib.benchmark run -o pre.json
+    $ python3 -m merifib.benchmark run -o posle.json --cases nth,json
+    $ python3 -m merifib.benchmark compare pre.json posle.json --threshold 0.1
+
+Niz dužine n od nule zauzima memoriju kvadratnu po n (F(k) ima oko 0.7·k
+bitova), zato su podrazumevane veličine za slučajeve koji generišu niz manje
+nego za slučajeve koji računaju jedan broj.  Druge veličine se mogu zadati
+opcijom ``--sizes``.  Isti slučajevi se mogu pokrenuti i pomoću dodatka
+pytest-benchmark (videti ``benchmarks/bench_fibonacci.py``).
+
+Komanda ``backends`` meri skok do F(n) svakom dostupnom aritmetikom velikih
+brojeva (videti ``merifib.backend``) i ispisuje najmanje n za koje je
+ubrzana aritmetika brža od Pythonovih celih brojeva::
+
+    $ python3 -m merifib.benchmark backends
+
+"""
+
+import argparse
+import datetime
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+from merifib import backend
+from merifib.cache import checkpoints
+from merifib.fibonacci import Fibonacci, _fib_pair
+
+
+def _setup_init(size):
+    # Provera početne vrednosti F(size).
+    seed = _fib_pair(size)[0]
+    return lambda: Fibonacci(1, seed)
+
+
+def _setup_nth(size):
+    return lambda: Fibonacci.nth(size)
+
+
+def _setup_sequence(size):
+    return Fibonacci(size).sequence
+
+
+def _setup_sequence_back(size):
+    return Fibonacci(-size, _fib_pair(size)[0]).sequence
+
+
+def _setup_json(size):
+    return Fibonacci(size).json
+
+
+# Slučajevi: ime -> (funkcija koja za veličinu vraća funkciju koja se meri,
+# podrazumevane veličine).  Priprema (npr. računanje početne vrednosti) se ne
+# meri, a keš kontrolnih tačaka se prazni pre svakog poziva (videti run), da
+# bi se merilo izračunavanje a ne keš.
+CASES = {
+    "init": (_setup_init, [10, 10**2, 10**3, 10**4, 10**5, 10**6]),
+    "nth": (_setup_nth, [10, 10**2, 10**3, 10**4, 10**5, 10**6, 10**7]),
+    "sequence": (_setup_sequence, [10, 10**2, 10**3, 10**4]),
+    "sequence_back": (_setup_sequence_back, [10, 10**2, 10**3, 10**4]),
+    "json": (_setup_json, [10, 10**2, 10**3, 10**4]),
+}
+
+
+def measure(func, min_time=0.2, max_repeat=1000):
+    """Izmeri vreme izvršavanja i najveće zauzeće memorije funkcije.
+
+    Funkcija se poziva dok ukupno vreme ne pređe ``min_time`` sekundi (ali
+    najmanje jednom i najviše ``max_repeat`` puta), a zatim još jednom uz
+    ``tracemalloc``, koji usporava izvršavanje pa se ne meri vreme tog
+    poziva.
+
+    Returns:
+        dict: Najkraće vreme (``time``) i medijana vremena (``median``) u
+            sekundama, broj poziva (``repeat``) i najveće zauzeće memorije u
+            bajtovima (``peak_bytes``).
+
+    """
+    times = []
+    total = 0.0
+    while not times or (total < min_time and len(times) < max_repeat):
+        begin = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - begin
+        times.append(elapsed)
+        total += elapsed
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "time": min(times),
+        "median": statistics.median(times),
+        "repeat": len(times),
+        "peak_bytes": peak,
+    }
+
+
+def run(cases=None, sizes=None, min_time=0.2, report=None):
+    """Izmeri zadate slučajeve i vrati rezultate.
+
+    Args:
+        cases (list or None): Imena slučajeva iz ``CASES``.  Podrazumevano
+            None, tj. svi slučajevi.
+        sizes (list or None): Veličine ulaza.  Podrazumevano None, tj.
+            podrazumevane veličine svakog slučaja.
+        min_time (float): Najmanje ukupno vreme merenja jednog slučaja i
+            veličine, u sekundama.
+        report (callable or None): Poziva se sa svakim rezultatom čim je
+            izmeren.
+
+    Returns:
+        dict: Opis okruženja (``meta``) i lista rezultata (``results``).
+
+    Raises:
+        ValueError: Ukoliko slučaj ne postoji.
+
+    """
+    results = []
+    for name in cases or CASES:
+        if name not in CASES:
+            raise ValueError("Nepoznat slučaj: {}".format(name))
+        setup, default_sizes = CASES[name]
+        for size in sizes or default_sizes:
+            func = setup(size)
+
+            def cold():
+                checkpoints.clear()
+                func()
+
+            result = {"case": name, "size": size}
+            result.update(measure(cold, min_time))
+            if report is not None:
+                report(result)
+            results.append(result)
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        },
+        "results": results,
+    }
+
+
+# Podrazumevane veličine za poređenje aritmetika.
+BACKEND_SIZES = [10**2, 10**3, 3 * 10**3, 10**4, 10**5, 10**6]
+
+
+def backends(sizes=None, min_time=0.2, report=None):
+    """Izmeri skok do F(n) svakom dostupnom aritmetikom velikih brojeva.
+
+    Meri se brzo udvostručavanje, uključujući pretvaranje brojeva u tip
+    aritmetike i nazad, pri čemu se aritmetika koristi za sve veličine
+    (prag ``min_bits`` je 0).  Aritmetika procesa se posle merenja vraća na
+    prethodnu.
+
+    Args:
+        sizes (list or None): Indeksi n.  Podrazumevano ``BACKEND_SIZES``.
+        min_time (float): Najmanje ukupno vreme merenja jedne aritmetike i
+            veličine, u sekundama.
+        report (callable or None): Poziva se sa svakim redom rezultata čim
+            je izmeren.
+
+    Returns:
+        list: Za svaku veličinu dict sa ključem ``size`` i najkraćim
+            vremenom u sekundama za svaku aritmetiku (ključ je ime
+            aritmetike).
+
+    """
+    previous = backend.current()
+    rows = []
+    try:
+        for size in sizes or BACKEND_SIZES:
+            row = {"size": size}
+            for name in backend.available():
+                backend.use(name, min_bits=0)
+                row[name] = measure(lambda: _fib_pair(size), min_time)["time"]
+            if report is not None:
+                report(row)
+            rows.append(row)
+    finally:
+        backend.use(previous.name, previous.min_bits)
+    return rows
+
+
+def crossover(rows, name="gmpy2"):
+    """Vrati najmanju veličinu od koje je aritmetika ``name`` brža od
+    Pythonovih celih brojeva za sve izmerene veće veličine, ili None."""
+    found = None
+    for row in sorted(rows, key=lambda row: row["size"], reverse=True):
+        if name not in row or row[name] >= row["int"]:
+            break
+        found = row["size"]
+    return found
+
+
+def compare(old, new, threshold=0.1):
+    """Uporedi dva skupa rezultata.
+
+    Porede se slučajevi i veličine prisutni u oba skupa.  Regresija je
+    slučaj čije je vreme ili zauzeće memorije u novom skupu veće od starog
+    za više od zadatog udela.
+
+    Args:
+        old (dict): Stari rezultati (kao što ih vraća ``run``).
+        new (dict): Novi rezultati.
+        threshold (float): Dozvoljeni relativni porast, npr. 0.1 za 10%.
+
+    Returns:
+        list: Za svaki zajednički slučaj i veličinu dict sa ključevima
+            ``case``, ``size``, ``time_ratio``, ``memory_ratio`` (odnos novog
+            i starog) i ``regression`` (bool).
+
+    """
+    previous = {(r["case"], r["size"]): r for r in old["results"]}
+    rows = []
+    for r in new["results"]:
+        o = previous.get((r["case"], r["size"]))
+        if o is None:
+            continue
+        time_ratio = r["time"] / o["time"] if o["time"] else 1.0
+        memory_ratio = (r["peak_bytes"] / o["peak_bytes"]
+                        if o["peak_bytes"] else 1.0)
+        rows.append({
+            "case": r["case"],
+            "size": r["size"],
+            "time_ratio": time_ratio,
+            "memory_ratio": memory_ratio,
+            "regression": max(time_ratio, memory_ratio) > 1 + threshold,
+        })
+    return rows
+
+
+def _print_result(result):
+    print("{case:<14} {size:>10} {time:>12.6f} s {peak_bytes:>14} B"
+          .format(**result), flush=True)
+
+
+def main(argv=None):
+    """Pokreni merenje ili poređenje iz komandne linije.
+
+    Returns:
+        int: Izlazni kod, 1 ukoliko poređenje nađe regresiju.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="merifib.benchmark",
+        description="Merenje performansi klase Fibonacci.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Izmeri slučajeve.")
+    run_parser.add_argument("--cases", help="Slučajevi, razdvojeni zarezom "
+                            "({}).".format(", ".join(CASES)))
+    run_parser.add_argument("--sizes", help="Veličine, razdvojene zarezom.")
+    run_parser.add_argument("--min-time", type=float, default=0.2)
+    run_parser.add_argument("-o", "--output", help="JSON fajl za rezultate.")
+
+    backends_parser = subparsers.add_parser(
+        "backends", help="Uporedi aritmetike velikih brojeva.")
+    backends_parser.add_argument("--sizes",
+                                 help="Indeksi, razdvojeni zarezom.")
+    backends_parser.add_argument("--min-time", type=float, default=0.2)
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="Uporedi dva fajla sa rezultatima.")
+    compare_parser.add_argument("old")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=0.1,
+                                help="Dozvoljeni relativni porast.")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        cases = args.cases.split(",") if args.cases else None
+        sizes = ([int(float(s)) for s in args.sizes.split(",")]
+                 if args.sizes else None)
+        results = run(cases, sizes, args.min_time, _print_result)
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(results, f, indent=2)
+        return 0
+
+    if args.command == "backends":
+        sizes = ([int(float(s)) for s in args.sizes.split(",")]
+                 if args.sizes else None)
+        names = backend.available()
+        print("{:>10}".format("n") + "".join("{:>14}".format(name)
+                                             for name in names))
+
+        def report(row):
+            print("{:>10}".format(row["size"]) +
+                  "".join("{:>12.6f} s".format(row[name]) for name in names),
+                  flush=True)
+
+        rows = backends(sizes, args.min_time, report)
+        if "gmpy2" not in names:
+            print("Biblioteka gmpy2 nije instalirana.")
+        elif crossover(rows) is None:
+            print("gmpy2 nije brži ni za jednu veličinu.")
+        else:
+            print("gmpy2 je brži od n = {}".format(crossover(rows)))
+        return 0
+
+    with open(args.old) as f:
+        old = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+
+    rows = compare(old, new, args.threshold)
+    for row in rows:
+        print("{case:<14} {size:>10} vreme {time_ratio:6.2f}x "
+              "memorija {memory_ratio:6.2f}x{flag}".format(
+                  flag="  REGRESIJA" if row["regression"] else "", **row))
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
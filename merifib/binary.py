@@ -0,0 +1,208 @@
+"""Modul implementira kompaktan binarni format za Fibonačijeve nizove.
+
+Format je namenjen razmeni dugih nizova velikih brojeva: brojevi se zapisuju
+kao bajtovi apsolutne vrednosti (little-endian), bez konverzije u decimalni
+zapis, pa je fajl 2-3 puta manji od JSON zapisa, a upis i čitanje su
+linearne složenosti.  Fajl se čita pomoću ``mmap``, tako da se do k-tog
+broja dolazi direktno, preko indeksa, bez čitanja ostatka fajla.
+
+Struktura fajla (svi celi brojevi su little-endian)::
+
+    zaglavlje (32 bajta):
+        magični broj  4 bajta  b"MFIB"
+        verzija       uint16   1
+        smer          int16    1 (rastući indeksi) ili -1 (opadajući)
+        početak       int64    indeks u nizu prvog zapisanog broja
+        dužina        uint64   broj zapisanih brojeva (n)
+        rezervisano   8 bajtova
+    podaci:
+        apsolutne vrednosti brojeva, jedna za drugom (broj 0 ima 0 bajtova)
+    indeks (na kraju fajla):
+        n+1 uint64 pomeraja početaka brojeva u odnosu na početak podataka;
+        poslednji je ukupna dužina podataka
+
+Broj na poziciji j u fajlu je F(početak + j*smer).  Znak se ne zapisuje jer
+sledi iz indeksa (F(k) < 0 ako i samo ako je k negativno i parno).  Indeks
+je na kraju da bi pisanje moglo da teče redom, bez vraćanja na početak, a
+njegov položaj se izračunava iz dužine fajla i broja brojeva.
+
+"""
+
+import array
+import collections.abc
+import mmap
+import os
+import struct
+import sys
+
+
+MAGIC = b"MFIB"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHhqQ8x")
+_OFFSET = struct.Struct("<Q")
+
+
+def _sign(k):
+    # Znak broja F(k): negativni su samo brojevi sa negativnim parnim
+    # indeksom.
+    return -1 if k < 0 and k % 2 == 0 else 1
+
+
+def magnitude_bytes(n):
+    """Vrati bajtove apsolutne vrednosti celog broja (little-endian)."""
+    n = abs(n)
+    return n.to_bytes((n.bit_length() + 7) // 8, "little")
+
+
+def write(fib, target, reverse=False):
+    """Upiši niz konačne dužine u binarnom formatu, broj po broj.
+
+    Brojevi se upisuju čim su izračunati (videti ``Fibonacci.iter_sequence``),
+    tako da se ceo niz nikada ne drži u memoriji; u memoriji je samo indeks
+    (8 bajtova po broju).  Cilj ne mora da podržava ``seek``.
+
+    Args:
+        fib (Fibonacci): Niz konačne dužine.
+        target (file or str or os.PathLike): Binarni fajl objekat otvoren za
+            pisanje, ili putanja.
+        reverse (bool): Ukoliko je tačno, brojevi se upisuju obrnutim redom
+            (opadajući indeksi).  Podrazumevana vrednost je False.
+
+    Raises:
+        ValueError: Ukoliko dužina niza nije definisana.
+
+    """
+    if fib.length is None:
+        raise ValueError("Niz mora imati dužinu.")
+
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "wb") as f:
+            write(fib, f, reverse)
+        return
+
+    lo, hi = fib._bounds()
+    count = hi - lo + 1
+    start, direction = (hi, -1) if reverse else (lo, 1)
+
+    target.write(_HEADER.pack(MAGIC, VERSION, direction, start, count))
+    offsets = array.array("Q", [0])
+    position = 0
+    for number in fib.iter_sequence(reverse):
+        data = magnitude_bytes(number)
+        target.write(data)
+        position += len(data)
+        offsets.append(position)
+
+    if sys.byteorder != "little":
+        offsets.byteswap()
+    target.write(offsets.tobytes())
+
+
+class SequenceFile(collections.abc.Sequence):
+    """Niz zapisan u binarnom formatu, čitan pomoću ``mmap``.
+
+    Ponaša se kao nepromenljiva sekvenca celih brojeva (``len``,
+    indeksiranje, isecanje, iteracija).  Brojevi se čitaju tek kada su
+    traženi, a ``raw`` vraća bajtove apsolutne vrednosti broja kao
+    ``memoryview`` nad mapiranim fajlom, bez kopiranja.  Fajl se zatvara
+    metodom ``close``, ili na kraju ``with`` bloka::
+
+        >>> Fibonacci(10**5).write_binary("niz.bin")
+        >>> with SequenceFile("niz.bin") as s:
+        ...     s[-1] == Fibonacci.nth(10**5)
+        True
+
+    Atributi:
+        start: Indeks u nizu prvog broja u fajlu.
+        step: Smer niza u fajlu, 1 ili -1.
+
+    """
+
+    def __init__(self, path):
+        """Otvori fajl i proveri zaglavlje.
+
+        Raises:
+            ValueError: Ukoliko fajl nije u ovom formatu ili je oštećen.
+
+        """
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+
+        try:
+            if len(self._mmap) < _HEADER.size:
+                raise ValueError("Fajl je prekratak.")
+            magic, version, self.step, self.start, self._count = \
+                _HEADER.unpack_from(self._mmap)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError("Fajl nije u binarnom formatu niza.")
+
+            self._index = len(self._mmap) - _OFFSET.size * (self._count + 1)
+            if self._index < _HEADER.size or \
+                    self._offset(self._count) != self._index - _HEADER.size:
+                raise ValueError("Fajl je oštećen.")
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        """Zatvori fajl.  Pogledi dobijeni metodom ``raw`` moraju biti
+        oslobođeni pre toga."""
+        if self._mmap is not None:
+            self._view.release()
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _offset(self, i):
+        # Pomeraj početka i-tog broja u odnosu na početak podataka.
+        return _OFFSET.unpack_from(self._mmap,
+                                   self._index + _OFFSET.size * i)[0]
+
+    def __len__(self):
+        return self._count
+
+    def _position(self, i):
+        # Normalizuje poziciju (negativne pozicije od kraja).
+        i = i.__index__()
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("Indeks van opsega niza.")
+        return i
+
+    def raw(self, i):
+        """Vrati bajtove apsolutne vrednosti i-tog broja (little-endian),
+        kao ``memoryview`` nad fajlom, bez kopiranja."""
+        i = self._position(i)
+        begin = _HEADER.size + self._offset(i)
+        end = _HEADER.size + self._offset(i + 1)
+        return self._view[begin:end]
+
+    def index_of(self, i):
+        """Vrati indeks u nizu i-tog broja u fajlu."""
+        return self.start + self._position(i) * self.step
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(self._count)[i]]
+        with self.raw(i) as data:
+            value = int.from_bytes(data, "little")
+        return _sign(self.index_of(i)) * value
+
+    def __iter__(self):
+        # Čita pomeraje redom, bez ponovnog čitanja prethodnog pomeraja.
+        k = self.start
+        end = self._offset(0)
+        for i in range(self._count):
+            begin, end = end, self._offset(i + 1)
+            with self._view[_HEADER.size + begin:_HEADER.size + end] as data:
+                value = int.from_bytes(data, "little")
+            yield _sign(k) * value
+            k += self.step
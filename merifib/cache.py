@@ -0,0 +1,187 @@
+"""Modul implementira keš kontrolnih tačaka Fibonačijevog niza.
+
+Kontrolna tačka je par uzastopnih Fibonačijevih brojeva (F(k), F(k+1)) sa
+poznatim indeksom k.  Od takvog para se do bilo kog obližnjeg broja niza može
+doći sabiranjem ili skokom, bez računanja od početka niza.  Keš je zajednički
+za ceo proces (``checkpoints``), ograničen je zauzećem memorije, i izbacuje
+najdavnije korišćene tačke kada se budžet prekorači.
+
+"""
+
+import bisect
+import collections
+import sys
+import threading
+
+
+class CheckpointCache:
+    """Keš parova (F(k), F(k+1)) ograničen veličinom u bajtovima.
+
+    Tačke se pamte po indeksu k.  Pored tačnog traženja, keš omogućava
+    nalaženje najbliže tačke sa indeksom ne većim od zadatog (pomoću sortirane
+    „lestvice“ indeksa), kao i nalaženje tačke po vrednosti F(k).  Kada zbir
+    veličina zapamćenih brojeva pređe budžet, izbacuju se najdavnije korišćene
+    tačke (LRU).  Svi metodi su bezbedni za korišćenje iz više niti.
+
+    Atributi:
+        max_bytes: Budžet memorije u bajtovima.
+        hits: Broj uspešnih traženja.
+        misses: Broj neuspešnih traženja.
+        evictions: Broj izbačenih tačaka.
+
+    """
+
+    def __init__(self, max_bytes=64 * 2**20):
+        """Inicijalizuj prazan keš sa zadatim budžetom memorije.
+
+        Args:
+            max_bytes (int): Najveće dozvoljeno zauzeće memorije zapamćenih
+                brojeva, u bajtovima.  Podrazumevano 64 MiB.
+
+        Raises:
+            ValueError: Ukoliko je budžet negativan.
+
+        """
+        if max_bytes < 0:
+            raise ValueError("Budžet memorije ne sme biti negativan.")
+
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries = collections.OrderedDict()  # k -> (F(k), F(k+1))
+        self._ladder = []       # Sortirani indeksi zapamćenih tačaka.
+        self._by_value = {}     # F(k) -> k
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _sizeof(pair):
+        # Procena zauzeća memorije jedne tačke.
+        return sys.getsizeof(pair[0]) + sys.getsizeof(pair[1])
+
+    def get(self, k):
+        """Vrati tačku sa indeksom k, ili None ukoliko nije zapamćena."""
+        with self._lock:
+            pair = self._entries.get(k)
+            if pair is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(k)
+            self.hits += 1
+            return pair
+
+    def nearest(self, k):
+        """Vrati najbližu zapamćenu tačku sa indeksom ne većim od k.
+
+        Returns:
+            tuple or None: Par ``(indeks, (F(indeks), F(indeks+1)))``, ili
+                None ukoliko takva tačka ne postoji.
+
+        """
+        with self._lock:
+            i = bisect.bisect_right(self._ladder, k)
+            if i == 0:
+                self.misses += 1
+                return None
+
+            index = self._ladder[i-1]
+            self._entries.move_to_end(index)
+            self.hits += 1
+            return index, self._entries[index]
+
+    def find_value(self, value):
+        """Vrati zapamćenu tačku za koju je F(k) == value.
+
+        Returns:
+            tuple or None: Par ``(k, (F(k), F(k+1)))``, ili None ukoliko
+                takva tačka nije zapamćena.
+
+        """
+        with self._lock:
+            k = self._by_value.get(value)
+            if k is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(k)
+            self.hits += 1
+            return k, self._entries[k]
+
+    def put(self, k, pair):
+        """Zapamti tačku (F(k), F(k+1)) sa indeksom k.
+
+        Tačka veća od čitavog budžeta se ne pamti.  Po potrebi se izbacuju
+        najdavnije korišćene tačke.
+
+        """
+        size = self._sizeof(pair)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if k in self._entries:
+                self._entries.move_to_end(k)
+                return
+
+            self._entries[k] = pair
+            bisect.insort(self._ladder, k)
+            self._by_value[pair[0]] = k
+            self._bytes += size
+            self._evict()
+
+    def _evict(self):
+        # Izbacuje najdavnije korišćene tačke dok zauzeće ne padne ispod
+        # budžeta.  Poziva se sa zaključanim self._lock.
+        while self._bytes > self.max_bytes:
+            k, pair = self._entries.popitem(last=False)
+            del self._ladder[bisect.bisect_left(self._ladder, k)]
+            if self._by_value.get(pair[0]) == k:
+                del self._by_value[pair[0]]
+            self._bytes -= self._sizeof(pair)
+            self.evictions += 1
+
+    def resize(self, max_bytes):
+        """Promeni budžet memorije, izbacujući tačke ako je potrebno."""
+        if max_bytes < 0:
+            raise ValueError("Budžet memorije ne sme biti negativan.")
+
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self):
+        """Isprazni keš i resetuj brojače."""
+        with self._lock:
+            self._entries.clear()
+            self._ladder.clear()
+            self._by_value.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """Vrati statistiku keša kao dictionary.
+
+        Returns:
+            dict: Ključevi ``hits``, ``misses``, ``evictions``, ``entries``,
+                ``bytes`` i ``max_bytes``.
+
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Zajednički keš kontrolnih tačaka za ceo proces.
+checkpoints = CheckpointCache()
@@ -0,0 +1,246 @@
+"""Modul implementira interfejs komandne linije programa.
+
+Pokreće se komandom ``python3 -m merifib`` i ne zavisi od tkinter
+biblioteke, tako da radi i na serverima bez grafičkog okruženja.
+Podkomande odgovaraju metodima klase ``Fibonacci``::
+
+    $ python3 -m merifib nth 10 20 30
+    $ python3 -m merifib sequence --length 10 --seed 13
+    $ python3 -m merifib json --length 10
+    $ python3 -m merifib stats --length -1000 --seed 55
+
+Ukoliko pozicije, odnosno dužina niza, nisu zadate argumentima, čitaju se sa
+standardnog ulaza, red po red: za ``nth`` jedna ili više pozicija u redu, a
+za ostale podkomande dužina i (opciono) početna vrednost niza u redu.
+Rezultati se ispisuju na standardni izlaz čim su izračunati, kao tekst, JSON
+Lines (``--format jsonl``), ili binarno (``--format binary``, samo za
+``nth`` i ``sequence``); podkomanda ``json`` ispisuje isključivo JSON Lines
+i nema opciju ``--format``.  U binarnom formatu svaki broj je zapisan kao
+8-bajtni označeni ceo broj L (little-endian), iza kog sledi |L| bajtova
+apsolutne vrednosti broja (little-endian); negativno L označava negativan
+broj.  Opcijom ``--encoding`` se brojevi u tekstualnom i JSON formatu
+umesto decimalno mogu zapisati heksadecimalno (``hex``) ili kao base64 zapis
+bajtova broja (``base64``), videti modul ``merifib.formatting``.
+
+"""
+
+import argparse
+import sys
+
+from merifib import formatting
+from merifib.fibonacci import Fibonacci
+
+
+# Broj pozicija sa standardnog ulaza koje se računaju odjednom (videti
+# Fibonacci.nth_many).
+BATCH_SIZE = 4096
+
+# Najveći broj bajtova koji se odjednom čita sa standardnog ulaza.
+READ_SIZE = 2**16
+
+
+def encode_binary(n):
+    """Vrati binarni zapis celog broja (videti opis modula)."""
+    size = (abs(n).bit_length() + 7) // 8
+    header = (-size if n < 0 else size).to_bytes(8, "little", signed=True)
+    return header + abs(n).to_bytes(size, "little")
+
+
+def _json_value(n, encoding):
+    # Pomoćna funkcija koja vraća zapis broja kao JSON vrednost: broj za
+    # decimalni zapis, a string za ostale.
+    text = formatting.encode(n, encoding)
+    return text if encoding == "decimal" else '"' + text + '"'
+
+
+def _write_numbers(out, args, key, pairs):
+    # Pomoćna funkcija koja ispisuje parove (k, broj) u zadatom formatu.
+    # Broj k je pozicija ili indeks broja i ispisuje se samo u JSON Lines
+    # formatu, pod imenom key.
+    if args.format == "binary":
+        out.write(b"".join(encode_binary(n) for _, n in pairs))
+    elif args.format == "jsonl":
+        out.write("".join(
+            '{{"{}": {}, "value": {}}}\n'.format(
+                key, k, _json_value(n, args.encoding))
+            for k, n in pairs).encode("ascii"))
+    else:
+        out.write("".join(formatting.encode(n, args.encoding) + "\n"
+                          for _, n in pairs).encode("ascii"))
+
+
+def _read_available(lines):
+    # Pomoćni generator koji vraća delove ulaza (tekst), svaki deo onoliko
+    # koliko je ulaza trenutno dostupno, a najviše READ_SIZE bajtova.  Ulaz
+    # bez binarnog bafera (npr. io.StringIO) se čita red po red.
+    raw = getattr(lines, "buffer", None)
+    if raw is None or not hasattr(raw, "read1"):
+        yield from lines
+        return
+    while True:
+        data = raw.read1(READ_SIZE)
+        if not data:
+            return
+        yield data.decode("ascii")
+
+
+def _read_positions(lines):
+    # Pomoćni generator koji vraća pozicije sa ulaza u blokovima od najviše
+    # BATCH_SIZE pozicija.  Blok se vraća čim nema više dostupnog ulaza, tj.
+    # pozicije koje pristižu red po red se ne zadržavaju čekajući naredne,
+    # a pozicije iz datoteke (ili cevi) se računaju u punim blokovima.
+    batch = []
+    rest = ""
+    for chunk in _read_available(lines):
+        complete, _, rest = (rest + chunk).rpartition("\n")
+        batch.extend(int(token) for token in complete.split())
+        while len(batch) > BATCH_SIZE:
+            yield batch[:BATCH_SIZE]
+            batch = batch[BATCH_SIZE:]
+        if batch:
+            yield batch
+            batch = []
+    batch.extend(int(token) for token in rest.split())
+    if batch:
+        yield batch
+
+
+def _read_windows(args, lines):
+    # Pomoćni generator koji vraća nizove zadate argumentima, ili redovima
+    # ulaza u obliku "<dužina> [<početna vrednost>]".
+    if args.length is not None:
+        yield Fibonacci(args.length, args.seed)
+        return
+
+    for line in lines:
+        tokens = line.split()
+        if not tokens:
+            continue
+        length = int(tokens[0])
+        seed = int(tokens[1]) if len(tokens) > 1 else 0
+        yield Fibonacci(length, seed)
+
+
+def cmd_nth(args, lines, out):
+    """Ispiši Fibonačijeve brojeve na zadatim pozicijama."""
+    if args.positions:
+        batches = [args.positions]
+    else:
+        batches = _read_positions(lines)
+
+    for batch in batches:
+        values = Fibonacci.nth_many(batch)
+        _write_numbers(out, args, "position", zip(batch, values))
+        out.flush()
+
+
+def cmd_sequence(args, lines, out):
+    """Ispiši brojeve zadatih nizova, broj po broj."""
+    for f in _read_windows(args, lines):
+        lo, _ = f._bounds()
+        numbers = f.iter_sequence()
+        while True:
+            block = [(lo + i, n) for i, n in zip(range(BATCH_SIZE), numbers)]
+            if not block:
+                break
+            _write_numbers(out, args, "index", block)
+            lo += len(block)
+        out.flush()
+
+
+def cmd_json(args, lines, out):
+    """Ispiši JSON reprezentaciju zadatih nizova, po jednu u redu."""
+    for f in _read_windows(args, lines):
+        for chunk in f.iter_json(binary=True, encoding=args.encoding):
+            out.write(chunk)
+        out.write(b"\n")
+        out.flush()
+
+
+def cmd_stats(args, lines, out):
+    """Ispiši zbir i broj parnih i neparnih brojeva zadatih nizova."""
+    for f in _read_windows(args, lines):
+        stats = f.stats()
+        if args.format == "jsonl":
+            line = '{{"sum": {}, "evens": {}, "odds": {}}}\n'
+            total = _json_value(stats["sum"], args.encoding)
+        else:
+            line = "{} {} {}\n"
+            total = formatting.encode(stats["sum"], args.encoding)
+        out.write(line.format(total, stats["evens"], stats["odds"])
+                  .encode("ascii"))
+        out.flush()
+
+
+def build_parser():
+    """Vrati parser argumenata komandne linije."""
+    parser = argparse.ArgumentParser(
+        prog="merifib",
+        description="Istraživanje Fibonačijevog niza.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    nth = subparsers.add_parser(
+        "nth", help="Fibonačijevi brojevi na zadatim pozicijama.")
+    nth.add_argument("positions", nargs="*", type=int,
+                     help="Pozicije (ako nisu zadate, čitaju se sa ulaza).")
+    nth.add_argument("--format", choices=["text", "jsonl", "binary"],
+                     default="text")
+    nth.add_argument("--encoding", choices=formatting.ENCODINGS,
+                     default="decimal", help="Zapis brojeva.")
+    nth.set_defaults(func=cmd_nth)
+
+    for name, func, formats, help_text in (
+            ("sequence", cmd_sequence, ["text", "jsonl", "binary"],
+             "Niz zadate dužine i početne vrednosti."),
+            ("json", cmd_json, None,
+             "JSON reprezentacija niza."),
+            ("stats", cmd_stats, ["text", "jsonl"],
+             "Zbir i broj parnih i neparnih brojeva u nizu.")):
+        sub = subparsers.add_parser(name, help=help_text)
+        sub.add_argument("--length", type=int,
+                         help="Dužina niza (ako nije zadata, nizovi se "
+                              "čitaju sa ulaza).")
+        sub.add_argument("--seed", type=int, default=0,
+                         help="Početna vrednost niza.")
+        if formats:
+            sub.add_argument("--format", choices=formats, default="text")
+        else:
+            # Podkomanda ima samo jedan format izlaza (JSON Lines).
+            sub.set_defaults(format="jsonl")
+        sub.add_argument("--encoding", choices=formatting.ENCODINGS,
+                         default="decimal", help="Zapis brojeva.")
+        sub.set_defaults(func=func)
+
+    return parser
+
+
+def main(argv=None, stdin=None, stdout=None):
+    """Pokreni program iz komandne linije.
+
+    Args:
+        argv (list or None): Argumenti komandne linije, bez imena programa.
+            Podrazumevano ``sys.argv[1:]``.
+        stdin (file or None): Tekstualni ulaz.  Podrazumevano ``sys.stdin``.
+        stdout (file or None): Binarni izlaz.  Podrazumevano
+            ``sys.stdout.buffer``.
+
+    Returns:
+        int: Izlazni kod programa.
+
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.format == "binary" and args.encoding != "decimal":
+        parser.error("binarni format ne koristi --encoding")
+    lines = sys.stdin if stdin is None else stdin
+    out = sys.stdout.buffer if stdout is None else stdout
+
+    try:
+        args.func(args, lines, out)
+    except ValueError as e:
+        print("merifib: {}".format(e), file=sys.stderr)
+        return 1
+    except BrokenPipeError:
+        # Izlaz je zatvoren (npr. ``| head``), nema potrebe za porukom.
+        return 0
+    return 0
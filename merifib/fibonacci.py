@@ -4,43 +4,286 @@ njim.
 """
 
 import decimal
-import json
+import functools
+import io
+import itertools
+import math
+import os
 
+from merifib import backend, formatting, modular, table
+from merifib.cache import checkpoints
 
-# Podešavanje preciznosti za artimetiku sa Decimal objektima (u tekućoj niti).
-# Vrednost je izabrana donekle arbitrarno: povećavana je za 100 dok 301.
-# Fibonačijev broj nije izračunat tačno pomoću Bineove fomule (što se pokazalo
-# dovoljnim za bar do 501. broja).
-decimal.getcontext().prec = 300
+
+def _fib_pair(n):
+    # Pomoćna funkcija koja vraća par (F(n), F(n+1)) metodom brzog
+    # udvostručavanja.  Koristi identitete
+    #
+    #   F(2k)   = F(k) * (2*F(k+1) - F(k))
+    #   F(2k+1) = F(k)^2 + F(k+1)^2
+    #
+    # i prolazi kroz binarne cifre broja n od najznačajnije, tako da je
+    # potrebno O(log(n)) koraka sa po tri množenja, a međurezultati su uvek
+    # tačni celi brojevi.
+    #
+    # Za velike brojeve se računa izabranom aritmetikom (videti
+    # merifib.backend), a rezultat se vraća kao Pythonovi celi brojevi.
+    #
+    # Argumenti:
+    #   n (int): Indeks niza, n >= 0.
+    #
+    # Vraća:
+    #   tuple: Par (F(n), F(n+1)).
+    arithmetic = backend.current()
+    if n * _LOG2_PHI < arithmetic.min_bits:
+        arithmetic = _INT
+
+    a, b = arithmetic.convert(0), arithmetic.convert(1)
+    for bit in bin(n)[2:]:
+        c = a * (2*b - a)   # F(2k)
+        d = a*a + b*b       # F(2k+1)
+        if bit == '1':
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return arithmetic.to_int(a), arithmetic.to_int(b)
+
+
+def _fib_add(p, q):
+    # Pomoćna funkcija koja od parova (F(m), F(m+1)) i (F(n), F(n+1)) daje
+    # par (F(m+n), F(m+n+1)) pomoću identiteta sabiranja indeksa
+    #
+    #   F(m+n)   = F(m)*F(n+1) + F(m+1)*F(n) - F(m)*F(n)
+    #   F(m+n+1) = F(m+1)*F(n+1) + F(m)*F(n)
+    #
+    # Omogućava skok unapred od već izračunatog para, bez ponovnog računanja
+    # od nule.
+    #
+    # Argumenti:
+    #   p (tuple): Par (F(m), F(m+1)).
+    #   q (tuple): Par (F(n), F(n+1)).
+    #
+    # Vraća:
+    #   tuple: Par (F(m+n), F(m+n+1)).
+    a, b = p
+    c, d = q
+    arithmetic = backend.current()
+    if min(b.bit_length(), d.bit_length()) < arithmetic.min_bits:
+        arithmetic = _INT
+    else:
+        a, b, c, d = map(arithmetic.convert, (a, b, c, d))
+
+    ac = a * c
+    return arithmetic.to_int(a*d + b*c - ac), arithmetic.to_int(b*d + ac)
+
+
+# Aritmetika Pythonovih celih brojeva, za brojeve manje od praga izabrane
+# aritmetike.
+_INT = backend.Backend()
+
+# Broj bitova broja F(n) je približno n*log2(phi).
+_LOG2_PHI = math.log2((1 + math.sqrt(5)) / 2)
+
+
+# Najveća razlika indeksa za koju je jeftinije korakom sabiranja doći do
+# sledećeg broja nego skokom pomoću _fib_add().  Izmereno je da skok košta
+# otprilike koliko i 100-150 sabiranja brojeva iste veličine, nezavisno od
+# veličine brojeva.
+_STEP_LIMIT = 128
+
+# Prirodni logaritmi za procenu indeksa Fibonačijevog broja.
+_LOG_PHI = math.log((1 + math.sqrt(5)) / 2)
+_LOG_SQRT5 = math.log(5) / 2
+
+
+# Broj decimalnih cifara broja F(n) je približno n*log10(phi) (videti
+# _binet).
+_LOG10_PHI = _LOG_PHI / math.log(10)
+
+# Broj dodatnih cifara preciznosti u Bineovoj formuli, preko broja cifara
+# traženog rezultata i broja cifara indeksa (toliko cifara se gubi
+# stepenovanjem).
+_GUARD_DIGITS = 10
+
+
+@functools.lru_cache(maxsize=32)
+def _phi(prec):
+    # Pomoćna funkcija koja vraća zlatni presek kao Decimal objekat sa prec
+    # značajnih cifara.  Računa se tek kada je potreban, u lokalnom
+    # kontekstu, a preciznost se zaokružuje naviše na stepen dvojke da bi
+    # keš bio koristan za različite n.
+    #
+    # Argumenti:
+    #   prec (int): Najmanja potrebna preciznost.
+    #
+    # Vraća:
+    #   decimal.Decimal: Zlatni presek (1 + sqrt(5)) / 2.
+    prec = max(64, 1 << (prec - 1).bit_length())
+    with decimal.localcontext(decimal.Context(prec=prec)):
+        return (1 + decimal.Decimal(5).sqrt()) / 2
+
+
+# Indeksi manji od ovoga se ne keširaju, jer je njihovo izračunavanje brže od
+# održavanja keša.
+_CACHE_MIN_INDEX = 1024
+
+
+def _pair_at(n):
+    # Pomoćna funkcija koja vraća par (F(n), F(n+1)) kao _fib_pair(), ali
+    # koristeći zajednički keš kontrolnih tačaka: kreće od najbliže
+    # zapamćene tačke sa manjim indeksom (sabiranjem ako je blizu, skokom
+    # ako je dalje), a izračunati par pamti za sledeće pozive.
+    #
+    # Argumenti:
+    #   n (int): Indeks niza, n >= 0.
+    #
+    # Vraća:
+    #   tuple: Par (F(n), F(n+1)).
+    if n < _CACHE_MIN_INDEX:
+        return _fib_pair(n)
+
+    # Par iz priključene tabele (videti merifib.table) se čita direktno, a
+    # van tabele je njen poslednji par kontrolna tačka kao i ostale.
+    stored = table.attached()
+    found = checkpoints.nearest(n)
+    if stored is not None:
+        pair = stored.pair(n)
+        if pair is not None:
+            return pair
+        last = len(stored) - 2
+        if last >= 0 and (found is None or found[0] < last):
+            found = last, stored.pair(last)
+    if found is None:
+        pair = _fib_pair(n)
+    else:
+        k, pair = found
+        gap = n - k
+        if gap <= _STEP_LIMIT:
+            a, b = pair
+            for _ in range(gap):
+                a, b = b, a + b
+            pair = (a, b)
+        elif gap < k:
+            # Skok je isplativ samo ako je manji od već pređenog puta, inače
+            # je računanje od nule podjednako brzo.
+            pair = _fib_add(pair, _fib_pair(gap))
+        else:
+            pair = _fib_pair(n)
+
+    checkpoints.put(n, pair)
+    return pair
+
+
+def _signed_pair(n):
+    # Pomoćna funkcija koja vraća par (F(n), F(n+1)) za bilo koji ceo broj n,
+    # uključujući negativne indekse (negafibonači brojevi), po identitetu
+    # F(-m) = (-1)^(m+1) * F(m).
+    #
+    # Argumenti:
+    #   n (int): Indeks niza.
+    #
+    # Vraća:
+    #   tuple: Par (F(n), F(n+1)).
+    if n >= 0:
+        return _pair_at(n)
+
+    # Za n = -m je F(n) = s*F(m) i F(n+1) = F(-(m-1)) = -s*F(m-1), gde je s
+    # znak koji zavisi od parnosti broja m.
+    m = -n
+    prev, cur = _pair_at(m - 1)
+    sign = 1 if m % 2 else -1
+    return sign * cur, -sign * prev
+
+
+def _fib_signed(n):
+    # Pomoćna funkcija koja vraća F(n) za bilo koji ceo broj n (videti
+    # _signed_pair()).
+    return _signed_pair(n)[0]
+
+
+def _fib_index(value):
+    # Pomoćna funkcija koja vraća indeks n za koji je F(n) == value, ili None
+    # ukoliko broj ne pripada Fibonačijevom nizu (bez negativnih indeksa).
+    #
+    # Indeks se procenjuje iz Bineove formule, n ~ log(value*sqrt(5))/log(phi),
+    # što je za Fibonačijeve brojeve tačno posle zaokruživanja jer je greška
+    # zanemarljiva u odnosu na 1/2 (Python računa logaritam celog broja
+    # proizvoljne veličine).  Procena se zatim proverava tačnim
+    # izračunavanjem para (F(n-1), F(n)), što je ujedno i potpuna provera da
+    # je broj Fibonačijev.  Provera brzim udvostručavanjem je za velike
+    # brojeve nekoliko puta brža od testa potpunog kvadrata za 5*value^2 +/- 4
+    # pomoću math.isqrt(), a usput daje i prethodni broj u nizu.
+    #
+    # Argumenti:
+    #   value (int): Broj koji se proverava.
+    #
+    # Vraća:
+    #   int or None: Indeks broja u nizu.  Za broj 1 vraća 1, a ne 2.
+    if value < 0:
+        return None
+    if value <= 1:
+        return value
+
+    # Broj je možda već izračunat kao kontrolna tačka.
+    found = checkpoints.find_value(value)
+    if found is not None:
+        return found[0]
+
+    n = round((math.log(value) + _LOG_SQRT5) / _LOG_PHI)
+    if _pair_at(n - 1)[1] != value:
+        return None
+    return n
 
 
 class Fibonacci:
     """Klasa implementira Fibonačijev niz i metode za istraživanje niza.
 
-    Ova klasa generalno nije pogodna za generalizaciju Fibonačijevog niza na
-    negativne indekse.  Za izračunavanje se koriste Pythonovi Decimal objekti
-    koji predstavljaju egzaktnu reprezentaciju realnih brojeva do veoma velike
-    preciznosti.  Alternativa, u nekim slučajevima, je bila korišćenje
-    matričnog računa, ali za to bi bilo neophodno koristiti NumPy biblioteku,
-    koja nije deo standardne biblioteke, što uvodi komplikaciju u pokretanju
-    ovakvog jednostavnog demo programa, a pritom su analitička rešenja poput
-    Bineove formule svakako manje prostorne i vremenske kompleksnosti
-    (izračunavanje n-tog broja pomoću matrične eksponencijacije ima `vremensku
-    O(log(n)) i prostornu O(log(n)) ili O(1)`__).  Tačnost rešenja dobijenih
-    aritmetikom pomoću Decimal objekata sa tačnošću od 300 decimalnih mesta su
-    proverena do F(500) (501. Fibonačijevog broja) u slučaju nalaženja
-    određenog broja Bineovom formulom.
+    Početna vrednost niza ne može biti negativna, ali se brojevi niza levo
+    od nule (negativni indeksi) mogu dobiti metodima ``nth`` i ``sequence``,
+    a niz koji počinje levo od nule pravi se metodom ``from_index``.
+    Određeni broj niza se izračunava tačno, celobrojnom
+    aritmetikom, metodom brzog udvostručavanja (*fast doubling*), koji je
+    ekvivalentan matričnoj eksponencijaciji ali bez NumPy biblioteke i
+    suvišnih množenja (`vremenska složenost O(log(n))`__ množenja velikih
+    celih brojeva).  Bineova formula sa Pythonovim Decimal objektima je
+    zadržana kao približan način izračunavanja, za slučajeve kada je
+    potreban samo red veličine broja ili njegove početne cifre; računa se u
+    lokalnom Decimal kontekstu čija preciznost zavisi od traženog broja
+    cifara, tako da ne zavisi od (niti menja) kontekst niti koja je poziva.
+    Izračunati parovi susednih brojeva se pamte u zajedničkom
+    kešu kontrolnih tačaka (``merifib.cache.checkpoints``), tako da se
+    ponovljeni i obližnji upiti nastavljaju od najbliže tačke, a brojevi
+    se mogu čitati i iz trajne tabele na disku (``merifib.table``).
+    Nizovi sa istom rekurencijom a drugim početnim vrednostima (npr.
+    Lukasov niz) i rekurencije višeg reda su u modulu
+    ``merifib.recurrence``, koji za Fibonačijeve koeficijente koristi iste
+    funkcije kao ova klasa.
 
     Atributi:
         length: Dužina željenog niza.
         seed: Početna vrednost niza.
+        index: Indeks početne vrednosti u nizu (od 0).
 
     Metode:
+        from_index: Pravi niz zadavanjem indeksa početne vrednosti.
         sequence: Vraća niz željene dužine počevši od zadatog broja u oba
             smera.
-        nth: Vraća broj na željenom mestu po redu u nizu (od 0).
+        iter_sequence: Vraća isti niz kao generator, u oba smera.
+        view: Vraća lenji pogled na niz, sa indeksiranjem i isecanjem.
+        nth: Vraća broj na željenom mestu po redu u nizu (od 0), tačno ili
+            približno.
         json: Vraća reprezentaciju niza u JSON formatu sa određenim dodatnim
             informacijama o nizu.
+        stats: Vraća samo dodatne informacije o nizu, bez generisanja niza.
+        iter_json: Vraća JSON reprezentaciju niza deo po deo.
+        write_json: Upisuje JSON reprezentaciju niza u fajl deo po deo.
+        write_binary: Upisuje niz u fajl u kompaktnom binarnom formatu.
+        nth_mod: Vraća ostatak broja na željenom mestu po modulu.
+        sequence_mod: Vraća niz ostataka brojeva niza po modulu.
+        stats_mod: Vraća dodatne informacije o nizu, sa zbirom po modulu.
+        sequence_array: Vraća niz kao NumPy niz.
+        sequence_parallel: Vraća niz, računajući ga u više procesa.
+        aiter_batches: Vraća asinhroni iterator niza u delovima.
+        sequence_mod_array: Vraća niz ostataka po modulu kao NumPy niz.
 
 
     .. __: https://sites.google.com/site/theagogs/fibonacci-number
@@ -49,9 +292,6 @@ class Fibonacci:
 
     D = decimal.Decimal  # Preimenujemo da bi skratili.
 
-    # Zlatni presek računamo kao Decimal objekat velike preciznosti.
-    _phi = (D(1) + D(5).sqrt()) / D(2)
-
     def __init__(self, length=None, seed=0):
         """Inicijalizuj instancu niza sa početnom vrednošću i dužinom.
 
@@ -75,25 +315,62 @@ class Fibonacci:
                 broj Fibonačijevog niza.  Takođe ukoliko je dužina niza 0.
 
         """
-        # Proveravamo da li je argument seed validan Fibonačijev broj pomoću
-        # svojstva da bar jedan od brojeva 5*seed^2 +/- 4 mora biti potpuni
-        # kvadrat.  Broj takođe mora biti nenegativan jer ne radimo sa
-        # generalizacijom na negativne brojeve.
-        D = decimal.Decimal
-        sq1 = D(5) * D(seed)**D(2) + D(4)
-        sq2 = D(5) * D(seed)**D(2) - D(4)
-
-        if (round(sq1.sqrt())**D(2) == sq1 or
-                round(sq2.sqrt())**D(2) == sq2) and seed >= 0:
-            self.seed = seed
-        else:
+        # Proveravamo da li je argument seed validan Fibonačijev broj tako što
+        # nalazimo njegov indeks u nizu.  Broj takođe mora biti nenegativan
+        # jer ne radimo sa generalizacijom na negativne brojeve.  Indeks
+        # pamtimo jer se iz njega dobija prethodni broj u nizu.
+        index = _fib_index(seed)
+        if index is None:
             raise ValueError("Broj ne pripada Fibonačijevom nizu.")
 
+        self.seed = seed
+        self.index = index
+
         if length == 0:
             raise ValueError("Dužina mora biti različita od 0.")
         else:
             self.length = length
 
+    @classmethod
+    def from_index(cls, index, length=None):
+        """Napravi niz koji počinje brojem F(index), bez zadavanja tog broja.
+
+        Za razliku od konstruktora, kome se zadaje početna vrednost, pa se
+        njen indeks traži i proverava, ovde se početna vrednost dobija jednim
+        skokom do indeksa (O(log(index)) množenja, a par susednih brojeva se
+        pamti u kešu kontrolnih tačaka, pa ga metodi niza ne računaju
+        ponovo).  Indeks može biti i negativan, a dužina ima isto značenje
+        kao u konstruktoru::
+
+            >>> Fibonacci.from_index(10, 5).sequence()
+            [55, 89, 144, 233, 377]
+            >>> Fibonacci.from_index(-6, -3).sequence()
+            [-21, 13, -8]
+            >>> f = Fibonacci.from_index(10**7, 1000)   # Bez provere broja.
+
+        Args:
+            index (int): Indeks početne vrednosti u nizu.
+            length (int or None): Dužina niza, različita od 0, ili None za
+                beskonačan niz.  Podrazumevana vrednost je None.
+
+        Returns:
+            Fibonacci: Niz sa početnom vrednošću F(index).
+
+        Raises:
+            ValueError: Ukoliko je dužina niza 0.
+
+        """
+        if length == 0:
+            raise ValueError("Dužina mora biti različita od 0.")
+
+        # Skok do para (F(index-1), F(index)), koji se pamti i koristi i
+        # za prethodni broj u metodu sequence.
+        fib = cls.__new__(cls)
+        fib.seed = _signed_pair(index - 1)[1]
+        fib.index = index
+        fib.length = length
+        return fib
+
     @staticmethod
     def _generator_seq(a, b):
         # Pomoćni metod, odnosno generator koji vraća beskonačni niz
@@ -149,19 +426,17 @@ class Fibonacci:
                 Fibonačijevih brojeva ukoliko nije inicijalizovana dužina.
 
         """
+        # Niz koji je ceo u priključenoj tabeli se samo čita iz nje.
+        stored = table.attached()
+        if stored is not None and self.length is not None:
+            window = stored.window(*self._bounds())
+            if window is not None:
+                return window
+
         # Potrebno je imati prethodni broj u nizu jer se ne kreće nužno od 0,
-        # pa ni nužno rastućim nizom.  Za brojeve veće od 1, on se dobija
-        # zaokruživanjem količnika početnog broja i zlatnog preseka budući da
-        # je phi limes količnika dva susedna Fibonačijeva broja.
-        if self.seed > 1:
-            prev = round(self.seed/Fibonacci._phi)
-        elif self.seed == 1:
-            prev = 0
-        elif self.seed == 0:
-            prev = 1  # Matematički netačno za osnovnu definiciju niza (međutim
-                      # tačno ako se uvode negativni indeksi), ali
-                      # omogućava tačno pokretanje sabiranja od nule bez
-                      # definisanja obe početne vrednosti.
+        # pa ni nužno rastućim nizom.  Dobija se tačno iz indeksa početne
+        # vrednosti, i za indekse levo od nule (za indeks 0 to je F(-1) = 1).
+        prev = _fib_signed(self.index - 1)
 
         a = self.seed
         b = self.seed + prev
@@ -182,34 +457,131 @@ class Fibonacci:
             for _ in range(self.length-2):
                 a, b = b, a + b
                 fseq.append(b)
-            return fseq
+            return self._remember(fseq)
 
         # Slučaj sa negativnim dužinama, tj. brojanjem unazad.  Slično kao u
         # slučaju sa length >= 2, s tim što za b umesto sledeće uzimamo
         # prethodnu (``prev``) vrednost, i umesto sabiranja oduzimamo.
+        # Brojeve dodajemo na kraj liste, pa listu na kraju obrćemo, što je
+        # linearne složenosti (ubacivanje na početak liste bi bilo
+        # kvadratne).
         elif self.length <= -2:
-            b = prev
-            fseq = [b, a]
+            fseq = list(itertools.islice(
+                Fibonacci._generator_seq_back(a, prev), -self.length))
+            fseq.reverse()
+            return self._remember(fseq)
+
+    def _remember(self, fseq):
+        # Pomoćni metod koji dopisuje izračunati niz u priključenu tabelu,
+        # ukoliko je otvorena za dopisivanje i niz je nastavlja.
+        #
+        # Argumenti:
+        #   fseq (list): Niz, kao što ga vraća metod sequence.
+        #
+        # Vraća:
+        #   list: Isti niz.
+        stored = table.attached()
+        if stored is not None and stored.writable:
+            # Tabela sadrži samo nenegativne indekse.
+            lo = self._bounds()[0]
+            stored.append(max(lo, 0), fseq[max(-lo, 0):])
+        return fseq
+
+    @staticmethod
+    def _generator_seq_back(a, b):
+        # Pomoćni generator, kao _generator_seq(), koji vraća beskonačni niz
+        # Fibonačijevih brojeva unazad, ka negativnim indeksima.
+        #
+        # Argumenti:
+        #   a (int): Prva vrednost niza.
+        #   b (int): Druga vrednost niza, tj. broj koji prethodi prvoj.
+        #
+        # Vraća:
+        #   int: Prethodni Fibonačijev broj u nizu.
+        while True:
+            yield a
+            a, b = b, a - b
+
+    def view(self):
+        """Vrati lenji pogled na niz (videti ``merifib.view``).
+
+        Pogled sadrži iste brojeve, istim redom, kao ``sequence()``, ali ih
+        ne računa unapred: podržava ``len``, indeksiranje i isecanje (skokom
+        do traženih brojeva, bez računanja brojeva ispred njih) i ponovljivu
+        iteraciju.  Za niz bez dužine pogled je beskonačan::
+
+            >>> v = Fibonacci(10**6, 13).view()
+            >>> len(v), v[2], v[-1] == Fibonacci.nth(10**6 + 7)
+            (1000000, 34, True)
+            >>> list(v[10:20:4])
+            [1597, 10946, 75025]
+
+        Returns:
+            merifib.view.SequenceView: Pogled na niz.
 
-            # Pošto je sada ``self.length`` negativan, neophodno je uzeti
-            # njegovu apsolutnu vrednost.
-            for _ in range(abs(self.length)-2):
-                a, b = b, a - b
+        """
+        from merifib.view import SequenceView
+
+        if self.length is None:
+            return SequenceView(self.index)
+        lo, hi = self._bounds()
+        return SequenceView(lo, hi - lo + 1)
+
+    def iter_sequence(self, reverse=False):
+        """Generiši Fibonačijev niz određene dužine, broj po broj.
+
+        Metod vraća generator istih brojeva, istim redom, koje vraća metod
+        ``sequence``, ali bez formiranja liste, i za nizove sa negativnom
+        dužinom.  Ukoliko je zadat argument ``reverse``, brojevi se vraćaju
+        obrnutim redom, a niz bez dužine je beskonačan niz unazad od početne
+        vrednosti, ka negativnim indeksima::
 
-                # insert metod liste je prihvatljiv u slučaju malih listi, što
-                # je ovde slučaj.  U suprotnom collections.deque iz standardne
-                # biblioteke pruža O(1) vremenske performanse za ubacivanje
-                # elementa na prvo mesto.
-                fseq.insert(0, b)
-            return fseq
+            >>> f = Fibonacci(length=-5, seed=5)
+            >>> list(f.iter_sequence())
+            [0, 1, 1, 2, 3, 5]
+            >>> list(f.iter_sequence(reverse=True))
+            [5, 3, 2, 1, 1]
+            >>> g = Fibonacci(seed=1).iter_sequence(reverse=True)
+            >>> [next(g) for _ in range(6)]
+            [1, 0, 1, -1, 2, -3]
+
+        Args:
+            reverse (bool): Ukoliko je tačno, brojevi se vraćaju obrnutim
+                redom.  Podrazumevana vrednost je False.
+
+        Returns:
+            generator: Brojevi niza.
+
+        """
+        if self.length is None:
+            if reverse:
+                return Fibonacci._generator_seq_back(
+                    self.seed, _fib_signed(self.index - 1))
+            return self.sequence()
+
+        if not reverse:
+            return self._iter_window()
+
+        lo, hi = self._bounds()
+        a, b = _signed_pair(hi - 1)
+        return itertools.islice(
+            Fibonacci._generator_seq_back(b, a), hi - lo + 1)
 
     @classmethod
-    def nth(cls, position):
+    def nth(cls, position, approximate=False, digits=None):
         """Vrati n-ti broj Fibonačijevog niza.
 
         Metod vraća n-ti broj Fibonačijevog niza po definiciji, od n_0 = 0.  S
-        obzirom da ovaj metod ne zavisi od instance, klasni je metod.  Pozicija
-        mora biti pozitivna vrednost.
+        obzirom da ovaj metod ne zavisi od instance, klasni je metod.  Pozicije
+        manje od 1 odgovaraju negativnim indeksima niza (negafibonači brojevi,
+        F(-n) = (-1)^(n+1) * F(n)), tako da je pozicija 0 broj F(-1), pozicija
+        -1 broj F(-2), itd.  Broj se izračunava tačno, metodom brzog
+        udvostručavanja, za bilo koju poziciju.  Ukoliko je zadat argument
+        ``approximate``, broj se umesto toga izračunava Bineovom formulom i
+        vraća kao Decimal objekat sa ``digits`` značajnih cifara (podrazumevano
+        sa svim ciframa broja, tj. tačno), što je za mali broj cifara
+        dovoljno za red veličine i početne cifre broja, a brže od tačnog
+        izračunavanja.
 
         Primer::
 
@@ -218,31 +590,188 @@ class Fibonacci:
             >>> f = Fibonacci(8)
             >>> f.nth(20)
             4181
+            >>> Fibonacci.nth(-7)
+            -21
+            >>> Fibonacci.nth(1000001, approximate=True, digits=20)
+            Decimal('1.9532821287077577316E+208987')
 
         Args:
             position (int): Redni broj željenog Fibonačijevog broja.  Pošto
                 indeks niza (n) počinje od 0 u definiciji, važi
                 position = n + 1.
+            approximate (bool): Ukoliko je tačno, broj se računa približno,
+                Bineovom formulom.  Podrazumevana vrednost je False.
+            digits (int or None): Broj značajnih cifara približnog
+                rezultata.  Podrazumevana vrednost je None, tj. sve cifre
+                broja.
 
         Returns:
-            int: Fibonačijev broj rednog broja zadatog argumentom position`
+            int or decimal.Decimal: Fibonačijev broj rednog broja zadatog
+                argumentom ``position``, kao tačan ceo broj, ili kao Decimal
+                objekat u slučaju približnog izračunavanja.
 
         Raises:
-            ValueError: Ukoliko je pozicija manja od 1, podiže se izuzetak.
+            ValueError: Ukoliko je zadat broj cifara manji od 1.
 
         """
-        if position <= 0:
-            raise ValueError("Pozicija mora biti pozitivna vrednost.")
-
-        D = decimal.Decimal
-
         # Indeks niza u definiciji i Bineovoj formuli, počinje od 0.
         n = position - 1
 
-        # Bineova formula za izračunavanje n-tog Fibonačijevog broja.
-        return round((cls._phi**D(n) - (-cls._phi)**D(-n)) / D(5).sqrt())
+        if approximate:
+            return cls._binet(n, digits)
+
+        return _fib_signed(n)
+
+    @classmethod
+    def nth_many(cls, positions):
+        """Vrati Fibonačijeve brojeve za više pozicija odjednom.
+
+        Metod je ekvivalentan pozivanju ``nth`` za svaku poziciju, ali deli
+        posao između pozicija: pozicije se sortiraju i uklanjaju se
+        duplikati, pa se do svake sledeće pozicije dolazi od prethodnog
+        rezultata, sabiranjem ako je blizu, a skokom brzim udvostručavanjem
+        ako je daleko.  Rezultati se vraćaju u redosledu zadatih pozicija::
+
+            >>> Fibonacci.nth_many([20, 1, 20, 10])
+            [4181, 0, 4181, 34]
+
+        Args:
+            positions (iterable): Redni brojevi željenih Fibonačijevih
+                brojeva, kao u metodu ``nth``.
+
+        Returns:
+            list: Fibonačijevi brojevi na zadatim pozicijama.
+
+        """
+        positions = list(positions)
+        results = dict(cls.iter_nth_many(positions))
+        return [results[position] for position in positions]
+
+    @classmethod
+    def iter_nth_many(cls, positions):
+        """Generiši Fibonačijeve brojeve za više pozicija, redom rastućih
+        pozicija.
+
+        Varijanta metoda ``nth_many`` koja vraća generator parova
+        ``(pozicija, broj)`` čim je pojedinačni broj izračunat, bez čekanja
+        na ostale.  Parovi se dobijaju u rastućem redosledu pozicija, a svaka
+        pozicija samo jednom::
+
+            >>> list(Fibonacci.iter_nth_many([20, 1, 20, 10]))
+            [(1, 0), (10, 34), (20, 4181)]
+
+        Args:
+            positions (iterable): Redni brojevi željenih Fibonačijevih
+                brojeva, kao u metodu ``nth``.
+
+        Returns:
+            generator: Parovi ``(pozicija, broj)``.
+
+        """
+        return cls._generator_many(sorted(set(positions)))
+
+    @staticmethod
+    def _generator_many(ordered):
+        # Pomoćni generator za iter_nth_many().  Pamti poslednji izračunati
+        # par (F(k), F(k+1)) i od njega dolazi do sledećeg traženog indeksa.
+        #
+        # Argumenti:
+        #   ordered (list): Sortirane pozicije bez duplikata.
+        #
+        # Vraća:
+        #   tuple: Par (pozicija, broj).
+        k = 0
+        pair = (0, 1)
+
+        # Ukoliko ima negativnih indeksa, polazimo od najmanjeg, a inače od
+        # najbliže kontrolne tačke ispred prve tražene pozicije, ukoliko
+        # postoji.
+        if ordered and ordered[0] <= 0:
+            k = ordered[0] - 1
+            pair = _signed_pair(k)
+        elif ordered and ordered[0] > _CACHE_MIN_INDEX:
+            found = checkpoints.nearest(ordered[0] - 1)
+            if found is not None:
+                k, pair = found
+
+        for position in ordered:
+            n = position - 1
+            gap = n - k
+            if gap <= _STEP_LIMIT:
+                a, b = pair
+                for _ in range(gap):
+                    a, b = b, a + b
+                pair = (a, b)
+            else:
+                pair = _fib_add(pair, _fib_pair(gap))
+            k = n
+            yield position, pair[0]
+
+        if k >= _CACHE_MIN_INDEX:
+            checkpoints.put(k, pair)
 
-    def json(self):
+    @classmethod
+    def nth_mod(cls, position, m):
+        """Vrati ostatak n-tog broja Fibonačijevog niza po modulu m.
+
+        Metod je ekvivalentan izrazu ``Fibonacci.nth(position) % m``, ali se
+        broj nikada ne izračunava ceo, već samo njegov ostatak (videti modul
+        ``merifib.modular``), tako da su svi međurezultati manji od m::
+
+            >>> Fibonacci.nth_mod(10**18 + 1, 1000)
+            875
+
+        Args:
+            position (int): Redni broj željenog Fibonačijevog broja, kao u
+                metodu ``nth``.
+            m (int): Modul, pozitivan ceo broj.
+
+        Returns:
+            int: Ostatak, između 0 i m-1.
+
+        Raises:
+            ValueError: Ukoliko modul nije pozitivan.
+
+        """
+        return modular.fib_mod(position - 1, m)
+
+    @classmethod
+    def _binet(cls, n, digits=None):
+        # Pomoćni metod koji približno izračunava n-ti Fibonačijev broj
+        # Bineovom formulom F(n) = (phi^n - (-phi)^(-n)) / sqrt(5).  Računa
+        # se u lokalnom kontekstu sa preciznošću od digits cifara i
+        # dodatnim ciframa zaštite, a rezultat se zaokružuje na digits
+        # značajnih cifara.  Broj F(n) ima oko |n|*log10(phi) cifara, pa je
+        # za podrazumevani broj cifara rezultat tačan ceo broj.
+        #
+        # Argumenti:
+        #   n (int): Indeks niza.
+        #   digits (int or None): Broj značajnih cifara rezultata, ili None
+        #       za sve cifre broja F(n).
+        #
+        # Vraća:
+        #   decimal.Decimal: Približna vrednost broja F(n).
+        if digits is not None and digits < 1:
+            raise ValueError("Broj cifara mora biti pozitivan.")
+        D = decimal.Decimal
+        if n == 0:
+            return D(0)
+        if digits is None:
+            digits = int(abs(n) * _LOG10_PHI - _LOG_SQRT5 / math.log(10)) + 1
+        prec = digits + len(str(abs(n))) + _GUARD_DIGITS
+
+        # Podrazumevani opseg eksponenta (do 10^999999) nije dovoljan za
+        # brojeve od više od milion cifara.
+        context = decimal.Context(prec=prec, Emax=decimal.MAX_EMAX,
+                                  Emin=decimal.MIN_EMIN)
+        with decimal.localcontext(context):
+            power = _phi(prec) ** n
+            # (-phi)^(-n) = (-1)^n / phi^n, bez još jednog stepenovanja.
+            result = (power - (-1 if n % 2 else 1) / power) / D(5).sqrt()
+        context.prec = digits
+        return context.plus(result)
+
+    def json(self, encoding="decimal"):
         """Vrati JSON reprezentaciju niza sa dodatnim informacijama.
 
         Metod vraća traženi Fibonačijev niz u JSON formatu, sa zbirom svih
@@ -253,6 +782,20 @@ class Fibonacci:
             >>> f.json()
             '{"sequence": [0, 1, 1, 2, 3, 5, 8, 13, 21, 34], "sum": 88, "evens": 4, "odds": 6}'
 
+        Brojevi se zapisuju decimalno, bez obzira na broj cifara (Pythonova
+        funkcija ``json.dumps`` ne može da zapiše brojeve od više od 4300
+        cifara, videti modul ``merifib.formatting``).  Opciono se brojevi i
+        zbir mogu zapisati kao JSON stringovi u heksadecimalnom ili base64
+        zapisu, čija je konverzija brža za velike brojeve::
+
+            >>> print(Fibonacci(2, 13).json(encoding="hex"))
+            {"sequence": ["0xd", "0x15"], "sum": "0x22", "evens": 0, "odds": 2}
+
+        Args:
+            encoding (str): Zapis brojeva: ``"decimal"`` (podrazumevano),
+                ``"hex"`` ili ``"base64"`` (videti
+                ``merifib.formatting.encode``).
+
         Returns:
             str: JSON objekat sa nizom (JSON array celih brojeva), zbirom
                 brojeva u nizu, brojem parnih i neparnih brojeva u nizu:
@@ -261,7 +804,8 @@ class Fibonacci:
 
         Raises:
             ValueError: Ukoliko je dužina niza nije definisana, tj. ukoliko je
-                ``None``, podiže ValueError izuzetak.
+                ``None``, podiže ValueError izuzetak.  Takođe ukoliko zapis
+                brojeva nije podržan.
 
         """
         # Pošto self.sequence() vraća generator u slučaju da nije definisana
@@ -270,27 +814,408 @@ class Fibonacci:
         if self.length is None:
             raise ValueError("Niz mora imati dužinu.")
 
-        seq = self.sequence()   # Traženi niz brojeva.
-        seq_sum = sum(seq)      # Zbir svih brojeva u nizu.
-
-        # Broj parnih brojeva u nizu.  Izračunat kao dužina liste brojeva iz
-        # niza deljivih sa 2.  Lista je dobijena filtriranjem pomoću anonimne
-        # funkcije koja ispituje vrednost ostatka celobrojnog deljenja.  Drugo
-        # rešenje bi mogla biti for petlja kroz niz i uvećanje brojača za 1
-        # svaki put kada tekuća vrednost iz niza zadovoljava isti uslov.
-        evens = len(list(filter(lambda x: x % 2 == 0, seq)))
-
-        # Broj neparnih brojeva, razlika dužine niza i broja parnih brojeva u
-        # nizu.
-        odds = len(seq) - evens
-
-        # Formiramo dictionary koji odgovara traženom JSON objektu i vraćamo
-        # ispravno formatiran JSON objekat kao string.
-        return json.dumps(
-            {
-                "sequence": seq,
-                "sum": seq_sum,
-                "evens": evens,
-                "odds": odds
-            }
-        )
+        # Dokument se sastavlja istim generatorom kao u metodu iter_json, u
+        # jednom delu.  Zbir i broj parnih i neparnih brojeva se ne računaju
+        # prolaskom kroz niz, već iz granica niza (videti metod stats).
+        return "".join(self._generator_json(math.inf, encoding))
+
+    def _bounds(self):
+        # Pomoćni metod koji vraća indekse prvog i poslednjeg broja u nizu
+        # konačne dužine, onim redom kojim ih vraća metod sequence.
+        #
+        # Vraća:
+        #   tuple: Par (najmanji indeks, najveći indeks).
+        if self.length >= 1:
+            return self.index, self.index + self.length - 1
+        return self.index + self.length + 1, self.index
+
+    def stats(self):
+        """Vrati zbir i broj parnih i neparnih brojeva u nizu, bez generisanja
+        niza.
+
+        Metod vraća iste dodatne informacije o nizu kao metod ``json``, ali
+        ih izračunava u vremenu O(log(n)) samo iz granica niza, tako da se
+        mogu dobiti i za nizove od više miliona brojeva::
+
+            >>> f = Fibonacci(10)
+            >>> f.stats()
+            {'sum': 88, 'evens': 4, 'odds': 6}
+
+        Zbir brojeva od F(i) do F(j) je F(j+2) - F(i+1), što važi i za
+        negativne indekse, a F(k) je paran ako i samo ako je k deljivo sa 3,
+        pa se parni brojevi prebrojavaju kao umnošci broja 3 između granica.
+
+        Returns:
+            dict: Zbir brojeva u nizu (``sum``), broj parnih (``evens``) i
+                broj neparnih brojeva (``odds``).
+
+        Raises:
+            ValueError: Ukoliko je dužina niza nije definisana, tj. ukoliko je
+                ``None``, podiže ValueError izuzetak.
+
+        """
+        if self.length is None:
+            raise ValueError("Niz mora imati dužinu.")
+
+        lo, hi = self._bounds()
+
+        # Broj umnožaka broja 3 u intervalu [lo, hi].  Celobrojno deljenje u
+        # Pythonu zaokružuje naniže i za negativne brojeve, pa formula važi
+        # i levo od nule.
+        evens = hi//3 - (lo - 1)//3
+
+        return {
+            "sum": _fib_signed(hi + 2) - _fib_signed(lo + 1),
+            "evens": evens,
+            "odds": hi - lo + 1 - evens
+        }
+
+    def _iter_window(self):
+        # Pomoćni metod koji vraća generator brojeva niza konačne dužine,
+        # istim redom kao metod sequence, ali bez formiranja liste.  Niz se
+        # uvek generiše sabiranjem od najmanjeg indeksa, do kog se dolazi
+        # skokom.
+        #
+        # Vraća:
+        #   generator: Brojevi niza.
+        lo, hi = self._bounds()
+        a, b = _signed_pair(lo)
+        return itertools.islice(Fibonacci._generator_seq(a, b), hi - lo + 1)
+
+    def iter_json(self, chunk_size=65536, binary=False, encoding="decimal"):
+        """Generiši JSON reprezentaciju niza deo po deo.
+
+        Metod daje isti JSON dokument kao metod ``json``, karakter za
+        karakter, ali u delovima približne dužine ``chunk_size``, tako da
+        je u memoriji istovremeno samo tekući deo i tekući broj niza, a ne
+        ceo niz i ceo string::
+
+            >>> f = Fibonacci(10)
+            >>> "".join(f.iter_json()) == f.json()
+            True
+
+        Args:
+            chunk_size (int): Najmanja dužina delova (osim poslednjeg), u
+                karakterima.  Podrazumevano 65536.
+            binary (bool): Ukoliko je tačno, delovi su ``bytes`` objekti
+                umesto stringova.  Podrazumevana vrednost je False.
+            encoding (str): Zapis brojeva, kao u metodu ``json``.
+
+        Returns:
+            generator: Delovi JSON dokumenta kao ``str`` ili ``bytes``.
+
+        Raises:
+            ValueError: Ukoliko je dužina niza nije definisana, tj. ukoliko je
+                ``None``, podiže ValueError izuzetak.  Takođe ukoliko zapis
+                brojeva nije podržan.
+
+        """
+        # Proveravamo odmah, a ne tek u generatoru, da bi se greška prijavila
+        # na mestu poziva.
+        if self.length is None:
+            raise ValueError("Niz mora imati dužinu.")
+        if encoding not in formatting.ENCODINGS:
+            raise ValueError("Nepoznato kodiranje: {}.".format(encoding))
+
+        chunks = self._generator_json(chunk_size, encoding)
+        if binary:
+            return (chunk.encode("ascii") for chunk in chunks)
+        return chunks
+
+    def _generator_json(self, chunk_size, encoding="decimal"):
+        # Pomoćni generator za iter_json() i json().  Delove dokumenta
+        # skuplja u listu dok njihova ukupna dužina ne pređe chunk_size.
+        # Formatiranje prati podrazumevane separatore funkcije json.dumps(),
+        # a brojevi se zapisuju funkcijom formatting.encode(), kao JSON
+        # brojevi (decimalno) ili kao JSON stringovi (ostali zapisi).
+        #
+        # Argumenti:
+        #   chunk_size (int): Najmanja dužina delova.
+        #   encoding (str): Zapis brojeva.
+        #
+        # Vraća:
+        #   str: Sledeći deo JSON dokumenta.
+        if encoding == "decimal":
+            encode = formatting.to_str
+        else:
+            def encode(number):
+                return '"' + formatting.encode(number, encoding) + '"'
+
+        parts = ['{"sequence": [']
+        size = len(parts[0])
+
+        for i, number in enumerate(self._iter_window()):
+            part = encode(number) if i == 0 else ", " + encode(number)
+            parts.append(part)
+            size += len(part)
+            if size >= chunk_size:
+                yield "".join(parts)
+                parts = []
+                size = 0
+
+        # Zbir i broj parnih i neparnih brojeva se izračunavaju iz granica
+        # niza, tako da nije potrebno sabirati brojeve u prolazu.
+        stats = self.stats()
+        parts.append('], "sum": {}, "evens": {}, "odds": {}}}'.format(
+            encode(stats["sum"]), stats["evens"], stats["odds"]))
+        yield "".join(parts)
+
+    def write_json(self, target, buffer_size=65536, encoding="decimal"):
+        """Upiši JSON reprezentaciju niza u fajl, deo po deo.
+
+        Metod upisuje isti JSON dokument kao metod ``json``, ali bez
+        formiranja celog niza i celog stringa u memoriji (videti metod
+        ``iter_json``).  Cilj može biti fajl objekat otvoren za pisanje
+        (tekstualni ili binarni), ili putanja do fajla na disku::
+
+            >>> f = Fibonacci(10**5)
+            >>> f.write_json("niz.json", buffer_size=2**20)
+
+        Args:
+            target (file or str or os.PathLike): Fajl objekat ili putanja.
+            buffer_size (int): Veličina delova i bafera za pisanje, u
+                bajtovima.  Podrazumevano 65536.
+            encoding (str): Zapis brojeva, kao u metodu ``json``.
+
+        Raises:
+            ValueError: Ukoliko je dužina niza nije definisana, tj. ukoliko je
+                ``None``, podiže ValueError izuzetak.  Takođe ukoliko zapis
+                brojeva nije podržan.
+
+        """
+        if isinstance(target, (str, os.PathLike)):
+            chunks = self.iter_json(buffer_size, binary=True,
+                                    encoding=encoding)
+            with open(target, "wb", buffering=buffer_size) as f:
+                for chunk in chunks:
+                    f.write(chunk)
+            return
+
+        # Binarni fajl objekti ne nasleđuju io.TextIOBase, pa za njih
+        # zadajemo bytes delove.
+        binary = not isinstance(target, io.TextIOBase)
+        for chunk in self.iter_json(buffer_size, binary=binary,
+                                    encoding=encoding):
+            target.write(chunk)
+
+    def write_binary(self, target, reverse=False):
+        """Upiši niz u kompaktnom binarnom formatu, broj po broj.
+
+        Binarni format (videti modul ``merifib.binary``) sadrži apsolutne
+        vrednosti brojeva kao bajtove i indeks pomeraja, tako da je manji od
+        JSON zapisa, ne zahteva konverziju u decimalni zapis, i može se
+        čitati bez parsiranja (``merifib.binary.SequenceFile``)::
+
+            >>> Fibonacci(10**5).write_binary("niz.bin")
+
+        Args:
+            target (file or str or os.PathLike): Binarni fajl objekat ili
+                putanja.
+            reverse (bool): Ukoliko je tačno, brojevi se upisuju obrnutim
+                redom.  Podrazumevana vrednost je False.
+
+        Raises:
+            ValueError: Ukoliko je dužina niza nije definisana, tj. ukoliko je
+                ``None``, podiže ValueError izuzetak.
+
+        """
+        from merifib import binary
+        binary.write(self, target, reverse)
+
+    def sequence_mod(self, m):
+        """Generiši niz ostataka brojeva niza po modulu m.
+
+        Metod vraća isto što i ``[x % m for x in self.sequence()]``, odnosno
+        odgovarajući beskonačni generator ako dužina niza nije definisana,
+        ali bez izračunavanja samih brojeva niza::
+
+            >>> f = Fibonacci(10, 13)
+            >>> f.sequence_mod(10)
+            [3, 1, 4, 5, 9, 4, 3, 7, 0, 7]
+
+        Args:
+            m (int): Modul, pozitivan ceo broj.
+
+        Returns:
+            list or generator: Ostaci brojeva niza, kao lista, ili generator
+                ukoliko nije inicijalizovana dužina.
+
+        Raises:
+            ValueError: Ukoliko modul nije pozitivan.
+
+        """
+        if self.length is None:
+            return modular.iter_mod(self.index, m)
+
+        lo, hi = self._bounds()
+        return list(itertools.islice(modular.iter_mod(lo, m), hi - lo + 1))
+
+    def stats_mod(self, m):
+        """Vrati zbir po modulu m i broj parnih i neparnih brojeva u nizu.
+
+        Metod je ekvivalentan metodu ``stats``, s tim što je zbir brojeva
+        niza dat po modulu m, i izračunava se bez velikih brojeva::
+
+            >>> f = Fibonacci(10)
+            >>> f.stats_mod(7)
+            {'sum': 4, 'evens': 4, 'odds': 6}
+
+        Args:
+            m (int): Modul, pozitivan ceo broj.
+
+        Returns:
+            dict: Zbir brojeva u nizu po modulu m (``sum``), broj parnih
+                (``evens``) i broj neparnih brojeva (``odds``).
+
+        Raises:
+            ValueError: Ukoliko je dužina niza nije definisana, ili ukoliko
+                modul nije pozitivan.
+
+        """
+        if self.length is None:
+            raise ValueError("Niz mora imati dužinu.")
+
+        lo, hi = self._bounds()
+        evens = hi//3 - (lo - 1)//3
+        total = modular.fib_mod(hi + 2, m) - modular.fib_mod(lo + 1, m)
+
+        return {
+            "sum": total % m,
+            "evens": evens,
+            "odds": hi - lo + 1 - evens
+        }
+
+    def sequence_array(self, dtype=None):
+        """Vrati niz konačne dužine kao NumPy niz.
+
+        Metod vraća iste brojeve kao metod ``sequence``, u obliku NumPy niza
+        tipa ``int64`` ili ``uint64``, za nizove čiji brojevi staju u 64 bita
+        (do F(92), odnosno F(93)).  NumPy nije neophodan za ostatak klase,
+        pa se uvozi tek u ovom metodu (videti ``merifib.arrays``)::
+
+            >>> Fibonacci(5, 8).sequence_array()
+            array([ 8, 13, 21, 34, 55])
+
+        Args:
+            dtype: NumPy tip elemenata niza.  Podrazumevano None (automatski
+                izbor između ``int64`` i ``uint64``).  Eksplicitno zadat
+                ``object`` tip dozvoljava i veće brojeve.
+
+        Returns:
+            numpy.ndarray: Brojevi niza.
+
+        Raises:
+            ImportError: Ukoliko NumPy nije instaliran.
+            ValueError: Ukoliko dužina niza nije definisana.
+            OverflowError: Ukoliko brojevi ne staju u zadati tip.
+
+        """
+        from merifib import arrays
+        return arrays.sequence_array(self, dtype)
+
+    def sequence_mod_array(self, m):
+        """Vrati niz ostataka po modulu m kao NumPy niz tipa ``uint64``.
+
+        Metod vraća iste ostatke kao metod ``sequence_mod``, a za manje
+        module ih dobija vektorski iz tabele Pisanovog perioda (videti
+        ``merifib.arrays``)::
+
+            >>> Fibonacci(5, 8).sequence_mod_array(10)
+            array([8, 3, 1, 4, 5], dtype=uint64)
+
+        Args:
+            m (int): Modul, između 1 i 2^64.
+
+        Returns:
+            numpy.ndarray: Ostaci brojeva niza.
+
+        Raises:
+            ImportError: Ukoliko NumPy nije instaliran.
+            ValueError: Ukoliko dužina niza nije definisana, ili ukoliko
+                modul nije pozitivan.
+            OverflowError: Ukoliko je modul veći od 2^64.
+
+        """
+        from merifib import arrays
+        return arrays.sequence_mod_array(self, m)
+
+    def aiter_batches(self, batch_size=None, queue_size=None, executor=None):
+        """Vrati asinhroni iterator niza u delovima (videti ``merifib.aio``).
+
+        Delovi su liste uzastopnih brojeva, istim redom kao u metodu
+        ``iter_sequence``; niz bez dužine je beskonačan.  Delove računa
+        pozadinski zadatak petlje događaja, najviše ``queue_size`` delova
+        unapred, a delove sa velikim brojevima računa u izvršiocu, tako da
+        se petlja ne blokira.  Iteracija se može prekinuti i kasnije
+        nastaviti od stanja ``checkpoint`` iteratora::
+
+            >>> async def main():
+            ...     batches = Fibonacci(10**6).aiter_batches(batch_size=5000)
+            ...     async for batch in batches:
+            ...         await consume(batch)
+
+        Args:
+            batch_size (int or None): Broj brojeva u jednom delu.
+                Podrazumevano None, tj. ``merifib.aio.BATCH_SIZE``.
+            queue_size (int or None): Najveći broj gotovih delova koji
+                čekaju.  Podrazumevano None, tj. ``merifib.aio.QUEUE_SIZE``.
+            executor (concurrent.futures.Executor or None): Izvršilac za
+                delove sa velikim brojevima.  Podrazumevano None, tj.
+                podrazumevani izvršilac petlje događaja.
+
+        Returns:
+            merifib.aio.AsyncBatches: Asinhroni iterator delova.
+
+        Raises:
+            ValueError: Ukoliko veličina dela ili reda nije pozitivna.
+
+        """
+        from merifib import aio
+
+        if batch_size is None:
+            batch_size = aio.BATCH_SIZE
+        if queue_size is None:
+            queue_size = aio.QUEUE_SIZE
+
+        if self.length is None:
+            start, count = self.index, None
+        else:
+            start, hi = self._bounds()
+            count = hi - start + 1
+        return aio.AsyncBatches(aio.Checkpoint.at(start), count, batch_size,
+                                queue_size, executor)
+
+    def sequence_parallel(self, workers=None, chunk_size=None):
+        """Generiši Fibonačijev niz određene dužine u više procesa.
+
+        Metod vraća isto što i metod ``sequence``, ali niz deli na delove
+        koje nezavisno računa više procesa, od kojih svaki skokom dolazi do
+        početka svog dela (videti ``merifib.parallel``).  Niz bez dužine se
+        vraća kao beskonačni generator, čiji se delovi računaju unapred::
+
+            >>> f = Fibonacci(10**6)
+            >>> seq = f.sequence_parallel(workers=8, chunk_size=50000)
+
+        Args:
+            workers (int or None): Broj procesa.  Podrazumevano None, tj.
+                broj procesora.
+            chunk_size (int or None): Broj brojeva niza u jednom delu.
+                Podrazumevano None, tj. ``merifib.parallel.CHUNK_SIZE``.
+
+        Returns:
+            list or generator: Niz željene dužine, kao lista, ili generator
+                Fibonačijevih brojeva ukoliko nije inicijalizovana dužina.
+
+        Raises:
+            ValueError: Ukoliko veličina dela ili broj procesa nije
+                pozitivan.
+
+        """
+        from merifib import parallel
+
+        if chunk_size is None:
+            chunk_size = parallel.CHUNK_SIZE
+
+        if self.length is None:
+            return parallel.iter_parallel(self, workers, chunk_size)
+        return parallel.sequence(self, workers, chunk_size)
@@ -0,0 +1,162 @@
+"""Modul implementira formatiranje velikih celih brojeva za ispis.
+
+Python od verzije 3.11 ne dozvoljava konverziju celih brojeva od više od
+4300 cifara (ili drugog ograničenja zadatog sa ``sys.set_int_max_str_digits``)
+u string pomoću ``str``, a i ispod tog ograničenja je konverzija kvadratne
+složenosti.  Funkcije ovog modula rade za brojeve proizvoljne veličine, bez
+menjanja globalnog ograničenja: veliki brojevi se konvertuju metodom podeli
+pa vladaj preko ``decimal`` modula, čije je množenje velikih brojeva brže od
+kvadratnog, tako da konverzija broja od milion cifara traje delove sekunde
+umesto desetina sekundi.
+
+Pored decimalnog zapisa podržani su i heksadecimalni zapis i base64 zapis
+bajtova broja (videti ``encode``), čija je konverzija linearne složenosti.
+
+"""
+
+import base64
+import decimal
+import functools
+import math
+import sys
+
+
+# Brojevi sa više bitova od ovoga imaju više od 4300 cifara, koliko Python
+# podrazumevano najviše dozvoljava da se konvertuje u string.  Brojevi do ove
+# veličine se konvertuju pomoću str, a veći metodom podeli pa vladaj.
+_STR_BITS = 14000
+
+# Brojevi do ovoliko bitova se u decimal.Decimal konvertuju direktno.
+_DECIMAL_BITS = 128
+
+# Kontekst u kom su operacije sa decimal.Decimal objektima tačne.
+_EXACT = decimal.Context(prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX,
+                         Emin=decimal.MIN_EMIN, traps=[decimal.Inexact])
+
+# Podržani zapisi brojeva (videti encode).
+ENCODINGS = ("decimal", "hex", "base64")
+
+
+@functools.lru_cache(maxsize=64)
+def _pow10(k):
+    # Keširani stepeni broja 10, za skraćivanje velikih brojeva.
+    return 10**k
+
+
+def digit_count(n):
+    """Vrati broj decimalnih cifara celog broja (bez znaka)."""
+    n = abs(n)
+    if n.bit_length() <= _str_bits():
+        return len(str(n))
+
+    # Procena iz broja bitova je tačna ili za jedan veća.
+    d = int(n.bit_length() * math.log10(2)) + 1
+    if n < _pow10(d - 1):
+        d -= 1
+    return d
+
+
+def _str_bits():
+    # Pomoćna funkcija koja vraća najveći broj bitova broja koji se
+    # konvertuje pomoću str, uzimajući u obzir trenutno ograničenje broja
+    # cifara (sys.get_int_max_str_digits, 0 znači bez ograničenja).
+    limit = sys.get_int_max_str_digits()
+    if limit == 0:
+        return _STR_BITS
+    return min(_STR_BITS, int((limit - 1) / math.log10(2)))
+
+
+@functools.lru_cache(maxsize=64)
+def _pow2(k):
+    # Keširani stepeni 2^(2^k) kao decimal.Decimal objekti.  Poziva se samo
+    # u kontekstu _EXACT.
+    if 2**k <= _DECIMAL_BITS:
+        return decimal.Decimal(2**2**k)
+    p = _pow2(k - 1)
+    return p * p
+
+
+def _to_decimal(n, bits):
+    # Pomoćna funkcija koja konvertuje nenegativan ceo broj od najviše bits
+    # bitova u decimal.Decimal, deljenjem na gornje i donje bitove:
+    # n = hi * 2^w + lo, gde je w najveći stepen dvojke manji od bits, tako
+    # da se koriste samo keširani stepeni 2^(2^k).  Poziva se u kontekstu
+    # _EXACT.
+    if bits <= _DECIMAL_BITS:
+        return decimal.Decimal(n)
+    k = (bits - 1).bit_length() - 1
+    w = 1 << k
+    hi = n >> w
+    lo = n - (hi << w)
+    return _to_decimal(lo, w) + _to_decimal(hi, bits - w) * _pow2(k)
+
+
+def to_str(n):
+    """Vrati decimalni zapis celog broja proizvoljne veličine.
+
+    Za razliku od ``str``, radi i za brojeve od više od 4300 cifara, i
+    složenost je manja od kvadratne (videti opis modula).
+
+    """
+    bits = n.bit_length()
+    if bits <= _str_bits():
+        return str(n)
+
+    with decimal.localcontext(_EXACT):
+        text = str(_to_decimal(abs(n), bits))
+    return "-" + text if n < 0 else text
+
+
+def to_bytes(n):
+    """Vrati bajtove celog broja u komplementu dvojke, big-endian, u
+    najmanjem broju bajtova (kao ``BigInteger.toByteArray`` u Javi)."""
+    # Za negativan broj je potreban isti broj bitova kao za -n - 1 (npr.
+    # -128 staje u jedan bajt), plus bit znaka.
+    return n.to_bytes(((n + (n < 0)).bit_length() + 8) // 8, "big",
+                      signed=True)
+
+
+def encode(n, encoding="decimal"):
+    """Vrati zapis celog broja u zadatom kodiranju.
+
+    Args:
+        n (int): Ceo broj.
+        encoding (str): ``"decimal"`` (decimalni zapis, ``to_str``),
+            ``"hex"`` (heksadecimalni zapis sa prefiksom ``0x``, kao
+            ``hex``), ili ``"base64"`` (base64 zapis bajtova ``to_bytes``).
+
+    Returns:
+        str: Zapis broja.
+
+    Raises:
+        ValueError: Ukoliko kodiranje nije podržano.
+
+    """
+    if encoding == "decimal":
+        return to_str(n)
+    if encoding == "hex":
+        return hex(n)
+    if encoding == "base64":
+        return base64.b64encode(to_bytes(n)).decode("ascii")
+    raise ValueError("Nepoznato kodiranje: {}.".format(encoding))
+
+
+def format_number(n, digits):
+    """Vrati decimalni zapis broja skraćen na najviše ``digits`` cifara.
+
+    Skraćeni zapis sadrži početne i krajnje cifre broja i ukupan broj
+    cifara, npr. ``19532821287…(208988 cifara)…8242546875``.  Ceo broj se
+    nikada ne konvertuje u string.
+
+    """
+    d = digit_count(n)
+    if d <= digits:
+        return to_str(n)
+
+    head = digits - digits // 2
+    tail = digits // 2
+    sign = "-" if n < 0 else ""
+    n = abs(n)
+    lead = to_str(n // _pow10(d - head))
+    trail = to_str(n % _pow10(tail)).zfill(tail) if tail else ""
+    return "{}{}…({} cifara)…{}".format(sign, lead, d, trail)
@@ -0,0 +1,219 @@
+"""Modul implementira opcionu instrumentaciju metoda klase ``Fibonacci``.
+
+Instrumentacija je podrazumevano isključena i tada ne utiče na performanse:
+metodi klase se ne menjaju.  Uključivanjem (``metrics.enable()``) metodi
+klase se zamenjuju omotačima koji mere broj poziva (i onih koji su
+podigli izuzetak), ukupno i najveće vreme izvršavanja i veličinu rezultata,
+a isključivanjem se vraćaju originalni metodi::
+
+    >>> from merifib.instrument import metrics
+    >>> metrics.enable()
+    >>> x = Fibonacci.nth(1000)
+    >>> metrics.snapshot()["methods"]["nth"]["calls"]
+    1
+    >>> metrics.disable()
+
+Za prosleđivanje merenja drugom sistemu mogu se registrovati funkcije koje
+se pozivaju posle svakog instrumentovanog poziva (``metrics.add_hook``).
+
+"""
+
+import functools
+import math
+import threading
+import time
+import warnings
+
+from merifib import modular
+from merifib.cache import checkpoints
+from merifib.fibonacci import Fibonacci
+
+
+# Metodi koji se instrumentuju.  Generatori (iter_*) nisu uključeni, jer bi
+# se merilo samo njihovo pravljenje, a ne generisanje.  Vreme metoda koji
+# pozivaju druge instrumentovane metode (npr. json poziva stats) uključuje
+# i vreme tih poziva.
+METHODS = (
+    "__init__", "from_index", "sequence", "nth", "nth_many", "nth_mod",
+    "_binet", "json", "stats", "write_json", "sequence_mod", "stats_mod",
+)
+
+_LOG10_2 = math.log10(2)
+
+
+def result_size(result):
+    """Vrati veličinu rezultata metoda.
+
+    Za ceo broj to je broj decimalnih cifara, procenjen iz broja bitova
+    (može biti za jedan veći od tačnog), za listu brojeva broj cifara
+    najvećeg broja po apsolutnoj vrednosti (prvog ili poslednjeg, budući da
+    |F(k)| raste sa |k|), a za string broj karaktera.  Za ostale rezultate
+    vraća None.
+
+    """
+    if isinstance(result, list):
+        if not result or not isinstance(result[0], int):
+            return None
+        result = max(abs(result[0]), abs(result[-1]))
+    if isinstance(result, int):
+        # Procena iz broja bitova, bez konverzije u string.
+        return int(abs(result).bit_length() * _LOG10_2) + 1
+    if isinstance(result, str):
+        return len(result)
+    return None
+
+
+class Instrumentation:
+    """Merenje poziva metoda jedne klase.
+
+    Atributi:
+        cls: Klasa čiji se metodi instrumentuju.
+        methods: Imena metoda koji se instrumentuju.
+
+    Metode:
+        enable: Uključi instrumentaciju.
+        disable: Isključi instrumentaciju.
+        snapshot: Trenutna merenja i statistika keševa kao dict.
+        reset: Obriši merenja.
+        add_hook: Registruj funkciju koja se poziva posle svakog poziva.
+        remove_hook: Ukloni registrovanu funkciju.
+
+    """
+
+    def __init__(self, cls=Fibonacci, methods=METHODS):
+        self.cls = cls
+        self.methods = methods
+        self._originals = {}    # ime -> originalni atribut klase
+        self._stats = {}        # ime -> dict merenja
+        self._hooks = []
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        """Da li je instrumentacija uključena."""
+        return bool(self._originals)
+
+    def enable(self):
+        """Uključi instrumentaciju, zamenom metoda klase omotačima."""
+        with self._lock:
+            if self._originals:
+                return
+            for name in self.methods:
+                original = self.cls.__dict__[name]
+                self._originals[name] = original
+                setattr(self.cls, name, self._wrap(name, original))
+
+    def disable(self):
+        """Isključi instrumentaciju i vrati originalne metode klase.
+
+        Merenja se ne brišu (videti ``reset``).
+
+        """
+        with self._lock:
+            for name, original in self._originals.items():
+                setattr(self.cls, name, original)
+            self._originals = {}
+
+    def _wrap(self, name, original):
+        # Vraća omotač metoda koji meri poziv.  Za classmethod i staticmethod
+        # se omotava funkcija unutar njih, a omotač se ponovo pakuje u isti
+        # tip.
+        if isinstance(original, (classmethod, staticmethod)):
+            return type(original)(self._wrap(name, original.__func__))
+
+        # Poziv koji je podigao izuzetak se meri bez rezultata i broji kao
+        # greška.
+        @functools.wraps(original)
+        def wrapper(*args, **kwargs):
+            result = None
+            failed = True
+            begin = time.perf_counter()
+            try:
+                result = original(*args, **kwargs)
+                failed = False
+                return result
+            finally:
+                self._record(name, time.perf_counter() - begin, result,
+                             failed)
+        return wrapper
+
+    def _record(self, name, elapsed, result, failed=False):
+        # Upisuje merenje jednog poziva i poziva registrovane funkcije.
+        size = result_size(result)
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = {
+                    "calls": 0, "errors": 0, "total_time": 0.0,
+                    "max_time": 0.0, "max_result_size": None,
+                }
+            stats["calls"] += 1
+            if failed:
+                stats["errors"] += 1
+            stats["total_time"] += elapsed
+            stats["max_time"] = max(stats["max_time"], elapsed)
+            if size is not None and (stats["max_result_size"] is None or
+                                     size > stats["max_result_size"]):
+                stats["max_result_size"] = size
+            hooks = list(self._hooks)
+
+        # Greška u registrovanoj funkciji ne sme da promeni rezultat, niti
+        # izuzetak merenog metoda, pa se samo prijavljuje upozorenjem.
+        for hook in hooks:
+            try:
+                hook(name, elapsed, size, failed)
+            except Exception as e:
+                warnings.warn("Greška u funkciji instrumentacije {!r}: {!r}"
+                              .format(hook, e), RuntimeWarning)
+
+    def snapshot(self):
+        """Vrati trenutna merenja i statistiku keševa.
+
+        Returns:
+            dict: ``enabled`` (bool), ``methods`` (za svaki pozvani metod
+                dict sa ključevima ``calls``, ``errors`` (broj poziva koji
+                su podigli izuzetak), ``total_time``, ``max_time`` u
+                sekundama i ``max_result_size``, videti ``result_size``) i
+                ``caches`` (statistika keša kontrolnih tačaka i keša
+                Pizanovih perioda).
+
+        """
+        with self._lock:
+            methods = {name: dict(stats)
+                       for name, stats in self._stats.items()}
+        return {
+            "enabled": self.enabled,
+            "methods": methods,
+            "caches": {
+                "checkpoints": checkpoints.stats(),
+                "pisano": modular.pisano.stats(),
+            },
+        }
+
+    def reset(self):
+        """Obriši merenja (statistika keševa se ne menja)."""
+        with self._lock:
+            self._stats = {}
+
+    def add_hook(self, hook):
+        """Registruj funkciju koja se poziva posle svakog merenog poziva.
+
+        Funkcija se poziva u niti u kojoj je izvršen metod, sa imenom
+        metoda, vremenom izvršavanja u sekundama, veličinom rezultata
+        (videti ``result_size``; None ukoliko je metod podigao izuzetak, ali
+        i za rezultate čija se veličina ne meri) i oznakom da li je metod
+        podigao izuzetak: ``hook(name, elapsed, size, failed)``.  Izuzetak
+        iz funkcije se prijavljuje upozorenjem (``RuntimeWarning``) i ne
+        utiče na rezultat metoda.
+
+        """
+        with self._lock:
+            self._hooks.append(hook)
+
+    def remove_hook(self, hook):
+        """Ukloni registrovanu funkciju."""
+        with self._lock:
+            self._hooks.remove(hook)
+
+
+metrics = Instrumentation()
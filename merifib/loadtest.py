@@ -0,0 +1,154 @@
+"""Modul implementira klijent za merenje opterećenja HTTP servisa.
+
+Klijent otvara zadati broj konekcija ka lokalnom serveru (videti modul
+``merifib.server``), kroz svaku šalje zahteve jedan za drugim (HTTP/1.1
+keep-alive), i na kraju ispisuje broj obrađenih zahteva u sekundi i
+medijanu (p50) i 99. percentil (p99) vremena odziva::
+
+    $ python3 -m merifib.server --port 8000 &
+    $ python3 -m merifib.loadtest --port 8000 --requests 10000 \\
+          --concurrency 32 /nth?position=1000 /json?length=100
+
+Putanje se zadaju redom, kružno, tako da se može meriti i mešovito
+opterećenje.
+
+"""
+
+import argparse
+import asyncio
+import itertools
+import time
+
+
+async def request(reader, writer, path, host="127.0.0.1"):
+    """Pošalji GET zahtev kroz otvorenu konekciju i pročitaj odgovor.
+
+    Podržani su odgovori sa zaglavljem ``Content-Length`` i odgovori
+    poslati u delovima (``Transfer-Encoding: chunked``).
+
+    Args:
+        reader (asyncio.StreamReader): Ulazni tok konekcije.
+        writer (asyncio.StreamWriter): Izlazni tok konekcije.
+        path (str): Putanja sa parametrima, npr. ``/nth?position=10``.
+        host (str): Vrednost zaglavlja ``Host``.
+
+    Returns:
+        tuple: HTTP status (int) i telo odgovora (bytes).
+
+    Raises:
+        ConnectionError: Ukoliko server zatvori konekciju pre kraja
+            odgovora.
+
+    """
+    writer.write("GET {} HTTP/1.1\r\nHost: {}\r\n\r\n"
+                 .format(path, host).encode("latin-1"))
+    await writer.drain()
+
+    line = await reader.readline()
+    if not line:
+        raise ConnectionError("Server je zatvorio konekciju.")
+    status = int(line.split()[1])
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    if headers.get("transfer-encoding") == "chunked":
+        parts = []
+        while True:
+            size = int(await reader.readline(), 16)
+            data = await reader.readexactly(size + 2)
+            if size == 0:
+                break
+            parts.append(data[:-2])
+        return status, b"".join(parts)
+
+    return status, await reader.readexactly(int(headers["content-length"]))
+
+
+def percentile(values, p):
+    """Vrati p-ti percentil (0 <= p <= 100) sortirane liste vrednosti."""
+    k = min(len(values) - 1, max(0, round(p / 100 * (len(values) - 1))))
+    return values[k]
+
+
+async def run(host, port, paths, requests, concurrency):
+    """Izmeri opterećenje servera.
+
+    Args:
+        host (str): Adresa servera.
+        port (int): Port servera.
+        paths (list): Putanje koje se zahtevaju, redom i kružno.
+        requests (int): Ukupan broj zahteva.
+        concurrency (int): Broj istovremenih konekcija.
+
+    Returns:
+        dict: Broj zahteva (``requests``), broj neuspešnih zahteva
+            (``errors``), trajanje u sekundama (``seconds``), broj zahteva u
+            sekundi (``rps``) i percentili vremena odziva u milisekundama
+            (``p50``, ``p99``).
+
+    """
+    jobs = iter(itertools.islice(itertools.cycle(paths), requests))
+    latencies = []
+    errors = 0
+
+    async def client():
+        nonlocal errors
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            # Svi klijenti uzimaju putanje iz istog iteratora, pa brži
+            # klijenti pošalju više zahteva.
+            for path in jobs:
+                begin = time.perf_counter()
+                status, _ = await request(reader, writer, path, host)
+                latencies.append(time.perf_counter() - begin)
+                if status != 200:
+                    errors += 1
+        finally:
+            writer.close()
+
+    begin = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    seconds = time.perf_counter() - begin
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "seconds": seconds,
+        "rps": len(latencies) / seconds,
+        "p50": percentile(latencies, 50) * 1000,
+        "p99": percentile(latencies, 99) * 1000,
+    }
+
+
+def main(argv=None):
+    """Pokreni merenje iz komandne linije."""
+    parser = argparse.ArgumentParser(
+        prog="merifib.loadtest",
+        description="Merenje opterećenja HTTP servisa merifib.server.")
+    parser.add_argument("paths", nargs="*", default=["/nth?position=1000"],
+                        help="Putanje koje se zahtevaju, redom i kružno.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--requests", type=int, default=10000,
+                        help="Ukupan broj zahteva.")
+    parser.add_argument("--concurrency", type=int, default=32,
+                        help="Broj istovremenih konekcija.")
+    args = parser.parse_args(argv)
+
+    result = asyncio.run(run(args.host, args.port, args.paths, args.requests,
+                             args.concurrency))
+    print("zahteva: {requests} (neuspešnih: {errors}) za {seconds:.2f} s\n"
+          "zahteva/s: {rps:.0f}\n"
+          "p50: {p50:.2f} ms\n"
+          "p99: {p99:.2f} ms".format(**result))
+
+
+if __name__ == "__main__":
+    main()
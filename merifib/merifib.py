@@ -3,11 +3,16 @@
 aplikacije."""
 
 
+import itertools
 import tkinter as tk
 from tkinter import ttk
+from tkinter import filedialog
 from tkinter import messagebox
 
-from fibonacci import Fibonacci
+from merifib.fibonacci import Fibonacci, _signed_pair
+from merifib.formatting import format_number, to_str
+from merifib.tasks import BackgroundTask
+from merifib.widgets import VirtualList, show_number
 
 
 # Inicijalizacija glavnog prozora.
@@ -31,93 +36,362 @@ mainframe.columnconfigure(0, weight=1)
 #
 fib_seed = tk.IntVar(value=0)               # Početna vrednost niza.
 fib_sequence_length = tk.IntVar(value=1)    # Dužina niza.
-fib_sequence = tk.StringVar()               # Niz.
-json_fib_sequence = tk.StringVar()          # Niz u JSON formatu.
+json_fib_sequence = tk.StringVar()          # Skraćen niz u JSON formatu.
 fib_ord = tk.IntVar()                       # Pozicija broja u nizu.
-fib_ord_num = tk.IntVar()                   # Broj na zadatoj poziciji.
+fib_ord_num = tk.StringVar()                # Skraćen broj na zadatoj poziciji.
+fib_digits = tk.IntVar(value=60)            # Broj prikazanih cifara broja.
+
+# Poslednji izračunati broj na zadatoj poziciji, za prikaz celog broja.
+last_nth = [None]
 
 
 #
-# Funkcije koje pozivaju metode Fibonacci klase i ažuriraju rezultate.
+# Funkcije koje izračunavaju rezultate.  Izvršavaju se u pozadinskoj niti
+# (videti modul merifib.tasks), povremeno proveravajući da li je
+# izračunavanje otkazano.
 #
-def set_sequence(length, seed, parent_win):
-    """Setuj niz sa određenom dužinom i početnom vrednošću.
 
-    Funkcija setuje globalnu promenljivu ``fib_sequence`` koja se ispisuje u
-    korisničkom interfejsu.
+# Broj brojeva niza između dve provere otkazivanja i prijave napretka.
+PROGRESS_STEP = 500
+
+
+def compute_sequence(job, length, seed):
+    """Pripremi niz sa određenom dužinom i početnom vrednošću za prikaz.
+
+    Sam niz se ne izračunava, već se samo proverava početna vrednost, jer
+    lista za prikaz izračunava samo vidljive brojeve.
+
+    Args:
+        job (merifib.tasks.Job): Kontekst izračunavanja.
+        length (int): Dužina niza.
+        seed (int): Početna vrednost niza.
+
+    Returns:
+        Fibonacci: Niz.
+
+    """
+    return Fibonacci(length, seed)
+
+
+def compute_json(job, length, seed, digits):
+    """Izračunaj skraćenu JSON reprezentaciju niza zadate dužine i početne
+    vrednosti.
+
+    Umesto samog niza prikazuje se samo broj brojeva u nizu (niz je
+    prikazan u listi), a zbir se skraćuje kao i brojevi u listi.  Dodatne
+    informacije o nizu se izračunavaju bez generisanja niza.
 
     Args:
+        job (merifib.tasks.Job): Kontekst izračunavanja.
         length (int): Dužina niza.
         seed (int): Početna vrednost niza.
+        digits (int): Broj prikazanih cifara zbira.  Čita se u glavnoj niti,
+            jer se tkinter promenljive ne smeju čitati iz pozadinske niti.
+
+    Returns:
+        str: Skraćena JSON reprezentacija niza.
+
+    """
+    stats = Fibonacci(length, seed).stats()
+    return '{{"sequence": [… {} brojeva …], "sum": {}, "evens": {}, ' \
+        '"odds": {}}}'.format(abs(length),
+                              format_number(stats["sum"], digits),
+                              stats["evens"],
+                              stats["odds"])
+
+
+def compute_nth(job, position):
+    """Izračunaj Fibonačijev broj na datoj poziciji.
+
+    Izračunavanje određenog broja se ne može prekinuti, ali se rezultat
+    otkazanog izračunavanja odbacuje.
+
+    Args:
+        job (merifib.tasks.Job): Kontekst izračunavanja.
+        position (int): Pozicija (redni broj) u Fibonačijevom nizu.
+
+    Returns:
+        int: Broj na datoj poziciji.
+
+    """
+    return Fibonacci.nth(position)
+
+
+def compute_file(job, length, seed, path):
+    """Upiši niz u fajl, bez formiranja celog niza u memoriji.
+
+    Ukoliko putanja ima ekstenziju ``.json``, upisuje se JSON
+    reprezentacija niza (kao ``Fibonacci.json``), a inače po jedan broj u
+    svakom redu.
+
+    Args:
+        job (merifib.tasks.Job): Kontekst izračunavanja.
+        length (int): Dužina niza.
+        seed (int): Početna vrednost niza.
+        path (str): Putanja do fajla.
+
+    Returns:
+        str: Putanja do fajla.
+
+    """
+    f = Fibonacci(length, seed)
+    total = abs(length)
+
+    with open(path, "w") as out:
+        if path.lower().endswith(".json"):
+            # Dokument se upisuje broj po broj, u formatu metoda
+            # Fibonacci.json, da bi se mogao prijaviti napredak.
+            out.write('{"sequence": [')
+            for i, number in enumerate(f.iter_sequence()):
+                if i % PROGRESS_STEP == 0:
+                    job.check()
+                    job.progress(i / total)
+                if i:
+                    out.write(", ")
+                out.write(to_str(number))
+            stats = f.stats()
+            out.write('], "sum": {}, "evens": {}, "odds": {}}}'.format(
+                to_str(stats["sum"]), stats["evens"], stats["odds"]))
+            return path
+
+        for i, number in enumerate(f.iter_sequence()):
+            if i % PROGRESS_STEP == 0:
+                job.check()
+                job.progress(i / total)
+            out.write(to_str(number))
+            out.write("\n")
+    return path
+
+
+def sequence_rows(f):
+    """Vrati podatke za prikaz niza u listi (videti ``VirtualList``).
+
+    Returns:
+        tuple: Broj brojeva u nizu, funkcija koja vraća brojeve od zadatog
+            reda, i indeks prvog broja niza.
+
+    """
+    lo, hi = f._bounds()
+
+    def fetch(first, count):
+        a, b = _signed_pair(lo + first)
+        return list(itertools.islice(Fibonacci._generator_seq(a, b), count))
+
+    return hi - lo + 1, fetch, lo
+
+
+#
+# Funkcije koje pokreću izračunavanja i ažuriraju rezultate.
+#
+def show_value_error(parent_win):
+    """Prikaži dijalog o pogrešno unetoj dužini ili početnoj vrednosti."""
+    messagebox.showerror(
+        "Pogrešna vrednost",
+        "Dužina niza mora biti različita od 0, a početna vrednost mora "
+        "biti validan Fibonačijev broj.",
+        parent=parent_win)
+
+
+def start_task(task, progress, func, on_done, parent_win, determinate=False):
+    """Pokreni izračunavanje u pozadini i prikaži rezultat kada je gotov.
+
+    Ponovljeno pokretanje otkazuje prethodno izračunavanje, tako da se
+    izračunava samo poslednji zahtev.
+
+    Args:
+        task (merifib.tasks.BackgroundTask): Pozadinska nit prozora.
+        progress (ttk.Progressbar): Indikator napretka prozora.
+        func (callable): Funkcija koja prima ``Job`` i vraća rezultat.
+        on_done (callable): Funkcija koja prima rezultat.
         parent_win (tk.Toplevel): Prozor iz kog se funkcija pokreće.  Služi za
             prosleđivanje te informacije dijalogu za izveštaj o grešci.
+        determinate (bool): Da li izračunavanje prijavljuje napredak.
 
     """
-    # Ukoliko je uneta nevalidna vrednost za dužinu ili početnu vrednost, to
-    # hvatamo ovde i prikazujemo poruku u dijalogu.
-    try:
-        f = Fibonacci(length, seed)
-        fib_sequence.set(str(f.sequence()))
-    except ValueError:
-        messagebox.showerror(
-            "Pogrešna vrednost",
-            "Dužina niza mora biti različita od 0, a početna vrednost mora "
-            "biti validan Fibonačijev broj.",
-            parent=parent_win)
-
-
-def set_json(length, seed, parent_win):
-    """Setuj JSON reprezentaciju niza zadate dužine i početne vrednosti.
-
-    Funkcija setuje globalnu promenljivu ``json_sequence`` koja sadrži JSON
-    prikaz niza sa dodatnim podacima koja se prikazuje u korisničkom
-    interfejsu.
+    def done(result):
+        stop_progress(progress)
+        on_done(result)
+
+    def error(e):
+        stop_progress(progress)
+        # Ukoliko je uneta nevalidna vrednost za dužinu ili početnu
+        # vrednost, prikazujemo poruku u dijalogu.
+        if isinstance(e, ValueError):
+            show_value_error(parent_win)
+        else:
+            messagebox.showerror("Greška", str(e), parent=parent_win)
+
+    def advance(fraction):
+        progress["value"] = fraction * 100
+
+    stop_progress(progress)
+    if determinate:
+        progress.configure(mode="determinate")
+    else:
+        progress.configure(mode="indeterminate")
+        progress.start()
+
+    task.submit(func, done, error, advance)
+
+
+def stop_progress(progress):
+    """Zaustavi i resetuj indikator napretka."""
+    progress.stop()
+    progress["value"] = 0
+
+
+def cancel_task(task, progress):
+    """Otkaži izračunavanje koje traje."""
+    task.cancel()
+    stop_progress(progress)
+
+
+def set_sequence(length, seed, parent_win, task, progress, view):
+    """Prikaži niz sa određenom dužinom i početnom vrednošću.
+
+    Funkcija u pozadini proverava početnu vrednost i zatim prikazuje niz u
+    listi koja izračunava samo vidljive brojeve.
 
     Args:
         length (int): Dužina niza.
         seed (int): Početna vrednost niza.
         parent_win (tk.Toplevel): Prozor iz kog se funkcija pokreće.  Služi za
             prosleđivanje te informacije dijalogu za izveštaj o grešci.
+        task (merifib.tasks.BackgroundTask): Pozadinska nit prozora.
+        progress (ttk.Progressbar): Indikator napretka prozora.
+        view (merifib.widgets.VirtualList): Lista za prikaz niza.
 
     """
-    # Ukoliko je uneta nevalidna vrednost za dužinu ili početnu vrednost, to
-    # hvatamo ovde i prikazujemo poruku u dijalogu.
-    try:
-        f = Fibonacci(length, seed)
-        json_fib_sequence.set(f.json())
-    except ValueError:
-        messagebox.showerror(
-            "Pogrešna vrednost",
-            "Dužina niza mora biti različita od 0, a početna vrednost mora "
-            "biti validan Fibonačijev broj.",
-            parent=parent_win)
-
-
-def set_nth(position, parent_win):
+    def done(f):
+        view.digits = fib_digits.get()
+        view.set_source(*sequence_rows(f))
+
+    start_task(task, progress,
+               lambda job: compute_sequence(job, length, seed),
+               done, parent_win)
+
+
+def set_json(length, seed, parent_win, task, progress):
+    """Setuj skraćenu JSON reprezentaciju niza zadate dužine i početne
+    vrednosti.
+
+    Funkcija u pozadini izračunava i setuje globalnu promenljivu
+    ``json_sequence`` koja sadrži skraćen JSON prikaz niza sa dodatnim
+    podacima koja se prikazuje u korisničkom interfejsu.  Ceo JSON se može
+    sačuvati u fajl (videti ``save_sequence``).
+
+    Args:
+        length (int): Dužina niza.
+        seed (int): Početna vrednost niza.
+        parent_win (tk.Toplevel): Prozor iz kog se funkcija pokreće.  Služi za
+            prosleđivanje te informacije dijalogu za izveštaj o grešci.
+        task (merifib.tasks.BackgroundTask): Pozadinska nit prozora.
+        progress (ttk.Progressbar): Indikator napretka prozora.
+
+    """
+    digits = fib_digits.get()
+    start_task(task, progress,
+               lambda job: compute_json(job, length, seed, digits),
+               json_fib_sequence.set, parent_win)
+
+
+def set_nth(position, parent_win, task, progress):
     """Setuj vrednost Fibonačijevog broja na datoj poziciji.
 
-    Funkcija setuje globalnu promenljivu ``fib_ord_num`` na vrednost
-    Fibonačijevog broja na zadatoj poziciji.
+    Funkcija u pozadini izračunava i setuje globalnu promenljivu
+    ``fib_ord_num`` na skraćenu vrednost Fibonačijevog broja na zadatoj
+    poziciji.
 
     Args:
         position (int): Pozicija (redni broj) u Fibonačijevom nizu.
         parent_win (tk.Toplevel): Prozor iz kog se funkcija pokreće.  Služi za
             prosleđivanje te informacije dijalogu za izveštaj o grešci.
+        task (merifib.tasks.BackgroundTask): Pozadinska nit prozora.
+        progress (ttk.Progressbar): Indikator napretka prozora.
+
+    """
+    def done(number):
+        last_nth[0] = number
+        fib_ord_num.set(format_number(number, fib_digits.get()))
+
+    start_task(task, progress,
+               lambda job: compute_nth(job, position),
+               done, parent_win)
+
+
+def save_sequence(length, seed, parent_win, task, progress):
+    """Sačuvaj niz u fajl koji izabere korisnik.
+
+    Niz se upisuje u pozadini, broj po broj (videti ``compute_file``).
+
+    Args:
+        length (int): Dužina niza.
+        seed (int): Početna vrednost niza.
+        parent_win (tk.Toplevel): Prozor iz kog se funkcija pokreće.
+        task (merifib.tasks.BackgroundTask): Pozadinska nit prozora.
+        progress (ttk.Progressbar): Indikator napretka prozora.
+
+    """
+    path = filedialog.asksaveasfilename(
+        parent=parent_win,
+        title="Sačuvaj niz",
+        filetypes=[("JSON", "*.json"), ("Tekst", "*.txt")])
+    if not path:
+        return
+
+    start_task(task, progress,
+               lambda job: compute_file(job, length, seed, path),
+               lambda path: None, parent_win, determinate=True)
+
+
+def show_nth(parent_win):
+    """Prikaži ceo poslednji izračunati broj u posebnom prozoru."""
+    if last_nth[0] is not None:
+        show_number(parent_win, last_nth[0])
+
+
+def task_controls(win, frame, row):
+    """Napravi pozadinsku nit, indikator napretka i dugme za otkazivanje.
+
+    Pozadinska nit se zaustavlja kada se prozor zatvori.
+
+    Args:
+        win (tk.Toplevel): Prozor kome pripadaju kontrole.
+        frame (ttk.Frame): Frejm u koji se smeštaju kontrole.
+        row (int): Red u frejmu.
+
+    Returns:
+        tuple: Par (pozadinska nit, indikator napretka).
 
     """
-    # Kao i u prethodnim funkcijama, hvatamo nevalidne vrednosti.
-    try:
-        fib_ord_num.set(Fibonacci.nth(position))
-    except ValueError:
-        messagebox.showerror(
-            "Pogrešna vrednost",
-            "Redni broj mora biti pozitivan.",
-            parent=parent_win)
+    task = BackgroundTask(win)
+    win.bind("<Destroy>",
+             lambda event: task.close() if event.widget is win else None)
+
+    progress = ttk.Progressbar(frame, orient=tk.HORIZONTAL, length=200)
+    progress.grid(column=0, row=row, sticky=tk.W+tk.E)
+
+    ttk.Button(frame,
+               text="Otkaži",
+               command=lambda: cancel_task(task, progress)).grid(column=1,
+                                                                 row=row,
+                                                                 sticky=tk.E)
+    return task, progress
 
 
 #
 # Funkcije kojima se pozivaju prozori za izračunavanje raznih aspekata niza.
 #
+def digits_entry(frame, row):
+    """Napravi polje za unošenje broja prikazanih cifara broja."""
+    ttk.Label(frame, text="Broj prikazanih cifara:").grid(column=0,
+                                                          row=row,
+                                                          sticky=tk.E)
+    ttk.Entry(frame, textvariable=fib_digits).grid(column=1,
+                                                   row=row,
+                                                   sticky=tk.W)
+
+
 def sequence_of_length_win():
     """Vraća prozor za računanje niza određene dužine."""
 
@@ -135,29 +409,50 @@ def sequence_of_length_win():
     length_entry = ttk.Entry(mainframe, textvariable=fib_sequence_length)
     length_entry.grid(column=1, row=0, sticky=tk.W)
 
+    digits_entry(mainframe, 1)
+
+    # Napredak i otkazivanje izračunavanja.
+    task, progress = task_controls(win, mainframe, 7)
+
+    # Prikaz izračunatog niza.  Prikazuju se samo vidljivi brojevi, a ceo
+    # broj se prikazuje dvoklikom.
+    view = VirtualList(mainframe)
+    view.grid(column=0, row=3, columnspan=2, sticky=tk.W+tk.E)
+
     ttk.Button(mainframe,
                text="Izračunaj",
                command=lambda: set_sequence(fib_sequence_length.get(),
                                             0,
-                                            win)).grid(column=1,
-                                                       row=1,
-                                                       sticky=tk.E)
+                                            win,
+                                            task,
+                                            progress,
+                                            view)).grid(column=1,
+                                                        row=2,
+                                                        sticky=tk.E)
 
-    # Prikaz izračunatog niza.
-    sequence = ttk.Label(mainframe, textvariable=fib_sequence)
-    sequence.grid(column=0, row=2, columnspan=2)
+    ttk.Button(mainframe,
+               text="Sačuvaj u fajl",
+               command=lambda: save_sequence(fib_sequence_length.get(),
+                                             0,
+                                             win,
+                                             task,
+                                             progress)).grid(column=0,
+                                                             row=2,
+                                                             sticky=tk.W)
 
     # Prikaz niza u JSON formatu.
     ttk.Button(mainframe,
                text="Prikaži JSON",
                command=lambda: set_json(fib_sequence_length.get(),
                                         0,
-                                        win)).grid(column=1,
-                                                   row=3,
-                                                   sticky=tk.E)
+                                        win,
+                                        task,
+                                        progress)).grid(column=1,
+                                                        row=4,
+                                                        sticky=tk.E)
 
     ttk.Label(mainframe, textvariable=json_fib_sequence).grid(column=0,
-                                                              row=4,
+                                                              row=5,
                                                               columnspan=2)
 
 
@@ -178,17 +473,31 @@ def nth_number_win():
     order_entry = ttk.Entry(mainframe, textvariable=fib_ord)
     order_entry.grid(column=1, row=0, sticky=tk.W)
 
+    digits_entry(mainframe, 1)
+
+    # Napredak i otkazivanje izračunavanja.
+    task, progress = task_controls(win, mainframe, 5)
+
     ttk.Button(mainframe,
                text="Izračunaj",
-               command=lambda: set_nth(fib_ord.get(), win)).grid(column=1,
-                                                                 row=1,
-                                                                 sticky=tk.W)
+               command=lambda: set_nth(fib_ord.get(),
+                                       win,
+                                       task,
+                                       progress)).grid(column=1,
+                                                       row=2,
+                                                       sticky=tk.W)
 
-    # Prikaz broja.
+    # Prikaz broja, skraćenog na zadati broj cifara.
     ttk.Label(mainframe, textvariable=fib_ord_num).grid(column=0,
-                                                        row=2,
+                                                        row=3,
                                                         columnspan=2)
 
+    ttk.Button(mainframe,
+               text="Prikaži ceo broj",
+               command=lambda: show_nth(win)).grid(column=1,
+                                                   row=4,
+                                                   sticky=tk.E)
+
 
 def new_sequence_win():
     """Vraća prozor za računanje novog niza željene dužine."""
@@ -214,19 +523,36 @@ def new_sequence_win():
     length_entry = ttk.Entry(mainframe, textvariable=fib_sequence_length)
     length_entry.grid(column=1, row=1, sticky=tk.W)
 
+    digits_entry(mainframe, 2)
+
+    # Napredak i otkazivanje izračunavanja.
+    task, progress = task_controls(win, mainframe, 5)
+
+    # Polje za prikaz.
+    view = VirtualList(mainframe)
+    view.grid(column=0, row=4, columnspan=2, sticky=tk.W+tk.E)
+
     # Dugme za izračunavanje.
     ttk.Button(mainframe,
                text="Izračunaj",
                command=lambda: set_sequence(fib_sequence_length.get(),
                                             fib_seed.get(),
-                                            win)).grid(column=1,
-                                                       row=2,
-                                                       sticky=tk.W)
+                                            win,
+                                            task,
+                                            progress,
+                                            view)).grid(column=1,
+                                                        row=3,
+                                                        sticky=tk.W)
 
-    # Polje za prikaz.
-    ttk.Label(mainframe, textvariable=fib_sequence).grid(column=0,
-                                                         row=3,
-                                                         columnspan=2)
+    ttk.Button(mainframe,
+               text="Sačuvaj u fajl",
+               command=lambda: save_sequence(fib_sequence_length.get(),
+                                             fib_seed.get(),
+                                             win,
+                                             task,
+                                             progress)).grid(column=0,
+                                                             row=3,
+                                                             sticky=tk.W)
 
 
 #
@@ -0,0 +1,415 @@
+"""Modul implementira izračunavanje Fibonačijevih brojeva po modulu.
+
+Fibonačijev niz po modulu m je periodičan, a dužina perioda se zove Pisanov
+period i nije veća od 6m.  Za manje module se ceo period ostataka izračuna
+jednom i zapamti u zajedničkom kešu (``pisano``), tako da je svaki sledeći
+upit za isti modul samo čitanje iz tabele.  Za veće module se koristi brzo
+udvostručavanje po modulu, tako da svi međurezultati ostaju manji od m, a
+period se izračunava iz rastavljanja modula na proste činioce.
+
+"""
+
+import array
+import collections
+import itertools
+import math
+import threading
+
+
+# Najveći modul za koji se pamti tabela ostataka.  Tabela ima najviše 6m
+# elemenata, tj. do oko 3 MiB za m = 2^16.
+TABLE_LIMIT = 2**16
+
+
+def _check_modulus(m):
+    # Pomoćna funkcija koja proverava da je modul pozitivan ceo broj.
+    if m < 1:
+        raise ValueError("Modul mora biti pozitivan.")
+
+
+def pisano_period(m):
+    """Vrati Pisanov period za modul m.
+
+    Za module do ``TABLE_LIMIT`` period se nalazi prolaskom kroz niz
+    ostataka dok se ne ponovi početni par (0, 1), što je O(m) koraka.  Za
+    veće module se modul rastavlja na proste činioce: period za prost broj
+    p deli p - 1 ili 2(p + 1), period za p^k je p^j puta period za p (j <
+    k), a period za m je najmanji zajednički sadržalac perioda stepena
+    prostih činilaca.  Vreme je tada određeno rastavljanjem modula i
+    brojeva p - 1, odnosno 2(p + 1), na činioce (Polardovim rho
+    algoritmom), pa je kratko za module do oko 10^30 i za module bez dva
+    velika prosta činioca.  Period se pamti u zajedničkom kešu::
+
+        >>> pisano_period(10)
+        60
+        >>> pisano_period(10**12)
+        1500000000000
+
+    Args:
+        m (int): Modul, pozitivan ceo broj.
+
+    Returns:
+        int: Dužina perioda niza ostataka.
+
+    Raises:
+        ValueError: Ukoliko modul nije pozitivan.
+
+    """
+    return pisano.period(m)
+
+
+def _fib_pair_mod(n, m):
+    # Pomoćna funkcija koja vraća par (F(n) mod m, F(n+1) mod m) brzim
+    # udvostručavanjem, kao merifib.fibonacci._fib_pair(), s tim što se
+    # posle svakog koraka računa ostatak.
+    #
+    # Argumenti:
+    #   n (int): Indeks niza, n >= 0.
+    #   m (int): Modul.
+    #
+    # Vraća:
+    #   tuple: Par (F(n) mod m, F(n+1) mod m).
+    a, b = 0, 1 % m
+    for bit in bin(n)[2:]:
+        c = a * (2*b - a) % m
+        d = (a*a + b*b) % m
+        if bit == '1':
+            a, b = d, (c + d) % m
+        else:
+            a, b = c, d
+    return a, b
+
+
+# Osnove Miler-Rabinovog testa.  Test je deterministički za brojeve manje od
+# 3.3 * 10^24, a za veće je verovatnoća greške zanemarljiva.
+_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+
+def _is_prime(n):
+    # Pomoćna funkcija koja proverava da li je n prost broj (Miler-Rabinov
+    # test).
+    if n < 2:
+        return False
+    for p in _WITNESSES:
+        if n % p == 0:
+            return n == p
+
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in _WITNESSES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _find_factor(n):
+    # Pomoćna funkcija koja vraća netrivijalan činilac složenog neparnog
+    # broja n, Polardovim rho algoritmom.
+    for c in itertools.count(1):
+        x = y = 2
+        d = 1
+        while d == 1:
+            x = (x * x + c) % n
+            y = (y * y + c) % n
+            y = (y * y + c) % n
+            d = math.gcd(x - y, n)
+        if d != n:
+            return d
+
+
+def _factorize(n):
+    # Pomoćna funkcija koja rastavlja broj na proste činioce.
+    #
+    # Argumenti:
+    #   n (int): Pozitivan ceo broj.
+    #
+    # Vraća:
+    #   collections.Counter: Prosti činioci i njihovi izložioci.
+    factors = collections.Counter()
+    while n % 2 == 0:
+        factors[2] += 1
+        n //= 2
+
+    pending = [n] if n > 1 else []
+    while pending:
+        n = pending.pop()
+        if _is_prime(n):
+            factors[n] += 1
+        else:
+            d = _find_factor(n)
+            pending += [d, n // d]
+    return factors
+
+
+def _reduce_period(n, primes, m):
+    # Pomoćna funkcija koja vraća najmanji delilac d broja n takav da je
+    # (F(d), F(d+1)) = (0, 1) po modulu m, tj. Pisanov period, ukoliko je n
+    # njegov sadržalac.  Broj n se deli prostim činiocima dok god se par
+    # (0, 1) ponavlja i posle manjeg broja koraka.
+    #
+    # Argumenti:
+    #   n (int): Sadržalac Pisanovog perioda.
+    #   primes (iterable): Prosti činioci broja n.
+    #   m (int): Modul.
+    #
+    # Vraća:
+    #   int: Pisanov period.
+    for q in primes:
+        while n % q == 0 and _fib_pair_mod(n // q, m) == (0, 1):
+            n //= q
+    return n
+
+
+def _prime_power_period(p, k):
+    # Pomoćna funkcija koja vraća Pisanov period za modul p^k, gde je p
+    # prost broj.  Period za p deli p - 1 ukoliko je p = ±1 (mod 5), a
+    # inače 2(p + 1), osim za p = 2 i p = 5.  Period za p^k deli p^(k-1)
+    # puta period za p.
+    if p == 2:
+        period = 3
+    elif p == 5:
+        period = 20
+    else:
+        n = p - 1 if p % 5 in (1, 4) else 2 * (p + 1)
+        period = _reduce_period(n, _factorize(n), p)
+    return _reduce_period(period * p**(k - 1), [p], p**k)
+
+
+def _period(m):
+    # Pomoćna funkcija koja vraća Pisanov period za modul m kao najmanji
+    # zajednički sadržalac perioda stepena prostih činilaca modula.
+    period = 1
+    for p, k in _factorize(m).items():
+        q = _prime_power_period(p, k)
+        period = period * q // math.gcd(period, q)
+    return period
+
+
+def _residues(m):
+    # Pomoćna funkcija koja vraća ostatke F(0) .. F(p-1) po modulu m, gde je p
+    # Pisanov period, kao array.array('Q').
+    if m == 1:
+        return array.array('Q', [0])
+
+    table = array.array('Q')
+    a, b = 0, 1
+    while True:
+        table.append(a)
+        a, b = b, (a + b) % m
+        if a == 0 and b == 1:
+            return table
+
+
+class PisanoCache:
+    """Keš tabela ostataka Fibonačijevog niza za jedan Pisanov period.
+
+    Tabele se čuvaju kao nizovi neoznačenih 64-bitnih brojeva
+    (``array.array('Q')``), a ukupan broj zapamćenih elemenata je
+    ograničen; kada se ograničenje pređe, izbacuju se najdavnije korišćene
+    tabele.  Za module veće od ``TABLE_LIMIT`` pamti se samo dužina perioda,
+    ukoliko je zatražena.  Svi metodi su bezbedni za korišćenje iz više
+    niti.
+
+    Atributi:
+        max_entries: Najveći ukupan broj elemenata u svim tabelama.
+        hits: Broj upita odgovorenih iz tabele.
+        misses: Broj tabela koje su morale biti izračunate.
+        evictions: Broj izbačenih tabela.
+
+    """
+
+    def __init__(self, max_entries=2**22):
+        """Inicijalizuj prazan keš sa zadatim ograničenjem.
+
+        Args:
+            max_entries (int): Najveći ukupan broj elemenata u svim
+                tabelama.  Podrazumevano 2^22 (32 MiB).
+
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._tables = collections.OrderedDict()    # m -> tabela ostataka
+        self._periods = {}                          # m -> Pisanov period
+        self._entries = 0
+        self._lock = threading.Lock()
+
+    def table(self, m):
+        """Vrati tabelu ostataka F(0) .. F(p-1) po modulu m, gde je p Pisanov
+        period, ili None ukoliko je modul prevelik za tabelu.
+
+        Raises:
+            ValueError: Ukoliko modul nije pozitivan.
+
+        """
+        _check_modulus(m)
+        if m > TABLE_LIMIT:
+            return None
+
+        with self._lock:
+            table = self._tables.get(m)
+            if table is not None:
+                self._tables.move_to_end(m)
+                self.hits += 1
+                return table
+            self.misses += 1
+
+        # Tabelu računamo van zaključanog dela, da ne bi blokirali upite
+        # za druge module.
+        table = _residues(m)
+
+        with self._lock:
+            if m not in self._tables:
+                self._tables[m] = table
+                self._entries += len(table)
+                while self._entries > self.max_entries and self._tables:
+                    _, old = self._tables.popitem(last=False)
+                    self._entries -= len(old)
+                    self.evictions += 1
+            self._periods[m] = len(table)
+        return table
+
+    def period(self, m):
+        """Vrati Pisanov period za modul m (videti ``pisano_period``)."""
+        _check_modulus(m)
+        with self._lock:
+            period = self._periods.get(m)
+            if period is not None:
+                self.hits += 1
+                return period
+
+        if m <= TABLE_LIMIT:
+            return len(self.table(m))
+
+        with self._lock:
+            self.misses += 1
+
+        period = _period(m)
+
+        with self._lock:
+            self._periods[m] = period
+        return period
+
+    def known_period(self, m):
+        """Vrati Pisanov period za modul m ukoliko je već izračunat, ili
+        None."""
+        with self._lock:
+            return self._periods.get(m)
+
+    def clear(self):
+        """Isprazni keš i resetuj brojače."""
+        with self._lock:
+            self._tables.clear()
+            self._periods.clear()
+            self._entries = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """Vrati statistiku keša kao dictionary.
+
+        Returns:
+            dict: Ključevi ``hits``, ``misses``, ``evictions``, ``tables``,
+                ``periods``, ``entries`` i ``max_entries``.
+
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "tables": len(self._tables),
+                "periods": len(self._periods),
+                "entries": self._entries,
+                "max_entries": self.max_entries
+            }
+
+
+# Zajednički keš Pisanovih perioda za ceo proces.
+pisano = PisanoCache()
+
+
+def fib_mod(n, m):
+    """Vrati F(n) mod m za bilo koji ceo broj n, uključujući negativne.
+
+    Za module do ``TABLE_LIMIT`` rezultat se čita iz tabele ostataka (niz
+    ostataka je periodičan u oba smera, pa to važi i za negativne indekse),
+    a za veće module se računa brzim udvostručavanjem po modulu::
+
+        >>> fib_mod(10**18, 1000)
+        875
+
+    Args:
+        n (int): Indeks niza.
+        m (int): Modul, pozitivan ceo broj.
+
+    Returns:
+        int: Ostatak, između 0 i m-1.
+
+    Raises:
+        ValueError: Ukoliko modul nije pozitivan.
+
+    """
+    table = pisano.table(m)
+    if table is not None:
+        return table[n % len(table)]
+
+    # Ukoliko je period za ovaj modul već poznat, indeks se može smanjiti.
+    period = pisano.known_period(m)
+    if period is not None:
+        n %= period
+
+    if n >= 0:
+        return _fib_pair_mod(n, m)[0]
+
+    # F(-n) = (-1)^(n+1) * F(n).
+    value = _fib_pair_mod(-n, m)[0]
+    return value if n % 2 else -value % m
+
+
+def iter_mod(n, m):
+    """Generiši beskonačan niz F(n) mod m, F(n+1) mod m, ...
+
+    Args:
+        n (int): Indeks prvog broja niza.
+        m (int): Modul, pozitivan ceo broj.
+
+    Returns:
+        generator: Ostaci uzastopnih Fibonačijevih brojeva.
+
+    Raises:
+        ValueError: Ukoliko modul nije pozitivan.
+
+    """
+    table = pisano.table(m)
+    if table is not None:
+        return _generator_table(table, n % len(table))
+
+    return _generator_mod(fib_mod(n, m), fib_mod(n + 1, m), m)
+
+
+def _generator_table(table, i):
+    # Pomoćni generator koji ciklično čita tabelu ostataka od mesta i.
+    period = len(table)
+    while True:
+        yield table[i]
+        i += 1
+        if i == period:
+            i = 0
+
+
+def _generator_mod(a, b, m):
+    # Pomoćni generator, kao Fibonacci._generator_seq(), po modulu m.
+    while True:
+        yield a
+        a, b = b, (a + b) % m
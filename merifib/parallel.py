@@ -0,0 +1,146 @@
+"""Modul implementira paralelno generisanje dugih Fibonačijevih nizova.
+
+Budući da se do bilo kog para (F(k), F(k+1)) može doći skokom u O(log(k))
+koraka, niz se može podeliti na nezavisne delove koje računaju različiti
+procesi: svaki proces skokom dolazi do početka svog dela i zatim ga generiše
+sabiranjem.  Delovi se spajaju istim redom, tako da je rezultat identičan
+rezultatu metoda ``Fibonacci.sequence``.
+
+"""
+
+import collections
+import concurrent.futures
+import itertools
+import os
+
+from merifib.fibonacci import Fibonacci, _signed_pair
+
+
+# Podrazumevani broj brojeva niza u jednom delu.
+CHUNK_SIZE = 10000
+
+
+def _chunk(start, count):
+    # Pomoćna funkcija koju izvršavaju procesi: vraća brojeve F(start) ..
+    # F(start+count-1).  Mora biti funkcija na nivou modula da bi mogla da se
+    # prosledi drugom procesu.
+    a, b = _signed_pair(start)
+    return list(itertools.islice(Fibonacci._generator_seq(a, b), count))
+
+
+def iter_chunks(fib, workers=None, chunk_size=CHUNK_SIZE):
+    """Generiši niz u delovima koje paralelno računa više procesa.
+
+    Delovi (liste brojeva) se vraćaju redom, čim je sledeći deo gotov, a
+    istovremeno se računa najviše dvostruko više delova nego što ima
+    procesa, tako da memorija ne raste sa dužinom niza.  Niz bez dužine se
+    generiše beskonačno.
+
+    Args:
+        fib (Fibonacci): Niz koji se generiše.
+        workers (int or None): Broj procesa.  Podrazumevano None, tj. broj
+            procesora.
+        chunk_size (int): Broj brojeva niza u jednom delu.  Podrazumevano
+            ``CHUNK_SIZE``.
+
+    Returns:
+        generator: Uzastopni delovi niza kao liste.
+
+    Raises:
+        ValueError: Ukoliko veličina dela ili broj procesa nije pozitivan.
+
+    """
+    if chunk_size < 1:
+        raise ValueError("Veličina dela mora biti pozitivna.")
+    if workers is not None and workers < 1:
+        raise ValueError("Broj procesa mora biti pozitivan.")
+
+    if fib.length is None:
+        lo, count = fib.index, None
+    else:
+        lo, hi = fib._bounds()
+        count = hi - lo + 1
+
+    return _generator_chunks(lo, count, workers or os.cpu_count() or 1,
+                             chunk_size)
+
+
+def _generator_chunks(lo, count, workers, chunk_size):
+    # Pomoćni generator za iter_chunks().  Početke delova daje redom, a
+    # zadatke šalje procesima tako da ih je najviše 2*workers u toku.
+    #
+    # Argumenti:
+    #   lo (int): Indeks prvog broja niza.
+    #   count (int or None): Dužina niza, ili None za beskonačan niz.
+    #   workers (int): Broj procesa.
+    #   chunk_size (int): Broj brojeva niza u jednom delu.
+    #
+    # Vraća:
+    #   list: Sledeći deo niza.
+    if count is None:
+        starts = itertools.count(lo, chunk_size)
+    else:
+        starts = range(lo, lo + count, chunk_size)
+
+    def size(start):
+        if count is None:
+            return chunk_size
+        return min(chunk_size, lo + count - start)
+
+    # Kratak niz nema smisla deliti između procesa.
+    if count is not None and count <= chunk_size:
+        yield _chunk(lo, count)
+        return
+
+    executor = concurrent.futures.ProcessPoolExecutor(workers)
+    try:
+        pending = collections.deque()
+        for start in starts:
+            pending.append(executor.submit(_chunk, start, size(start)))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        # Ukoliko je generator zatvoren pre kraja (npr. kod beskonačnog
+        # niza), delovi koji još nisu počeli se otkazuju.
+        executor.shutdown(cancel_futures=True)
+
+
+def iter_parallel(fib, workers=None, chunk_size=CHUNK_SIZE):
+    """Generiši niz broj po broj, paralelno računajući delove niza.
+
+    Isto kao ``iter_chunks``, ali vraća pojedinačne brojeve, istim redom
+    kao ``fib.iter_sequence()``.
+
+    """
+    return _generator_flat(iter_chunks(fib, workers, chunk_size))
+
+
+def _generator_flat(chunks):
+    # Pomoćni generator za iter_parallel().  Za razliku od
+    # itertools.chain.from_iterable() prosleđuje zatvaranje generatoru
+    # delova, da bi se procesi ugasili.
+    try:
+        for chunk in chunks:
+            yield from chunk
+    finally:
+        chunks.close()
+
+
+def sequence(fib, workers=None, chunk_size=CHUNK_SIZE):
+    """Vrati niz konačne dužine, paralelno računajući delove niza.
+
+    Rezultat je identičan rezultatu ``fib.sequence()``.
+
+    Raises:
+        ValueError: Ukoliko dužina niza nije definisana.
+
+    """
+    if fib.length is None:
+        raise ValueError("Niz mora imati dužinu.")
+
+    result = []
+    for chunk in iter_chunks(fib, workers, chunk_size):
+        result.extend(chunk)
+    return result
@@ -0,0 +1,389 @@
+"""Modul implementira opšte linearne rekurencije sa celobrojnim koeficijentima.
+
+Rekurencija reda k je niz zadat koeficijentima c1, ..., ck i početnim
+vrednostima x(0), ..., x(k-1)::
+
+    x(n) = c1*x(n-1) + c2*x(n-2) + ... + ck*x(n-k)
+
+Fibonačijev niz je rekurencija reda 2 sa koeficijentima (1, 1) i početnim
+vrednostima (0, 1), Lukasov niz ima iste koeficijente i početne vrednosti
+(2, 1), a tribonači niz je rekurencija reda 3 sa koeficijentima (1, 1, 1)::
+
+    >>> LinearRecurrence.lucas().sequence(8)
+    [2, 1, 3, 4, 7, 11, 18, 29]
+    >>> LinearRecurrence.kbonacci(3).nth(10**4) % 1000
+    984
+
+Broj x(n) se dobija skokom, Kitamasinim metodom: x^n se izračunava po modulu
+karakterističnog polinoma rekurencije binarnim stepenovanjem, tj. u
+O(k^2 log(n)) množenja, a njegovi koeficijenti su težine kojima se x(n)
+dobija iz početnih vrednosti.  Sledeći brojevi niza se zatim dobijaju
+sabiranjem.  Za rekurencije sa Fibonačijevim koeficijentima (1, 1) i
+proizvoljnim početnim vrednostima (a, b) važi x(n) = a*F(n-1) + b*F(n), pa
+se one računaju istim putem kao klasa ``Fibonacci`` (brzo udvostručavanje,
+keš kontrolnih tačaka, tabela na disku, izabrana aritmetika, odnosno modul
+``merifib.modular`` za ostatke).
+
+"""
+
+import collections
+import itertools
+import operator
+
+from merifib import modular
+from merifib.fibonacci import Fibonacci, _signed_pair
+
+
+def _mul(p, q, coefficients, m):
+    # Pomoćna funkcija koja množi dva polinoma stepena manjeg od k po modulu
+    # karakterističnog polinoma x^k - c1*x^(k-1) - ... - ck, i po potrebi po
+    # modulu m.
+    #
+    # Argumenti:
+    #   p (list): Koeficijenti prvog polinoma, od x^0 do x^(k-1).
+    #   q (list): Koeficijenti drugog polinoma.
+    #   coefficients (tuple): Koeficijenti rekurencije c1, ..., ck.
+    #   m (int or None): Modul, ili None.
+    #
+    # Vraća:
+    #   list: Koeficijenti proizvoda, od x^0 do x^(k-1).
+    k = len(coefficients)
+    r = [0] * (2*k - 1)
+    for i, a in enumerate(p):
+        if a:
+            for j, b in enumerate(q):
+                r[i + j] += a * b
+
+    # Smanjujemo stepen od najvećeg: x^d = x^(d-k) * (c1*x^(k-1) + ... + ck).
+    for d in range(2*k - 2, k - 1, -1):
+        t = r[d]
+        if t:
+            for i, c in enumerate(coefficients, 1):
+                r[d - i] += t * c
+
+    del r[k:]
+    if m is not None:
+        r = [x % m for x in r]
+    return r
+
+
+def _shift(p, coefficients, m):
+    # Pomoćna funkcija koja množi polinom sa x po modulu karakterističnog
+    # polinoma (videti _mul()), u O(k) koraka.
+    k = len(coefficients)
+    t = p[-1]
+    r = [0] + p[:-1]
+    if t:
+        for i, c in enumerate(coefficients, 1):
+            r[k - i] += t * c
+    if m is not None:
+        r = [x % m for x in r]
+    return r
+
+
+def _power(n, coefficients, m=None):
+    # Pomoćna funkcija koja vraća x^n po modulu karakterističnog polinoma,
+    # binarnim stepenovanjem od najznačajnije cifre broja n.  Koeficijenti
+    # rezultata d0, ..., d(k-1) daju x(n) = d0*x(0) + ... + d(k-1)*x(k-1).
+    #
+    # Argumenti:
+    #   n (int): Stepen, n >= 0.
+    #   coefficients (tuple): Koeficijenti rekurencije.
+    #   m (int or None): Modul, ili None.
+    #
+    # Vraća:
+    #   list: Koeficijenti polinoma x^n mod P, od x^0 do x^(k-1).
+    r = [1] + [0] * (len(coefficients) - 1)
+    for bit in bin(n)[2:]:
+        r = _mul(r, r, coefficients, m)
+        if bit == "1":
+            r = _shift(r, coefficients, m)
+    return r
+
+
+class LinearRecurrence:
+    """Linearna rekurencija sa celobrojnim koeficijentima (videti opis
+    modula).
+
+    Indeksi niza počinju od 0, a x(0), ..., x(k-1) su početne vrednosti.
+
+    Atributi:
+        coefficients: Koeficijenti c1, ..., ck, kao tuple.
+        initial: Početne vrednosti x(0), ..., x(k-1), kao tuple.
+        order: Red rekurencije k.
+
+    Metode:
+        fibonacci: Fibonačijev niz, ili niz sa Fibonačijevim koeficijentima.
+        lucas: Lukasov niz.
+        kbonacci: Niz u kome je svaki broj zbir prethodnih k.
+        nth: Vraća x(n), skokom.
+        nth_mod: Vraća x(n) mod m.
+        iter_sequence: Generiše beskonačan niz od zadatog indeksa.
+        sequence: Vraća deo niza kao listu.
+        sequence_mod: Vraća ostatke dela niza po modulu kao listu.
+        stats: Vraća zbir i broj parnih i neparnih brojeva dela niza.
+
+    """
+
+    def __init__(self, coefficients, initial):
+        """Inicijalizuj rekurenciju.
+
+        Args:
+            coefficients (iterable): Celobrojni koeficijenti c1, ..., ck.
+            initial (iterable): Celobrojne početne vrednosti x(0), ...,
+                x(k-1).
+
+        Raises:
+            ValueError: Ukoliko nema koeficijenata, ili se broj koeficijenata
+                i početnih vrednosti razlikuje.
+
+        """
+        self.coefficients = tuple(coefficients)
+        self.initial = tuple(initial)
+        if not self.coefficients:
+            raise ValueError("Rekurencija mora imati bar jedan koeficijent.")
+        if len(self.initial) != len(self.coefficients):
+            raise ValueError("Broj početnih vrednosti mora biti jednak broju "
+                             "koeficijenata.")
+
+        self.order = len(self.coefficients)
+        # Rekurencije sa Fibonačijevim koeficijentima se računaju pomoću
+        # Fibonačijevih brojeva (videti opis modula).
+        self._fibonacci = self.coefficients == (1, 1)
+        self._sums = None       # Rekurencija zbirova, videti _prefix_sum.
+        self._parity = None     # Ciklus parnosti, videti _parity_cycle.
+
+    @classmethod
+    def fibonacci(cls, a=0, b=1):
+        """Vrati rekurenciju x(n) = x(n-1) + x(n-2) sa početnim vrednostima
+        a i b (podrazumevano Fibonačijev niz)."""
+        return cls((1, 1), (a, b))
+
+    @classmethod
+    def lucas(cls):
+        """Vrati Lukasov niz 2, 1, 3, 4, 7, 11, ..."""
+        return cls((1, 1), (2, 1))
+
+    @classmethod
+    def kbonacci(cls, k):
+        """Vrati niz reda k u kome je svaki broj zbir prethodnih k, sa
+        početnim vrednostima 0, ..., 0, 1 (za k = 3 tribonači niz)."""
+        return cls((1,) * k, (0,) * (k - 1) + (1,))
+
+    @staticmethod
+    def _check_index(n):
+        # Pomoćni metod koji proverava da je indeks nenegativan.
+        if n < 0:
+            raise ValueError("Indeks mora biti nenegativan.")
+
+    def nth(self, n):
+        """Vrati x(n), u O(k^2 log(n)) množenja.
+
+        Args:
+            n (int): Indeks niza, n >= 0.
+
+        Returns:
+            int: Broj niza sa indeksom n.
+
+        Raises:
+            ValueError: Ukoliko je indeks negativan.
+
+        """
+        self._check_index(n)
+        if self._fibonacci:
+            a, b = self.initial
+            prev, cur = _signed_pair(n - 1)
+            return a*prev + b*cur
+        if n < self.order:
+            return self.initial[n]
+        return sum(map(operator.mul, _power(n, self.coefficients),
+                       self.initial))
+
+    def nth_mod(self, n, m):
+        """Vrati x(n) mod m, bez računanja samog broja (međurezultati su
+        reda veličine m^2).
+
+        Raises:
+            ValueError: Ukoliko je indeks negativan, ili modul nije
+                pozitivan.
+
+        """
+        self._check_index(n)
+        modular._check_modulus(m)
+        if self._fibonacci:
+            a, b = self.initial
+            return (a * modular.fib_mod(n - 1, m) +
+                    b * modular.fib_mod(n, m)) % m
+        return sum(map(operator.mul, _power(n, self.coefficients, m),
+                       self.initial)) % m
+
+    def _window(self, start, m=None):
+        # Pomoćni metod koji vraća brojeve x(start), ..., x(start+k-1)
+        # (po modulu m, ukoliko je zadat), jednim skokom: od x^start se
+        # sledeći polinomi dobijaju množenjem sa x.
+        if start < self.order:
+            window = list(itertools.islice(
+                self._generator(self.initial, None),
+                start, start + self.order))
+            return window if m is None else [x % m for x in window]
+
+        p = _power(start, self.coefficients, m)
+        window = []
+        for _ in range(self.order):
+            value = sum(map(operator.mul, p, self.initial))
+            window.append(value if m is None else value % m)
+            p = _shift(p, self.coefficients, m)
+        return window
+
+    def _generator(self, window, m):
+        # Pomoćni generator koji od k uzastopnih brojeva niza sabiranjem
+        # generiše beskonačan niz (po modulu m, ukoliko je zadat).
+        #
+        # Argumenti:
+        #   window (iterable): Brojevi x(s), ..., x(s+k-1).
+        #   m (int or None): Modul, ili None.
+        #
+        # Vraća:
+        #   int: Sledeći broj niza.
+        window = collections.deque(window, maxlen=self.order)
+        weights = self.coefficients[::-1]   # Uparene sa x(s), ..., x(s+k-1).
+        while True:
+            yield window[0]
+            value = sum(map(operator.mul, weights, window))
+            window.append(value if m is None else value % m)
+
+    def iter_sequence(self, start=0):
+        """Generiši beskonačan niz x(start), x(start+1), ...
+
+        Do prvog broja se dolazi skokom, a zatim se brojevi dobijaju
+        sabiranjem (k množenja malim koeficijentima po broju).
+
+        Raises:
+            ValueError: Ukoliko je indeks negativan.
+
+        """
+        self._check_index(start)
+        if self._fibonacci:
+            # x(s) = a*F(s-1) + b*F(s) i x(s+1) = a*F(s) + b*F(s+1), iz
+            # jednog para.
+            a, b = self.initial
+            prev, cur = _signed_pair(start - 1)
+            return Fibonacci._generator_seq(a*prev + b*cur,
+                                            a*cur + b*(prev + cur))
+        return self._generator(self._window(start), None)
+
+    def sequence(self, length, start=0):
+        """Vrati brojeve x(start), ..., x(start+length-1) kao listu.
+
+        Raises:
+            ValueError: Ukoliko je dužina ili indeks negativan.
+
+        """
+        if length < 0:
+            raise ValueError("Dužina ne sme biti negativna.")
+        return list(itertools.islice(self.iter_sequence(start), length))
+
+    def sequence_mod(self, length, m, start=0):
+        """Vrati ostatke brojeva x(start), ..., x(start+length-1) po modulu
+        m kao listu, bez računanja samih brojeva.
+
+        Raises:
+            ValueError: Ukoliko je dužina ili indeks negativan, ili modul
+                nije pozitivan.
+
+        """
+        if length < 0:
+            raise ValueError("Dužina ne sme biti negativna.")
+        self._check_index(start)
+        modular._check_modulus(m)
+        if self._fibonacci:
+            generator = modular._generator_mod(self.nth_mod(start, m),
+                                               self.nth_mod(start + 1, m), m)
+        else:
+            generator = self._generator(self._window(start, m), m)
+        return list(itertools.islice(generator, length))
+
+    def _prefix_sum(self, n):
+        # Pomoćni metod koji vraća zbir x(0) + ... + x(n-1).
+        #
+        # Zbirovi s(n) su i sami linearna rekurencija, reda k+1: kako je
+        # s(n+1) - s(n) = x(n), karakteristični polinom niza s je
+        # (x - 1)*P(x), gde je P karakteristični polinom niza x.  Za
+        # Fibonačijeve koeficijente je s(n) = a*F(n) + b*(F(n+1) - 1).
+        if self._fibonacci:
+            a, b = self.initial
+            cur, nxt = _signed_pair(n)
+            return a*cur + b*(nxt - 1)
+
+        if self._sums is None:
+            # Koeficijenti polinoma P od najvećeg stepena: 1, -c1, ..., -ck.
+            p = (1,) + tuple(-c for c in self.coefficients) + (0,)
+            q = [p[j] - (p[j-1] if j else 0) for j in range(self.order + 2)]
+            self._sums = LinearRecurrence(
+                [-c for c in q[1:]],
+                itertools.accumulate(self.initial, initial=0))
+        return self._sums.nth(n)
+
+    def _parity_cycle(self):
+        # Pomoćni metod koji vraća (mu, period, prefiks), gde je niz parnosti
+        # periodičan od indeksa mu sa datim periodom, a prefiks[i] je broj
+        # parnih brojeva među x(0), ..., x(i-1), za i <= mu + period.
+        # Stanje niza po modulu 2 je k bitova, pa se ponavlja posle najviše
+        # 2^k koraka.
+        if self._parity is None:
+            seen = {}
+            prefix = [0]
+            state = tuple(x % 2 for x in self.initial)
+            weights = self.coefficients[::-1]
+            while state not in seen:
+                seen[state] = len(prefix) - 1
+                prefix.append(prefix[-1] + (state[0] == 0))
+                value = sum(map(operator.mul, weights, state)) % 2
+                state = state[1:] + (value,)
+            mu = seen[state]
+            self._parity = (mu, len(prefix) - 1 - mu, prefix)
+        return self._parity
+
+    def _evens(self, n):
+        # Pomoćni metod koji vraća broj parnih brojeva među x(0), ...,
+        # x(n-1).
+        mu, period, prefix = self._parity_cycle()
+        if n <= mu:
+            return prefix[n]
+        cycles, rest = divmod(n - mu, period)
+        return (prefix[mu] + cycles * (prefix[mu + period] - prefix[mu]) +
+                prefix[mu + rest] - prefix[mu])
+
+    def stats(self, length, start=0):
+        """Vrati zbir i broj parnih i neparnih brojeva x(start), ...,
+        x(start+length-1), bez generisanja niza.
+
+        Zbir se dobija skokom kroz niz zbirova (videti ``_prefix_sum``), a
+        parni brojevi se prebrojavaju pomoću periodičnosti niza parnosti::
+
+            >>> LinearRecurrence.lucas().stats(10)
+            {'sum': 198, 'evens': 4, 'odds': 6}
+
+        Returns:
+            dict: Zbir brojeva (``sum``), broj parnih (``evens``) i broj
+                neparnih brojeva (``odds``).
+
+        Raises:
+            ValueError: Ukoliko je dužina ili indeks negativan.
+
+        """
+        if length < 0:
+            raise ValueError("Dužina ne sme biti negativna.")
+        self._check_index(start)
+
+        end = start + length
+        evens = self._evens(end) - self._evens(start)
+        return {
+            "sum": self._prefix_sum(end) - self._prefix_sum(start),
+            "evens": evens,
+            "odds": length - evens
+        }
+
+    def __repr__(self):
+        return "LinearRecurrence({}, {})".format(self.coefficients,
+                                                 self.initial)
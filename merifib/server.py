@@ -0,0 +1,499 @@
+"""Modul implementira lokalni HTTP servis za Fibonačijeve brojeve i nizove.
+
+Servis je namenjen drugim procesima na istom računaru i koristi samo
+standardnu biblioteku (``asyncio``).  Pokreće se komandom::
+
+    $ python3 -m merifib.server --port 8000
+
+i odgovara na GET zahteve::
+
+    /nth?position=<pozicija>                    -> broj, kao tekst
+    /sequence?length=<dužina>[&seed=<početak>]  -> brojevi niza, jedan u redu
+    /json?length=<dužina>[&seed=<početak>]      -> isto što i Fibonacci.json()
+
+Izračunavanja se izvršavaju u procesima (``ProcessPoolExecutor``), tako da
+petlja događaja nikada ne čeka na računanje.  Istovremeni identični zahtevi
+se spajaju u jedno izračunavanje, a gotovi odgovori se čuvaju u kešu
+ograničene veličine.  Nizovi duži od ``STREAM_THRESHOLD`` brojeva se ne
+keširaju, već se računaju u delovima i šalju kako koji deo bude gotov
+(``Transfer-Encoding: chunked``), tako da ni server ni klijent ne moraju da
+drže ceo odgovor u memoriji.  Opcijom ``--table`` se svim procesima
+priključuje ista tabela unapred izračunatih brojeva (videti modul
+``merifib.table``), čije stranice procesi dele.
+
+"""
+
+import argparse
+import asyncio
+import collections
+import concurrent.futures
+import functools
+import itertools
+import os
+import urllib.parse
+
+from merifib import table as fibtable
+from merifib.fibonacci import Fibonacci, _signed_pair
+from merifib.formatting import to_str
+
+
+# Nizovi sa više brojeva od ovoga se šalju u delovima.
+STREAM_THRESHOLD = 10000
+
+# Broj brojeva niza u jednom delu odgovora.
+CHUNK_SIZE = 10000
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+}
+
+_CONTENT_TYPES = {
+    "nth": "text/plain; charset=utf-8",
+    "sequence": "text/plain; charset=utf-8",
+    "json": "application/json",
+}
+
+
+class BadRequest(Exception):
+    """Izuzetak za neispravan zahtev, sa HTTP statusom odgovora."""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+# Funkcije koje izvršavaju procesi.  Moraju biti na nivou modula da bi mogle
+# da se proslede drugom procesu, i vraćaju gotove bajtove odgovora, tako da
+# glavni proces ne mora da konvertuje brojeve u tekst.
+
+def _nth_body(position):
+    return to_str(Fibonacci.nth(position)).encode("ascii")
+
+
+def _bounds(length, seed):
+    # Vraća granice niza, pri čemu Fibonacci() proverava početnu vrednost.
+    return Fibonacci(length, seed)._bounds()
+
+
+def _chunk_body(start, count, separator):
+    # Vraća brojeve F(start) .. F(start+count-1), razdvojene separatorom.
+    a, b = _signed_pair(start)
+    numbers = itertools.islice(Fibonacci._generator_seq(a, b), count)
+    return separator.join(map(to_str, numbers)).encode("ascii")
+
+
+def _json_tail(length, seed):
+    # Vraća kraj JSON dokumenta, sa zbirom i brojem parnih i neparnih
+    # brojeva (videti Fibonacci._generator_json).
+    stats = Fibonacci(length, seed).stats()
+    return '], "sum": {}, "evens": {}, "odds": {}}}'.format(
+        to_str(stats["sum"]), stats["evens"], stats["odds"]).encode("ascii")
+
+
+def _sequence_body(length, seed):
+    lo, hi = _bounds(length, seed)
+    body = _chunk_body(lo, hi - lo + 1, "\n")
+    return body + b"\n" if body else body
+
+
+def _json_body(length, seed):
+    lo, hi = _bounds(length, seed)
+    return (b'{"sequence": [' + _chunk_body(lo, hi - lo + 1, ", ") +
+            _json_tail(length, seed))
+
+
+class ResultCache:
+    """Keš gotovih odgovora ograničen veličinom u bajtovima.
+
+    Kada zbir veličina odgovora pređe budžet, izbacuju se najdavnije
+    korišćeni odgovori (LRU).  Keš koristi samo petlja događaja, pa nije
+    zaključan.
+
+    Atributi:
+        max_bytes: Budžet memorije u bajtovima.
+        hits: Broj uspešnih traženja.
+        misses: Broj neuspešnih traženja.
+        evictions: Broj izbačenih odgovora.
+
+    """
+
+    def __init__(self, max_bytes=64 * 2**20):
+        """Inicijalizuj prazan keš sa zadatim budžetom memorije.
+
+        Args:
+            max_bytes (int): Najveći zbir veličina odgovora, u bajtovima.
+                Podrazumevano 64 MiB.
+
+        Raises:
+            ValueError: Ukoliko je budžet negativan.
+
+        """
+        if max_bytes < 0:
+            raise ValueError("Budžet memorije ne sme biti negativan.")
+
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = collections.OrderedDict()
+        self._bytes = 0
+
+    def get(self, key):
+        """Vrati odgovor za ključ, ili None ukoliko nije zapamćen."""
+        body = self._entries.get(key)
+        if body is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return body
+
+    def put(self, key, body):
+        """Zapamti odgovor, ukoliko nije veći od celog budžeta."""
+        if len(body) > self.max_bytes or key in self._entries:
+            return
+        self._entries[key] = body
+        self._bytes += len(body)
+        while self._bytes > self.max_bytes:
+            _, old = self._entries.popitem(last=False)
+            self._bytes -= len(old)
+            self.evictions += 1
+
+    def stats(self):
+        """Vrati statistiku keša kao dict."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+
+class Server:
+    """HTTP servis za Fibonačijeve brojeve i nizove.
+
+    Primer pokretanja iz koda::
+
+        >>> async def main():
+        ...     async with Server(workers=2) as server:
+        ...         await server.start("127.0.0.1", 8000)
+        ...         await server.serve_forever()
+
+    Atributi:
+        cache: Keš gotovih odgovora (``ResultCache``).
+        computations: Broj izračunavanja poslatih procesima.
+        coalesced: Broj zahteva koji su dobili rezultat izračunavanja
+            započetog za drugi, identičan zahtev.
+
+    Metode:
+        start: Počni da prihvataš konekcije.
+        serve_forever: Prihvataj konekcije dok se server ne zatvori.
+        close: Zatvori server i ugasi procese.
+        stats: Statistika servera i keša.
+
+    """
+
+    def __init__(self, workers=None, cache_bytes=64 * 2**20,
+                 stream_threshold=STREAM_THRESHOLD, chunk_size=CHUNK_SIZE,
+                 table=None):
+        """Inicijalizuj server, bez otvaranja porta.
+
+        Args:
+            workers (int or None): Broj procesa.  Podrazumevano None, tj.
+                broj procesora.
+            cache_bytes (int): Budžet keša odgovora, u bajtovima.
+            stream_threshold (int): Nizovi sa više brojeva od ovoga se šalju
+                u delovima.  Podrazumevano ``STREAM_THRESHOLD``.
+            chunk_size (int): Broj brojeva niza u jednom delu odgovora.
+                Podrazumevano ``CHUNK_SIZE``.
+            table (str or None): Putanja tabele unapred izračunatih brojeva
+                koja se priključuje svakom procesu, samo za čitanje.
+                Podrazumevano None.
+
+        """
+        self.cache = ResultCache(cache_bytes)
+        self.computations = 0
+        self.coalesced = 0
+
+        self._workers = workers or os.cpu_count() or 1
+        self._pool = concurrent.futures.ProcessPoolExecutor(
+            workers, initializer=fibtable.attach if table else None,
+            initargs=(table,) if table else ())
+        self._stream_threshold = stream_threshold
+        self._chunk_size = chunk_size
+        self._inflight = {}     # ključ -> future izračunavanja u toku
+        self._server = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def start(self, host="127.0.0.1", port=8000):
+        """Počni da prihvataš konekcije na zadatoj adresi.
+
+        Returns:
+            int: Port na kom server sluša (korisno kada je zadat port 0).
+
+        """
+        self._server = await asyncio.start_server(self._handle, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        """Prihvataj konekcije dok se server ne zatvori."""
+        await self._server.serve_forever()
+
+    async def close(self):
+        """Zatvori server i ugasi procese."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        # Gašenje procesa čeka da se procesi završe, pa se izvršava u niti,
+        # da ne bi blokiralo petlju događaja.
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, functools.partial(
+            self._pool.shutdown, cancel_futures=True))
+
+    def stats(self):
+        """Vrati statistiku servera i keša kao dict."""
+        return {
+            "computations": self.computations,
+            "coalesced": self.coalesced,
+            "inflight": len(self._inflight),
+            "cache": self.cache.stats(),
+        }
+
+    def _run(self, func, *args):
+        # Izvršava funkciju u procesu i vraća asyncio future rezultata.
+        self.computations += 1
+        loop = asyncio.get_running_loop()
+        return loop.run_in_executor(self._pool, func, *args)
+
+    async def _cached(self, key, func, *args):
+        # Vraća odgovor iz keša, iz izračunavanja u toku za isti ključ, ili
+        # pokreće novo izračunavanje.  Future je zaštićen od otkazivanja
+        # (asyncio.shield), da prekid jedne konekcije ne bi otkazao
+        # izračunavanje koje čekaju i drugi zahtevi.
+        body = self.cache.get(key)
+        if body is not None:
+            return body
+
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+        else:
+            future = self._run(func, *args)
+            self._inflight[key] = future
+            future.add_done_callback(lambda f: self._finish(key, f))
+        return await asyncio.shield(future)
+
+    def _finish(self, key, future):
+        # Uklanja završeno izračunavanje i pamti uspešan rezultat u kešu.
+        del self._inflight[key]
+        if not future.cancelled() and future.exception() is None:
+            self.cache.put(key, future.result())
+
+    async def _handle(self, reader, writer):
+        # Obrađuje jednu konekciju: zahteve čita jedan po jedan, dok klijent
+        # ne zatvori konekciju (HTTP/1.1 keep-alive).
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except BadRequest as e:
+                    # Posle neispravnog zahteva se konekcija zatvara, jer se
+                    # ne zna gde počinje sledeći.
+                    self._write_error(writer, e, False)
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                method, target, keep_alive = request
+                try:
+                    await self._respond(writer, method, target, keep_alive)
+                except BadRequest as e:
+                    self._write_error(writer, e, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_request(reader):
+        # Čita liniju zahteva i zaglavlja.  Vraća (metod, putanja, keep-alive)
+        # ili None ukoliko je klijent zatvorio konekciju.
+        line = await reader.readline()
+        if not line:
+            return None
+        parts = line.decode("latin-1").split()
+        if len(parts) != 3:
+            raise BadRequest("Neispravan HTTP zahtev.")
+        method, target, version = parts
+
+        keep_alive = version == "HTTP/1.1"
+        while True:
+            header = await reader.readline()
+            if header in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = header.decode("latin-1").partition(":")
+            if name.strip().lower() == "connection":
+                keep_alive = value.strip().lower() == "keep-alive"
+        return method, target, keep_alive
+
+    @staticmethod
+    def _write_head(writer, status, length, content_type, keep_alive):
+        # Upisuje statusnu liniju i zaglavlja.  Ukoliko je length None,
+        # odgovor se šalje u delovima.
+        lines = ["HTTP/1.1 {} {}".format(status, _REASONS[status]),
+                 "Content-Type: {}".format(
+                     content_type or "text/plain; charset=utf-8")]
+        if length is None:
+            lines.append("Transfer-Encoding: chunked")
+        else:
+            lines.append("Content-Length: {}".format(length))
+        if not keep_alive:
+            lines.append("Connection: close")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+
+    @classmethod
+    def _write_error(cls, writer, error, keep_alive):
+        # Upisuje odgovor sa statusom i porukom izuzetka BadRequest.
+        body = str(error).encode("utf-8")
+        cls._write_head(writer, error.status, len(body), None, keep_alive)
+        writer.write(body)
+
+    async def _respond(self, writer, method, target, keep_alive):
+        # Parsira zahtev, računa odgovor i upisuje ga.
+        if method != "GET":
+            raise BadRequest("Podržan je samo GET zahtev.", 405)
+
+        url = urllib.parse.urlsplit(target)
+        endpoint = url.path.strip("/")
+        if endpoint not in _CONTENT_TYPES:
+            raise BadRequest("Nepoznata putanja: {}".format(url.path), 404)
+        query = urllib.parse.parse_qs(url.query)
+
+        def param(name, default=None):
+            values = query.get(name)
+            if not values:
+                if default is None:
+                    raise BadRequest("Nedostaje parametar {}.".format(name))
+                return default
+            try:
+                return int(values[0])
+            except ValueError:
+                raise BadRequest("Parametar {} mora biti ceo broj."
+                                 .format(name))
+
+        try:
+            if endpoint == "nth":
+                position = param("position")
+                body = await self._cached(("nth", position), _nth_body,
+                                          position)
+            else:
+                length = param("length")
+                seed = param("seed", 0)
+                if abs(length) > self._stream_threshold:
+                    await self._stream(writer, endpoint, length, seed,
+                                       keep_alive)
+                    return
+                func = _json_body if endpoint == "json" else _sequence_body
+                body = await self._cached((endpoint, length, seed), func,
+                                          length, seed)
+        except ValueError as e:
+            raise BadRequest(str(e))
+
+        self._write_head(writer, 200, len(body), _CONTENT_TYPES[endpoint],
+                         keep_alive)
+        writer.write(body)
+
+    async def _stream(self, writer, endpoint, length, seed, keep_alive):
+        # Šalje dugačak niz u delovima.  Delovi se računaju u procesima, a
+        # istovremeno se računa najviše po jedan deo za svaki proces, dok
+        # writer.drain() zaustavlja računanje kada klijent ne stiže da čita.
+        lo, hi = await self._run(_bounds, length, seed)
+        separator = ", " if endpoint == "json" else "\n"
+
+        def submit(start):
+            return self._run(_chunk_body, start,
+                             min(self._chunk_size, hi + 1 - start), separator)
+
+        self._write_head(writer, 200, None, _CONTENT_TYPES[endpoint],
+                         keep_alive)
+        tail = None
+        if endpoint == "json":
+            self._write_chunk(writer, b'{"sequence": [')
+            tail = self._run(_json_tail, length, seed)
+
+        starts = iter(range(lo, hi + 1, self._chunk_size))
+        pending = collections.deque(
+            submit(start) for start in itertools.islice(starts, self._workers))
+        try:
+            first = True
+            while pending:
+                data = await pending.popleft()
+                for start in itertools.islice(starts, 1):
+                    pending.append(submit(start))
+                if endpoint == "json":
+                    self._write_chunk(writer, data if first else b", " + data)
+                else:
+                    self._write_chunk(writer, data + b"\n")
+                first = False
+                await writer.drain()
+
+            if tail is not None:
+                self._write_chunk(writer, await tail)
+        finally:
+            for future in itertools.chain(pending, [tail]):
+                if future is not None:
+                    future.cancel()
+        writer.write(b"0\r\n\r\n")
+
+    @staticmethod
+    def _write_chunk(writer, data):
+        # Upisuje jedan deo odgovora u formatu "chunked" kodiranja.
+        writer.write(b"%x\r\n%s\r\n" % (len(data), data))
+
+
+async def _main(args):
+    async with Server(args.workers, args.cache_bytes,
+                      table=args.table) as server:
+        port = await server.start(args.host, args.port)
+        print("merifib: http://{}:{}/".format(args.host, port), flush=True)
+        await server.serve_forever()
+
+
+def main(argv=None):
+    """Pokreni server iz komandne linije."""
+    parser = argparse.ArgumentParser(
+        prog="merifib.server",
+        description="HTTP servis za Fibonačijeve brojeve i nizove.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Broj procesa (podrazumevano broj procesora).")
+    parser.add_argument("--cache-bytes", type=int, default=64 * 2**20,
+                        help="Budžet keša odgovora, u bajtovima.")
+    parser.add_argument("--table", default=None,
+                        help="Tabela unapred izračunatih brojeva (videti "
+                             "merifib.table).")
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(_main(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
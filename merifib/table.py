@@ -0,0 +1,370 @@
+"""Modul implementira trajnu tabelu unapred izračunatih Fibonačijevih brojeva.
+
+Tabela čuva brojeve F(0), F(1), ..., F(n-1) na disku, tako da ih procesi
+posle ponovnog pokretanja ne računaju ponovo.  Tabela je priključena
+procesu funkcijom ``attach``, i tada metodi klase ``Fibonacci`` (``nth``,
+``sequence`` i ostali koji koriste skok do početka niza) čitaju pokrivene
+brojeve direktno iz nje, a van pokrivenog opsega računaju kao i inače::
+
+    >>> from merifib import table
+    >>> t = table.attach("fib.tbl", append=True)
+    >>> t.extend(10**5)             # Jednom, npr. pri instalaciji.
+    >>> Fibonacci.nth(50000) == t.get(49999)
+    True
+
+Tabela se sastoji od dva fajla u koje se samo dopisuje:
+
+    ``<putanja>``:
+        apsolutne vrednosti brojeva (little-endian), jedna za drugom
+    ``<putanja>.idx``:
+        zaglavlje (16 bajtova: magični broj b"MFTB", verzija uint16,
+        rezervisano), a zatim za svaki broj uint64 pomeraj kraja njegovih
+        bajtova u fajlu podataka
+
+Broj brojeva u tabeli se izračunava iz dužine indeksa, a podaci se
+dopisuju pre indeksa, tako da čitaoci nikada ne vide nepotpun broj, a
+prekinuto dopisivanje ne kvari tabelu.  Fajlovi se čitaju pomoću ``mmap``,
+pa svi procesi koji su priključili istu tabelu dele iste stranice memorije
+(keš stranica operativnog sistema), umesto da svaki drži svoju kopiju.
+Kada neki proces dopiše brojeve, ostali ih vide pri sledećem čitanju van
+opsega koji poznaju.
+
+Dopisuje se samo ako je tabela priključena sa ``append=True``, i to samo
+nizom bez praznina: ``extend`` i ``Fibonacci.sequence`` (za niz koji se
+nastavlja na kraj tabele).  ``Fibonacci.nth`` van tabele ne dopisuje, jer bi
+za to morao da izračuna i sve brojeve ispred traženog.  Dopisivanje iz više
+procesa se zaključava pomoću ``fcntl.flock`` (na sistemima bez modula
+``fcntl`` samo unutar procesa).
+
+"""
+
+import mmap
+import os
+import struct
+import threading
+
+from merifib.binary import _sign, magnitude_bytes
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+MAGIC = b"MFTB"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sH10x")
+_OFFSET = struct.Struct("<Q")
+
+# Broj brojeva koji se u metodu extend izračunavaju pre jednog dopisivanja.
+_BATCH = 1024
+
+
+class Table:
+    """Tabela brojeva F(0) .. F(n-1) u fajlovima na disku.
+
+    Svi metodi su bezbedni za korišćenje iz više niti.
+
+    Atributi:
+        path: Putanja fajla podataka (indeks je ``path + ".idx"``).
+        writable: Da li se u tabelu može dopisivati.
+
+    Metode:
+        get: Vraća F(k) iz tabele.
+        pair: Vraća par (F(n), F(n+1)) iz tabele.
+        window: Vraća brojeve F(lo) .. F(hi) iz tabele.
+        append: Dopisuje brojeve koji nastavljaju tabelu.
+        extend: Dopisuje brojeve dok tabela ne sadrži zadati broj brojeva.
+        close: Zatvara fajlove.
+
+    """
+
+    def __init__(self, path, append=False):
+        """Otvori tabelu, i napravi je ako ne postoji a ``append`` je tačno.
+
+        Args:
+            path (str or os.PathLike): Putanja fajla podataka.
+            append (bool): Da li se u tabelu može dopisivati.  Podrazumevana
+                vrednost je False.
+
+        Raises:
+            FileNotFoundError: Ukoliko tabela ne postoji, a ``append`` nije
+                tačno.
+            ValueError: Ukoliko fajl nije tabela u ovom formatu.
+
+        """
+        self.path = os.fspath(path)
+        self.writable = append
+
+        flags = os.O_RDWR | os.O_CREAT if append else os.O_RDONLY
+        self._index_fd = os.open(self.path + ".idx", flags, 0o644)
+        try:
+            self._data_fd = os.open(self.path, flags, 0o644)
+        except OSError:
+            os.close(self._index_fd)
+            raise
+
+        self._lock = threading.Lock()
+        # Stanje se menja jednom dodelom (broj brojeva, mapa indeksa, mapa
+        # podataka), pa ga čitaoci čitaju bez zaključavanja.  Stare mape se
+        # ne zatvaraju eksplicitno, već kada više nisu u upotrebi.
+        self._state = (0, None, None)
+
+        try:
+            with self._locked():
+                if append and os.fstat(self._index_fd).st_size == 0:
+                    os.write(self._index_fd, _HEADER.pack(MAGIC, VERSION))
+                header = os.pread(self._index_fd, _HEADER.size, 0)
+            if len(header) < _HEADER.size or \
+                    _HEADER.unpack(header) != (MAGIC, VERSION):
+                raise ValueError("Fajl nije tabela Fibonačijevih brojeva.")
+            self._refresh()
+        except Exception:
+            self.close()
+            raise
+
+    def _locked(self):
+        # Vraća kontekst koji zaključava tabelu u ovom procesu i, ako je
+        # moguće, između procesa.
+        return _Lock(self._lock, self._index_fd if fcntl else None)
+
+    def _refresh(self):
+        # Ponovo mapira fajlove ukoliko je neki proces dopisao brojeve.
+        #
+        # Vraća:
+        #   tuple: Trenutno stanje (broj brojeva, mapa indeksa, mapa
+        #     podataka).
+        size = os.fstat(self._index_fd).st_size
+        count = max(0, (size - _HEADER.size) // _OFFSET.size)
+        state = self._state
+        if count == state[0]:
+            return state
+
+        index = mmap.mmap(self._index_fd, _HEADER.size + count*_OFFSET.size,
+                          access=mmap.ACCESS_READ)
+        end = _OFFSET.unpack_from(index, _HEADER.size +
+                                  (count - 1)*_OFFSET.size)[0]
+        data = (mmap.mmap(self._data_fd, end, access=mmap.ACCESS_READ)
+                if end else None)
+        self._state = state = (count, index, data)
+        return state
+
+    def _covering(self, n):
+        # Vraća stanje koje sadrži F(n), ponovo mapirajući fajlove ako je
+        # potrebno, ili None.
+        state = self._state
+        if n < state[0]:
+            return state
+        if self._index_fd is None:
+            return None
+        state = self._refresh()
+        return state if n < state[0] else None
+
+    @staticmethod
+    def _magnitude(state, k):
+        # Vraća |F(k)| iz stanja tabele, za 0 <= k < broj brojeva.
+        _, index, data = state
+        begin = (_OFFSET.unpack_from(index, _HEADER.size +
+                                     (k - 1)*_OFFSET.size)[0] if k else 0)
+        end = _OFFSET.unpack_from(index, _HEADER.size + k*_OFFSET.size)[0]
+        if begin == end:
+            return 0
+        with memoryview(data)[begin:end] as view:
+            return int.from_bytes(view, "little")
+
+    def __len__(self):
+        """Broj brojeva u tabeli."""
+        return self._refresh()[0] if self._index_fd is not None else 0
+
+    def get(self, k):
+        """Vrati F(k) iz tabele, ili None ukoliko |k| nije manje od broja
+        brojeva u tabeli.  Važi i za negativne indekse."""
+        state = self._covering(abs(k))
+        if state is None:
+            return None
+        return _sign(k) * self._magnitude(state, abs(k))
+
+    def pair(self, n):
+        """Vrati par (F(n), F(n+1)) iz tabele, za n >= 0, ili None ukoliko
+        tabela ne sadrži oba broja."""
+        state = self._covering(n + 1)
+        if state is None:
+            return None
+        return self._magnitude(state, n), self._magnitude(state, n + 1)
+
+    def window(self, lo, hi):
+        """Vrati listu brojeva F(lo) .. F(hi), ili None ukoliko ih tabela ne
+        sadrži sve.  Važi i za negativne indekse."""
+        state = self._covering(max(abs(lo), abs(hi)))
+        if state is None:
+            return None
+        return [_sign(k) * self._magnitude(state, abs(k))
+                for k in range(lo, hi + 1)]
+
+    def append(self, lo, values):
+        """Dopiši brojeve F(lo), F(lo+1), ... koji nastavljaju tabelu.
+
+        Dopisuju se samo brojevi sa indeksima od trenutnog broja brojeva u
+        tabeli naviše.  Ukoliko brojevi ne nastavljaju tabelu (postoji
+        praznina između kraja tabele i indeksa ``lo``), ništa se ne dopisuje.
+
+        Args:
+            lo (int): Indeks prvog broja.
+            values (list): Brojevi F(lo), F(lo+1), ..., redom.
+
+        Returns:
+            int: Broj dopisanih brojeva.
+
+        Raises:
+            ValueError: Ukoliko tabela nije otvorena za dopisivanje.
+
+        """
+        if not self.writable:
+            raise ValueError("Tabela nije otvorena za dopisivanje.")
+
+        with self._locked():
+            count, index, _ = self._refresh()
+            if not lo <= count < lo + len(values):
+                return 0
+
+            # Prekinuto dopisivanje može ostaviti višak podataka ili deo
+            # pomeraja na kraju fajlova; odbacujemo ih.
+            end = (_OFFSET.unpack_from(index, _HEADER.size +
+                                       (count - 1)*_OFFSET.size)[0]
+                   if count else 0)
+            os.ftruncate(self._data_fd, end)
+            os.ftruncate(self._index_fd, _HEADER.size + count*_OFFSET.size)
+
+            data = []
+            offsets = []
+            for value in values[count - lo:]:
+                data.append(magnitude_bytes(value))
+                end += len(data[-1])
+                offsets.append(_OFFSET.pack(end))
+
+            # Podaci pre indeksa: čitaoci vide broj tek kada je ceo zapisan.
+            _write_all(self._data_fd, b"".join(data))
+            _write_all(self._index_fd, b"".join(offsets))
+            self._refresh()
+            return len(offsets)
+
+    def extend(self, n):
+        """Izračunaj i dopiši brojeve dok tabela ne sadrži F(0) .. F(n-1).
+
+        Računa se sabiranjem od poslednja dva broja u tabeli, a dopisuje se
+        u delovima, tako da je tabela upotrebljiva i tokom dopisivanja.
+
+        Raises:
+            ValueError: Ukoliko tabela nije otvorena za dopisivanje.
+
+        """
+        if not self.writable:
+            raise ValueError("Tabela nije otvorena za dopisivanje.")
+
+        count = len(self)
+        if count >= n:
+            return
+        if count >= 2:
+            k = count - 2
+            a, b = self.pair(k)
+        else:
+            k = 0
+            a, b = 0, 1
+
+        # U svakom delu su prva dva broja, F(k) i F(k+1), već u tabeli (osim
+        # na početku), pa append dopisuje samo nove.
+        while True:
+            values = [a, b]
+            while len(values) < _BATCH and k + len(values) < n:
+                a, b = b, a + b
+                values.append(b)
+            values = values[:n - k]
+            self.append(k, values)
+            if k + len(values) >= n:
+                return
+            k += len(values) - 2
+            a, b = values[-2], values[-1]
+
+    def close(self):
+        """Zatvori fajlove tabele."""
+        for name in ("_index_fd", "_data_fd"):
+            fd = getattr(self, name, None)
+            if fd is not None:
+                os.close(fd)
+                setattr(self, name, None)
+        self._state = (0, None, None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return "Table({!r}, append={})".format(self.path, self.writable)
+
+
+class _Lock:
+    # Kontekst koji zaključava threading.Lock i, ukoliko je zadat deskriptor
+    # fajla, fcntl.flock nad njim.
+
+    def __init__(self, lock, fd):
+        self._lock = lock
+        self._fd = fd
+
+    def __enter__(self):
+        self._lock.acquire()
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+
+    def __exit__(self, *exc_info):
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self._lock.release()
+
+
+def _write_all(fd, data):
+    # Upisuje sve bajtove na kraj fajla (os.write može upisati manje).
+    os.lseek(fd, 0, os.SEEK_END)
+    with memoryview(data) as view:
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+
+
+_attached = None
+
+
+def attach(path, append=False):
+    """Priključi tabelu procesu (videti opis modula).
+
+    Prethodno priključena tabela se zatvara.
+
+    Args:
+        path (str or os.PathLike): Putanja fajla podataka tabele.
+        append (bool): Da li se u tabelu dopisuju novi brojevi.
+
+    Returns:
+        Table: Priključena tabela.
+
+    """
+    global _attached
+    table = Table(path, append)
+    previous, _attached = _attached, table
+    if previous is not None:
+        previous.close()
+    return table
+
+
+def detach():
+    """Zatvori priključenu tabelu, ukoliko postoji."""
+    global _attached
+    previous, _attached = _attached, None
+    if previous is not None:
+        previous.close()
+
+
+def attached():
+    """Vrati priključenu tabelu, ili None."""
+    return _attached
@@ -0,0 +1,203 @@
+"""Modul implementira izvršavanje dugih izračunavanja u pozadinskoj niti.
+
+Namenjen je korisničkom interfejsu: izračunavanje se izvršava u posebnoj
+niti, a rezultati, greške i napredak se kroz red (``queue.Queue``) vraćaju
+glavnoj niti, koja red periodično prazni pomoću ``after`` metoda Tk vidžeta.
+Modul ne zavisi od tkinter biblioteke, dovoljan je bilo koji objekat sa
+metodima ``after`` i ``after_cancel``.
+
+"""
+
+import queue
+import threading
+
+
+class Cancelled(Exception):
+    """Izuzetak kojim izračunavanje prekida rad kada je otkazano."""
+
+
+class Job:
+    """Kontekst jednog izračunavanja, prosleđuje se funkciji koja računa.
+
+    Funkcija treba povremeno da poziva ``check`` (koji podiže izuzetak
+    ``Cancelled`` ukoliko je izračunavanje otkazano ili zamenjeno novijim) i
+    po želji ``progress`` sa udelom završenog posla između 0 i 1.
+
+    """
+
+    def __init__(self, job_id, results):
+        self.id = job_id
+        self._results = results
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """Otkaži izračunavanje."""
+        self._cancelled.set()
+
+    @property
+    def cancelled(self):
+        """Da li je izračunavanje otkazano."""
+        return self._cancelled.is_set()
+
+    def check(self):
+        """Podigni ``Cancelled`` ukoliko je izračunavanje otkazano."""
+        if self._cancelled.is_set():
+            raise Cancelled()
+
+    def progress(self, fraction):
+        """Prijavi udeo završenog posla, između 0 i 1."""
+        self._results.put((self.id, "progress", fraction))
+
+
+class BackgroundTask:
+    """Izvršava izračunavanja jedno po jedno u pozadinskoj niti.
+
+    Zadaje se funkcija koja prima ``Job`` i vraća rezultat, i funkcije koje
+    se pozivaju u glavnoj niti kada je rezultat gotov, kada dođe do greške,
+    ili kada se prijavi napredak.  Ukoliko se novo izračunavanje zada dok
+    prethodno još traje ili čeka, prethodno se otkazuje, tako da se
+    ponovljeni klikovi svode na samo poslednji zahtev.  Rezultati otkazanih
+    izračunavanja se odbacuju.
+
+    Atributi:
+        POLL_MS: Interval u milisekundama na koji glavna nit proverava red
+            sa rezultatima.
+
+    """
+
+    POLL_MS = 50
+
+    def __init__(self, widget):
+        """Pokreni pozadinsku nit i periodičnu proveru rezultata.
+
+        Args:
+            widget: Tk vidžet (ili bilo koji objekat sa metodima ``after`` i
+                ``after_cancel``) preko kog se zakazuje provera rezultata u
+                glavnoj niti.
+
+        """
+        self._widget = widget
+        self._results = queue.Queue()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._job_id = 0
+        self._pending = None    # (Job, funkcija) koji čeka na izvršavanje.
+        self._current = None    # Job koji se trenutno izvršava.
+        self._callbacks = {}    # id -> (on_done, on_error, on_progress)
+        self._closed = False
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self._after_id = self._widget.after(self.POLL_MS, self._poll)
+
+    def submit(self, func, on_done, on_error=None, on_progress=None):
+        """Zadaj novo izračunavanje, otkazujući prethodno.
+
+        Args:
+            func (callable): Funkcija koja prima ``Job`` i vraća rezultat.
+                Izvršava se u pozadinskoj niti.
+            on_done (callable): Poziva se sa rezultatom, u glavnoj niti.
+            on_error (callable or None): Poziva se sa izuzetkom koji je
+                podigla funkcija ``func``, u glavnoj niti.
+            on_progress (callable or None): Poziva se sa udelom završenog
+                posla, u glavnoj niti.
+
+        Returns:
+            Job: Kontekst zadatog izračunavanja.
+
+        """
+        with self._lock:
+            self._cancel_locked()
+            self._job_id += 1
+            job = Job(self._job_id, self._results)
+            self._pending = (job, func)
+            self._callbacks = {job.id: (on_done, on_error, on_progress)}
+            self._wakeup.set()
+        return job
+
+    def cancel(self):
+        """Otkaži izračunavanje koje traje ili čeka, ukoliko postoji."""
+        with self._lock:
+            self._cancel_locked()
+            self._callbacks = {}
+
+    def _cancel_locked(self):
+        # Otkazuje tekuće i zakazano izračunavanje.  Poziva se sa
+        # zaključanim self._lock.
+        if self._current is not None:
+            self._current.cancel()
+        if self._pending is not None:
+            self._pending[0].cancel()
+            self._pending = None
+
+    @property
+    def busy(self):
+        """Da li izračunavanje traje ili čeka."""
+        with self._lock:
+            return self._pending is not None or self._current is not None
+
+    def close(self):
+        """Otkaži izračunavanje i zaustavi pozadinsku nit i proveru
+        rezultata."""
+        with self._lock:
+            self._cancel_locked()
+            self._callbacks = {}
+            self._closed = True
+            self._wakeup.set()
+        if self._after_id is not None:
+            self._widget.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _run(self):
+        # Petlja pozadinske niti: čeka zadato izračunavanje, izvršava ga i
+        # rezultat stavlja u red.
+        while True:
+            self._wakeup.wait()
+            with self._lock:
+                if self._closed:
+                    return
+                self._wakeup.clear()
+                if self._pending is None:
+                    continue
+                job, func = self._pending
+                self._pending = None
+                self._current = job
+
+            try:
+                result = func(job)
+            except Cancelled:
+                pass
+            except Exception as e:
+                self._results.put((job.id, "error", e))
+            else:
+                self._results.put((job.id, "done", result))
+            finally:
+                with self._lock:
+                    self._current = None
+
+    def _poll(self):
+        # Prazni red sa rezultatima u glavnoj niti i poziva odgovarajuće
+        # funkcije.  Rezultati otkazanih izračunavanja se odbacuju.
+        while True:
+            try:
+                job_id, kind, payload = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            with self._lock:
+                callbacks = self._callbacks.get(job_id)
+                if callbacks is not None and kind != "progress":
+                    del self._callbacks[job_id]
+            if callbacks is None:
+                continue
+
+            on_done, on_error, on_progress = callbacks
+            if kind == "done":
+                on_done(payload)
+            elif kind == "error" and on_error is not None:
+                on_error(payload)
+            elif kind == "progress" and on_progress is not None:
+                on_progress(payload)
+
+        if not self._closed:
+            self._after_id = self._widget.after(self.POLL_MS, self._poll)
@@ -0,0 +1,221 @@
+"""Modul implementira lenji pogled na Fibonačijev niz.
+
+Pogled (``SequenceView``) se ponaša kao nepromenljiva sekvenca Pythona
+(``len``, indeksiranje, isecanje, iteracija, ``in``), ali ne čuva brojeve,
+već ih računa tek kada su traženi: pojedinačan broj se dobija skokom u
+O(log(n)) koraka, isečak je novi pogled bez računanja brojeva ispred njega,
+a iteracija se može ponavljati proizvoljan broj puta::
+
+    >>> v = Fibonacci(10**7).view()
+    >>> len(v)
+    10000000
+    >>> v[-1] == Fibonacci.nth(10**7)
+    True
+    >>> w = v[10**6:10**6 + 100:3]   # Ništa se ne računa.
+    >>> len(w), w[0] == Fibonacci.nth(10**6 + 1)
+    (34, True)
+
+Pogled niza bez dužine je beskonačan: nema dužinu, ne može se indeksirati
+od kraja, a isečak bez kraja je ponovo beskonačan pogled.
+
+"""
+
+import collections.abc
+import itertools
+
+from merifib.fibonacci import (Fibonacci, _STEP_LIMIT, _fib_add, _fib_index,
+                               _fib_signed, _signed_pair)
+
+
+class SequenceView(collections.abc.Sequence):
+    """Lenji pogled na brojeve F(start), F(start+step), F(start+2*step), ...
+
+    Pogled se obično dobija metodom ``Fibonacci.view``, a isecanjem pogleda
+    se dobijaju novi pogledi.
+
+    Atributi:
+        start: Indeks u nizu prvog broja pogleda.
+        step: Razlika indeksa uzastopnih brojeva pogleda.
+        length: Broj brojeva pogleda, ili None za beskonačan pogled.
+
+    """
+
+    def __init__(self, start, length=None, step=1):
+        """Inicijalizuj pogled.
+
+        Args:
+            start (int): Indeks u nizu prvog broja.
+            length (int or None): Broj brojeva, ili None za beskonačan
+                pogled.
+            step (int): Razlika indeksa uzastopnih brojeva, različita od 0.
+
+        Raises:
+            ValueError: Ukoliko je korak 0, ili je broj brojeva negativan.
+
+        """
+        if step == 0:
+            raise ValueError("Korak mora biti različit od 0.")
+        if length is not None and length < 0:
+            raise ValueError("Broj brojeva ne sme biti negativan.")
+
+        self.start = start
+        self.length = length
+        self.step = step
+
+    def __len__(self):
+        if self.length is None:
+            raise TypeError("Beskonačan niz nema dužinu.")
+        return self.length
+
+    def __bool__(self):
+        return self.length is None or self.length > 0
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self._slice(key)
+
+        i = key.__index__()
+        if i < 0:
+            if self.length is None:
+                raise IndexError("Beskonačan niz se ne može indeksirati od "
+                                 "kraja.")
+            i += self.length
+        if i < 0 or (self.length is not None and i >= self.length):
+            raise IndexError("Indeks van opsega niza.")
+        return _fib_signed(self.start + i * self.step)
+
+    def _slice(self, key):
+        # Vraća isečak kao novi pogled.  Za konačan pogled semantiku
+        # isecanja (negativne granice, korak) prepuštamo objektu range, a
+        # zatim pozicije u pogledu pretvaramo u indekse niza.
+        if self.length is not None:
+            r = range(self.length)[key]
+            return SequenceView(self.start + r.start * self.step, len(r),
+                                self.step * r.step)
+
+        first = 0 if key.start is None else key.start.__index__()
+        step = 1 if key.step is None else key.step.__index__()
+        if first < 0 or step <= 0:
+            raise ValueError("Beskonačan niz se može seći samo od početka, "
+                             "sa pozitivnim korakom.")
+
+        start = self.start + first * self.step
+        if key.stop is None:
+            return SequenceView(start, None, self.step * step)
+
+        stop = key.stop.__index__()
+        if stop < 0:
+            raise ValueError("Beskonačan niz se ne može seći od kraja.")
+        return SequenceView(start, len(range(first, stop, step)),
+                            self.step * step)
+
+    def __iter__(self):
+        # Svaki poziv vraća novi generator, pa se iteracija može ponavljati.
+        return self._generator(self.start, self.length, self.step)
+
+    def __reversed__(self):
+        if self.length is None:
+            raise TypeError("Beskonačan niz se ne može obrnuti.")
+        return iter(self[::-1])
+
+    @staticmethod
+    def _generator(start, length, step):
+        # Pomoćni generator za __iter__().  Do prvog broja dolazi skokom, a
+        # zatim za mali korak sabira (ili oduzima, unazad) susedne brojeve,
+        # a za veliki skače pomoću para (F(step), F(step+1)).
+        #
+        # Argumenti:
+        #   start (int): Indeks prvog broja.
+        #   length (int or None): Broj brojeva, ili None.
+        #   step (int): Razlika indeksa uzastopnih brojeva.
+        #
+        # Vraća:
+        #   int: Sledeći broj pogleda.
+        if length == 0:
+            return
+
+        a, b = _signed_pair(start)
+        if step == 1:
+            yield from itertools.islice(Fibonacci._generator_seq(a, b),
+                                        length)
+            return
+        if step == -1:
+            yield from itertools.islice(
+                Fibonacci._generator_seq_back(a, b - a), length)
+            return
+
+        positions = itertools.count() if length is None else range(length)
+        if abs(step) <= _STEP_LIMIT:
+            for _ in positions:
+                yield a
+                if step > 0:
+                    for _ in range(step):
+                        a, b = b, a + b
+                else:
+                    for _ in range(-step):
+                        a, b = b - a, a
+        else:
+            pair, jump = (a, b), _signed_pair(step)
+            for _ in positions:
+                yield pair[0]
+                pair = _fib_add(pair, jump)
+
+    def _indices_of(self, value):
+        # Vraća indekse niza na kojima je broj jednak value (najviše četiri:
+        # 1 = F(1) = F(2) = F(-1), a F(-k) = ±F(k)).
+        if value == 0:
+            return [0]
+        k = _fib_index(abs(value))
+        if k is None:
+            return []
+        candidates = {k, -k, 1, 2, -1, -2} if abs(value) == 1 else {k, -k}
+        return sorted(n for n in candidates if _fib_signed(n) == value)
+
+    def _position(self, n):
+        # Vraća poziciju indeksa niza n u pogledu, ili None.
+        offset, rest = divmod(n - self.start, self.step)
+        if rest or offset < 0 or (self.length is not None and
+                                  offset >= self.length):
+            return None
+        return offset
+
+    def __contains__(self, value):
+        if not isinstance(value, int):
+            return False
+        return any(self._position(n) is not None
+                   for n in self._indices_of(value))
+
+    def index(self, value, start=0, stop=None):
+        """Vrati prvu poziciju broja u pogledu, u O(log(n)) koraka.
+
+        Granice ``start`` i ``stop`` imaju isto značenje kao u metodu
+        ``list.index``.
+
+        Raises:
+            ValueError: Ukoliko broj nije u pogledu (između ``start`` i
+                ``stop``).
+
+        """
+        if self.length is not None:
+            allowed = range(self.length)[start:stop]
+        else:
+            allowed = range(start, stop) if stop is not None else None
+        for p in self._positions(value):
+            if allowed is None and p >= start or allowed and p in allowed:
+                return p
+        raise ValueError("Broj nije u nizu.")
+
+    def count(self, value):
+        """Vrati broj pojavljivanja broja u pogledu, u O(log(n)) koraka."""
+        return len(self._positions(value))
+
+    def _positions(self, value):
+        # Vraća sortirane pozicije broja u pogledu.
+        if not isinstance(value, int):
+            return []
+        positions = (self._position(n) for n in self._indices_of(value))
+        return sorted(p for p in positions if p is not None)
+
+    def __repr__(self):
+        return "SequenceView(start={}, length={}, step={})".format(
+            self.start, self.length, self.step)
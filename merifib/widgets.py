@@ -0,0 +1,148 @@
+"""Modul implementira vidžete za prikaz velikih rezultata u korisničkom
+interfejsu.
+
+Niz od više hiljada brojeva, ili broj od više desetina hiljada cifara, nije
+moguće prikazati u ``ttk.Label`` vidžetu bez velikog usporenja, zato se
+nizovi prikazuju listom koja iscrtava samo vidljive redove, a brojevi se
+skraćuju na zadati broj cifara i prikazuju celi tek na zahtev.
+
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+from merifib.formatting import format_number, to_str
+
+
+def show_number(parent, number, title="Ceo broj"):
+    """Prikaži ceo broj u posebnom prozoru sa klizačem."""
+    win = tk.Toplevel(parent)
+    win.title(title)
+    win.columnconfigure(0, weight=1)
+    win.rowconfigure(0, weight=1)
+
+    text = tk.Text(win, wrap="char", width=80, height=20)
+    scroll = ttk.Scrollbar(win, orient=tk.VERTICAL, command=text.yview)
+    text.configure(yscrollcommand=scroll.set)
+    text.grid(column=0, row=0, sticky=tk.N+tk.W+tk.E+tk.S)
+    scroll.grid(column=1, row=0, sticky=tk.N+tk.S)
+
+    text.insert("1.0", to_str(number))
+    text.configure(state="disabled")
+
+
+class VirtualList(ttk.Frame):
+    """Lista brojeva koja iscrtava samo vidljive redove.
+
+    Lista ne čuva brojeve, već ih za vidljive redove traži od funkcije
+    ``fetch(first, count)``, koja vraća ``count`` brojeva počevši od reda
+    ``first``.  Brojevi se prikazuju skraćeni na ``digits`` cifara, a dvoklik
+    na red otvara prozor sa celim brojem.
+
+    Atributi:
+        digits: Najveći broj prikazanih cifara jednog broja.
+
+    """
+
+    def __init__(self, parent, rows=15, digits=60, width=80):
+        """Inicijalizuj praznu listu.
+
+        Args:
+            parent: Roditeljski vidžet.
+            rows (int): Broj vidljivih redova.
+            digits (int): Najveći broj prikazanih cifara jednog broja.
+            width (int): Širina liste u karakterima.
+
+        """
+        super().__init__(parent)
+        self.digits = digits
+
+        self._rows = rows
+        self._count = 0
+        self._first = 0
+        self._offset = 0
+        self._fetch = None
+        self._visible = []
+
+        self.columnconfigure(0, weight=1)
+        self._text = tk.Text(self, height=rows, width=width, wrap="none",
+                             state="disabled", cursor="arrow")
+        self._scroll = ttk.Scrollbar(self, orient=tk.VERTICAL,
+                                     command=self._on_scroll)
+        self._text.grid(column=0, row=0, sticky=tk.N+tk.W+tk.E+tk.S)
+        self._scroll.grid(column=1, row=0, sticky=tk.N+tk.S)
+
+        self._text.bind("<MouseWheel>", self._on_wheel)
+        self._text.bind("<Button-4>", lambda e: self._scroll_by(-3))
+        self._text.bind("<Button-5>", lambda e: self._scroll_by(3))
+        self._text.bind("<Double-Button-1>", self._on_double_click)
+
+    def set_source(self, count, fetch, offset=0):
+        """Zadaj brojeve koji se prikazuju.
+
+        Args:
+            count (int): Ukupan broj redova.
+            fetch (callable): Funkcija ``fetch(first, count)`` koja vraća
+                listu brojeva za redove od ``first``.
+            offset (int): Indeks u nizu prvog reda, za oznake redova
+                (``F(offset)``, ``F(offset+1)``, ...).
+
+        """
+        self._count = count
+        self._fetch = fetch
+        self._offset = offset
+        self._first = 0
+        self._render()
+
+    def clear(self):
+        """Isprazni listu."""
+        self.set_source(0, None)
+
+    def _on_scroll(self, action, value, unit=None):
+        # Obrađuje komande klizača: "moveto <udeo>" i "scroll <n> units|pages".
+        if action == "moveto":
+            self._first = int(float(value) * self._count)
+            self._render()
+        elif action == "scroll":
+            step = self._rows if unit == "pages" else 1
+            self._scroll_by(int(value) * step)
+
+    def _on_wheel(self, event):
+        self._scroll_by(-3 if event.delta > 0 else 3)
+
+    def _scroll_by(self, rows):
+        self._first += rows
+        self._render()
+
+    def _on_double_click(self, event):
+        line = int(self._text.index("@{},{}".format(event.x, event.y))
+                   .split(".")[0])
+        if 1 <= line <= len(self._visible):
+            show_number(self, self._visible[line-1],
+                        "F({})".format(self._offset + self._first + line - 1))
+
+    def _render(self):
+        # Traži brojeve za vidljive redove i iscrtava ih.
+        self._first = max(0, min(self._first, self._count - self._rows))
+        visible = min(self._rows, self._count)
+        if self._fetch is None or visible == 0:
+            self._visible = []
+        else:
+            self._visible = self._fetch(self._first, visible)
+
+        lines = [
+            "F({}) = {}".format(self._offset + self._first + i,
+                                format_number(number, self.digits))
+            for i, number in enumerate(self._visible)
+        ]
+
+        self._text.configure(state="normal")
+        self._text.delete("1.0", tk.END)
+        self._text.insert("1.0", "\n".join(lines))
+        self._text.configure(state="disabled")
+
+        if self._count:
+            self._scroll.set(self._first / self._count,
+                             (self._first + visible) / self._count)
+        else:
+            self._scroll.set(0, 1)
@@ -0,0 +1,95 @@
+import asyncio
+import concurrent.futures
+import itertools
+import pickle
+
+import pytest
+
+from merifib import aio
+from merifib.fibonacci import Fibonacci
+
+
+async def collect(batches, limit=None):
+    # Consume up to limit batches.
+    result = []
+    async with batches:
+        async for batch in batches:
+            result.append(batch)
+            if limit is not None and len(result) == limit:
+                break
+    return result
+
+
+class TestAsyncBatches:
+
+    def test_window(self):
+        for length, seed in ((1, 0), (25, 0), (1000, 89), (-1000, 5)):
+            f = Fibonacci(length, seed)
+            batches = asyncio.run(collect(f.aiter_batches(batch_size=64)))
+            assert list(itertools.chain(*batches)) == f.sequence()
+            assert all(len(b) == 64 for b in batches[:-1])
+
+    def test_resume(self):
+        # Stop an infinite iteration, serialize the checkpoint, and resume
+        # from it with a fresh iterator.
+        f = Fibonacci(seed=13)
+        batches = f.aiter_batches(batch_size=10)
+        first = asyncio.run(collect(batches, limit=3))
+        checkpoint = batches.checkpoint
+        assert checkpoint.index == f.index + 30
+        assert batches.remaining is None
+
+        data = checkpoint.to_json()
+        assert aio.Checkpoint.from_json(data) == checkpoint
+        assert pickle.loads(pickle.dumps(checkpoint)) == checkpoint
+
+        resumed = aio.AsyncBatches(aio.Checkpoint.from_json(data),
+                                   batch_size=7)
+        rest = asyncio.run(collect(resumed, limit=2))
+        expected = list(itertools.islice(f.iter_sequence(), 44))
+        assert list(itertools.chain(*first, *rest)) == expected
+
+        # Negative indices resume as well.
+        c = aio.Checkpoint.at(-5)
+        assert c == (-5, 5, -3)
+        assert aio.Checkpoint.from_json(c.to_json()) == c
+
+    def test_backpressure(self):
+        async def main():
+            batches = Fibonacci().aiter_batches(batch_size=5, queue_size=2)
+            async with batches:
+                await batches.__anext__()
+                for _ in range(20):
+                    await asyncio.sleep(0)
+                # The producer waits once the queue is full.
+                assert batches._queue.full()
+                assert batches._queue.qsize() == 2
+            assert batches._task.done()
+            with pytest.raises(StopAsyncIteration):
+                await batches.__anext__()
+
+        asyncio.run(main())
+
+    def test_executor(self, monkeypatch):
+        monkeypatch.setattr(aio, "OFFLOAD_BITS", 0)
+        submitted = []
+
+        class Executor(concurrent.futures.ThreadPoolExecutor):
+            def submit(self, fn, *args, **kwargs):
+                submitted.append(fn)
+                return super().submit(fn, *args, **kwargs)
+
+        with Executor(1) as executor:
+            f = Fibonacci(100, 55)
+            batches = asyncio.run(collect(
+                f.aiter_batches(batch_size=30, executor=executor)))
+        assert list(itertools.chain(*batches)) == f.sequence()
+        assert submitted == [aio._batch] * 4
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            Fibonacci().aiter_batches(batch_size=0)
+        with pytest.raises(ValueError):
+            aio.AsyncBatches((0, 0, 1), count=-1)
+        with pytest.raises(ValueError):
+            aio.Checkpoint.from_json('{"index": 3}')
@@ -0,0 +1,70 @@
+import pytest
+
+from merifib import arrays, modular
+from merifib.fibonacci import Fibonacci
+
+
+class TestArrays:
+
+    def test_without_numpy(self, monkeypatch):
+        monkeypatch.setattr(arrays, "numpy", None)
+
+        with pytest.raises(ImportError):
+            Fibonacci(10).sequence_array()
+
+        with pytest.raises(ImportError):
+            Fibonacci(10).sequence_mod_array(7)
+
+    def test_sequence_array(self):
+        numpy = pytest.importorskip("numpy")
+
+        a = Fibonacci(10).sequence_array()
+        assert a.dtype == numpy.int64
+        assert a.tolist() == Fibonacci(10).sequence()
+
+        a = Fibonacci(-10, 5).sequence_array()
+        assert a.dtype == numpy.int64
+        assert a.tolist() == [-3, 2, -1, 1, 0, 1, 1, 2, 3, 5]
+
+        # F(93) fits only into uint64.
+        a = Fibonacci(94).sequence_array()
+        assert a.dtype == numpy.uint64
+        assert int(a[-1]) == Fibonacci.nth(94)
+
+        with pytest.raises(OverflowError):
+            Fibonacci(95).sequence_array()
+
+        with pytest.raises(OverflowError):
+            Fibonacci(93).sequence_array(dtype=numpy.int32)
+
+        with pytest.raises(OverflowError):
+            Fibonacci(-4, 1).sequence_array(dtype=numpy.uint64)
+
+        a = Fibonacci(200).sequence_array(dtype=object)
+        assert a.tolist() == Fibonacci(200).sequence()
+
+        with pytest.raises(ValueError):
+            Fibonacci().sequence_array()
+
+    def test_sequence_mod_array(self):
+        numpy = pytest.importorskip("numpy")
+
+        for length in (1, 10, 500, -1, -10, -500):
+            for m in (1, 10, 2**16, 2**16 + 1, 2**64):
+                f = Fibonacci(length, 233)
+                a = f.sequence_mod_array(m)
+                assert a.dtype == numpy.uint64
+                assert a.tolist() == f.sequence_mod(m)
+
+        # Window bounds beyond 64 bits.
+        f = Fibonacci(10)
+        for lo in (2**63, -2**64 - 3):
+            f._bounds = lambda: (lo, lo + 9)
+            assert f.sequence_mod_array(10).tolist() == \
+                [modular.fib_mod(k, 10) for k in range(lo, lo + 10)]
+
+        with pytest.raises(OverflowError):
+            Fibonacci(10).sequence_mod_array(2**64 + 1)
+
+        with pytest.raises(ValueError):
+            Fibonacci().sequence_mod_array(10)
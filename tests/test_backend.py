@@ -0,0 +1,71 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from merifib import backend
+from merifib.fibonacci import Fibonacci, _fib_add, _fib_pair
+
+
+@pytest.fixture
+def restore():
+    previous = backend.current()
+    yield
+    backend.use(previous.name, previous.min_bits)
+
+
+def test_use(restore):
+    assert "int" in backend.available()
+    b = backend.use("int")
+    assert backend.current() is b and b.name == "int"
+    assert b.convert(5) == b.to_int(5) == 5
+    with pytest.raises(ValueError):
+        backend.use("unknown")
+
+
+def test_environment():
+    # An unusable MERIFIB_BACKEND falls back to int with a warning instead
+    # of breaking the import.
+    for name in ("unknown",) + (("gmpy2",) if backend.gmpy2 is None else ()):
+        env = dict(os.environ, MERIFIB_BACKEND=name)
+        proc = subprocess.run(
+            [sys.executable, "-c",
+             "from merifib import backend; print(backend.current().name)"],
+            env=env, capture_output=True, text=True, check=True)
+        assert proc.stdout == "int\n"
+        assert "MERIFIB_BACKEND" in proc.stderr
+
+
+def test_int(restore):
+    backend.use("int")
+    expected = _fib_pair(5000)
+    assert _fib_add(_fib_pair(2000), _fib_pair(3000)) == expected
+    assert Fibonacci.nth(5001) == expected[0]
+
+
+def test_gmpy2(restore):
+    pytest.importorskip("gmpy2")
+    expected = [_fib_pair(n) for n in (10, 5000, 30000)]
+    backend.use("int")
+    assert [_fib_pair(n) for n in (10, 5000, 30000)] == expected
+
+    # Below and above the threshold, results are plain ints.
+    for min_bits in (0, backend.CROSSOVER_BITS):
+        backend.use("gmpy2", min_bits)
+        for n, pair in zip((10, 5000, 30000), expected):
+            result = _fib_pair(n)
+            assert result == pair
+            assert all(type(x) is int for x in result)
+        jump = _fib_add(_fib_pair(20000), _fib_pair(10000))
+        assert jump == expected[2] and type(jump[0]) is int
+        value = Fibonacci.nth(-29999)
+        assert type(value) is int and value == -expected[2][0]
+
+
+def test_missing(restore, monkeypatch):
+    monkeypatch.setattr(backend, "gmpy2", None)
+    assert backend.available() == ["int"]
+    assert backend.use("auto").name == "int"
+    with pytest.raises(ImportError):
+        backend.use("gmpy2")
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from merifib import backend, benchmark
+
+
+def test_run():
+    reported = []
+    results = benchmark.run(["nth", "json"], [10, 100], min_time=0,
+                            report=reported.append)
+    assert [(r["case"], r["size"]) for r in results["results"]] == \
+        [("nth", 10), ("nth", 100), ("json", 10), ("json", 100)]
+    assert reported == results["results"]
+    for r in results["results"]:
+        assert r["repeat"] == 1
+        assert r["time"] > 0 and r["peak_bytes"] > 0
+    json.dumps(results)
+
+    with pytest.raises(ValueError):
+        benchmark.run(["unknown"])
+
+
+def test_compare(tmp_path, capsys):
+    def results(t, peak):
+        return {"results": [
+            {"case": "nth", "size": 10, "time": t, "peak_bytes": 100},
+            {"case": "json", "size": 10, "time": 1.0, "peak_bytes": peak},
+        ]}
+
+    old = results(1.0, 100)
+    rows = benchmark.compare(old, results(1.05, 105), threshold=0.1)
+    assert not any(row["regression"] for row in rows)
+
+    rows = benchmark.compare(old, results(1.2, 100), threshold=0.1)
+    assert [row["regression"] for row in rows] == [True, False]
+    rows = benchmark.compare(old, results(1.0, 200), threshold=0.1)
+    assert [row["regression"] for row in rows] == [False, True]
+
+    old_path, new_path = tmp_path / "old.json", tmp_path / "new.json"
+    old_path.write_text(json.dumps(old))
+    new_path.write_text(json.dumps(results(2.0, 100)))
+    assert benchmark.main(["compare", str(old_path), str(new_path)]) == 1
+    assert "REGRESIJA" in capsys.readouterr().out
+
+
+def test_backends():
+    current = backend.current()
+    rows = benchmark.backends([10, 5000], min_time=0)
+    assert [row["size"] for row in rows] == [10, 5000]
+    assert all(row["int"] > 0 for row in rows)
+    assert backend.current().name == current.name
+
+    rows = [{"size": 10, "int": 1, "gmpy2": 2},
+            {"size": 100, "int": 2, "gmpy2": 1},
+            {"size": 1000, "int": 3, "gmpy2": 1}]
+    assert benchmark.crossover(rows) == 100
+    assert benchmark.crossover(rows[:1]) is None
+    assert benchmark.crossover([{"size": 10, "int": 1}]) is None
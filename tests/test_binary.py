@@ -0,0 +1,66 @@
+import io
+
+import pytest
+
+from merifib import binary
+from merifib.fibonacci import Fibonacci
+
+
+class TestBinary:
+
+    def test_roundtrip(self, tmp_path):
+        path = tmp_path / "seq.bin"
+        for length, seed in ((1, 0), (10, 0), (300, 89), (-40, 5), (-1, 0)):
+            f = Fibonacci(length, seed)
+            seq = f.sequence()
+            for reverse in (False, True):
+                f.write_binary(path, reverse)
+                expected = seq[::-1] if reverse else seq
+                with binary.SequenceFile(path) as s:
+                    assert len(s) == len(expected)
+                    assert list(s) == expected
+                    assert [s[i] for i in range(-len(s), len(s))] == \
+                        expected + expected
+                    assert s[1::3] == expected[1::3]
+                    assert s.index_of(0) == f._bounds()[reverse]
+                    assert s.step == (-1 if reverse else 1)
+                    with pytest.raises(IndexError):
+                        s[len(s)]
+
+    def test_raw(self, tmp_path):
+        path = tmp_path / "seq.bin"
+        Fibonacci(-1000, 55).write_binary(path)
+        with binary.SequenceFile(path) as s:
+            with s.raw(-1) as data:
+                assert isinstance(data, memoryview)
+                assert bytes(data) == (55).to_bytes(1, "little")
+            with s.raw(0) as data:
+                assert int.from_bytes(data, "little") == \
+                    abs(Fibonacci.nth(s.index_of(0) + 1))
+            assert s[0] == Fibonacci.nth(s.index_of(0) + 1)
+
+    def test_stream(self, tmp_path):
+        # The writer does not need a seekable target, and the file is
+        # smaller than the JSON document.
+        f = Fibonacci(2000, 13)
+        out = io.BytesIO()
+        f.write_binary(out)
+        path = tmp_path / "seq.bin"
+        path.write_bytes(out.getvalue())
+        with binary.SequenceFile(path) as s:
+            assert list(s) == f.sequence()
+        assert len(out.getvalue()) < len(f.json()) / 2
+
+    def test_invalid(self, tmp_path):
+        path = tmp_path / "bad.bin"
+        path.write_bytes(b"JSON" + bytes(60))
+        with pytest.raises(ValueError):
+            binary.SequenceFile(path)
+
+        Fibonacci(10).write_binary(path)
+        path.write_bytes(path.read_bytes()[:-1])
+        with pytest.raises(ValueError):
+            binary.SequenceFile(path)
+
+        with pytest.raises(ValueError):
+            Fibonacci().write_binary(path)
@@ -0,0 +1,63 @@
+import pytest
+
+from merifib.cache import CheckpointCache, checkpoints
+from merifib.fibonacci import Fibonacci, _fib_pair
+
+
+class TestCheckpointCache:
+
+    def test_get_put(self):
+        c = CheckpointCache()
+        assert c.get(10) is None
+        c.put(10, (55, 89))
+        assert c.get(10) == (55, 89)
+        assert c.find_value(55) == (10, (55, 89))
+        assert c.find_value(56) is None
+
+        stats = c.stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 2
+        assert stats["entries"] == 1
+
+    def test_nearest(self):
+        c = CheckpointCache()
+        for k in (100, 10, 1000):
+            c.put(k, _fib_pair(k))
+
+        assert c.nearest(5) is None
+        assert c.nearest(10) == (10, _fib_pair(10))
+        assert c.nearest(999) == (100, _fib_pair(100))
+        assert c.nearest(10**6) == (1000, _fib_pair(1000))
+
+    def test_eviction(self):
+        c = CheckpointCache()
+        size = c._sizeof(_fib_pair(1000))
+        c.resize(2 * size + size // 2)
+
+        for k in (1000, 1001, 1002):
+            c.put(k, _fib_pair(k))
+
+        assert len(c) == 2
+        assert c.get(1000) is None
+        assert c.stats()["evictions"] == 1
+
+        # A checkpoint larger than the whole budget is not stored.
+        c.put(10**5, _fib_pair(10**5))
+        assert c.get(10**5) is None
+
+        with pytest.raises(ValueError):
+            CheckpointCache(-1)
+
+    def test_fibonacci_uses_cache(self):
+        checkpoints.clear()
+
+        big = Fibonacci.nth(10**5)
+        assert checkpoints.stats()["entries"] == 1
+        assert Fibonacci.nth(10**5 + 3) == _fib_pair(10**5 + 2)[0]
+        assert checkpoints.stats()["hits"] == 1
+
+        f = Fibonacci(3, big)
+        assert f.sequence() == list(_fib_pair(10**5 - 1)) + [
+            _fib_pair(10**5 + 1)[0]]
+
+        checkpoints.clear()
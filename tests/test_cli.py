@@ -0,0 +1,128 @@
+import io
+import json
+import select
+import subprocess
+import sys
+
+import pytest
+
+from merifib import cli, formatting
+from merifib.fibonacci import Fibonacci
+
+
+def run(argv, stdin=""):
+    out = io.BytesIO()
+    code = cli.main(argv, io.StringIO(stdin), out)
+    return code, out.getvalue()
+
+
+def test_nth():
+    assert run(["nth", "1", "10", "0"]) == (0, b"0\n34\n1\n")
+    # Positions from stdin, several per line, output in input order.
+    code, out = run(["nth"], "10 1\n\n5\n")
+    assert out.split() == [b"34", b"0", b"3"]
+
+    code, out = run(["nth", "--format", "jsonl", "10"])
+    assert json.loads(out) == {"position": 10, "value": 34}
+
+
+def test_nth_binary():
+    code, out = run(["nth", "--format", "binary", "200", "-1"])
+    expected = (cli.encode_binary(Fibonacci.nth(200)) +
+                cli.encode_binary(Fibonacci.nth(-1)))
+    assert out == expected
+    assert cli.encode_binary(-1) == (-1).to_bytes(8, "little",
+                                                  signed=True) + b"\x01"
+    assert cli.encode_binary(0) == bytes(8)
+
+
+def test_sequence():
+    assert run(["sequence", "--length", "5", "--seed", "13"]) == \
+        (0, b"13\n21\n34\n55\n89\n")
+
+    code, out = run(["sequence", "--format", "jsonl"], "3 5\n-2 5\n")
+    records = [json.loads(line) for line in out.splitlines()]
+    assert records == [
+        {"index": 5, "value": 5}, {"index": 6, "value": 8},
+        {"index": 7, "value": 13},
+        {"index": 4, "value": 3}, {"index": 5, "value": 5},
+    ]
+
+
+def test_json_and_stats():
+    code, out = run(["json"], "5\n-3 8\n")
+    assert [json.loads(line) for line in out.splitlines()] == \
+        [json.loads(Fibonacci(5).json()), json.loads(Fibonacci(-3, 8).json())]
+
+    # The json subcommand always writes JSON Lines.
+    with pytest.raises(SystemExit):
+        run(["json", "--format", "text", "--length", "5"])
+
+    assert run(["stats", "--length", "5"]) == (0, b"7 2 3\n")
+    code, out = run(["stats", "--length", "5", "--format", "jsonl"])
+    assert json.loads(out) == {"sum": 7, "evens": 2, "odds": 3}
+
+
+def test_errors(capsys):
+    code, out = run(["sequence", "--length", "5", "--seed", "4"])
+    assert code == 1
+    assert "Fibonačijevom" in capsys.readouterr().err
+
+    code, out = run(["nth"], "abc\n")
+    assert code == 1
+
+
+def test_nth_interactive():
+    # Each answer is written as soon as its line is read, while the input
+    # stays open.
+    proc = subprocess.Popen([sys.executable, "-m", "merifib", "nth"],
+                            stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+    try:
+        for position, expected in ((10, b"34\n"), (20, b"4181\n")):
+            proc.stdin.write(b"%d\n" % position)
+            proc.stdin.flush()
+            ready, _, _ = select.select([proc.stdout], [], [], 30)
+            assert ready
+            assert proc.stdout.readline() == expected
+    finally:
+        proc.stdin.close()
+        proc.wait()
+    assert proc.returncode == 0
+
+
+def test_nth_batches(monkeypatch):
+    # Bulk input is computed in full batches.
+    monkeypatch.setattr(cli, "BATCH_SIZE", 3)
+    sizes = []
+    monkeypatch.setattr(Fibonacci, "nth_many", staticmethod(
+        lambda batch: sizes.append(len(batch)) or [0] * len(batch)))
+    stdin = io.TextIOWrapper(io.BytesIO(b"1 2\n3 4\n5 6\n7"),
+                             encoding="ascii")
+    assert cli.main(["nth"], stdin, io.BytesIO()) == 0
+    assert sizes == [3, 3, 1]
+
+
+def test_no_tkinter():
+    subprocess.run([sys.executable, "-c",
+                    "import sys, merifib.cli; "
+                    "assert 'tkinter' not in sys.modules"], check=True)
+
+
+def test_encoding():
+    assert run(["nth", "--encoding", "hex", "10", "-1"]) == \
+        (0, b"0x22\n-0x1\n")
+    code, out = run(["sequence", "--length", "2", "--seed", "34",
+                     "--format", "jsonl", "--encoding", "base64"])
+    assert [json.loads(line)["value"] for line in out.splitlines()] == \
+        ["Ig==", "Nw=="]
+    assert run(["stats", "--length", "5", "--encoding", "hex"]) == \
+        (0, b"0x7 2 3\n")
+    code, out = run(["json", "--length", "5", "--encoding", "hex"])
+    assert out == Fibonacci(5).json(encoding="hex").encode() + b"\n"
+
+    # Numbers above the str() digit limit.
+    code, out = run(["nth", "30001"])
+    assert out == formatting.to_str(Fibonacci.nth(30001)).encode() + b"\n"
+
+    with pytest.raises(SystemExit):
+        run(["nth", "--format", "binary", "--encoding", "hex", "1"])
@@ -1,8 +1,13 @@
+import base64
+import decimal
+import io
 import json
+import threading
 import types
 
 import pytest
 
+from merifib import formatting
 from merifib.fibonacci import Fibonacci
 
 
@@ -32,6 +37,51 @@ class TestFibonacci:
         with pytest.raises(ValueError):
             f = Fibonacci(length=0)
 
+    def test_init_index(self):
+        assert Fibonacci().index == 0
+        assert Fibonacci(seed=1).index == 1
+        assert Fibonacci(seed=2).index == 3
+        assert Fibonacci(10, 13).index == 7
+
+        # F(478000) has roughly 100k digits.
+        big = Fibonacci.nth(478001)
+        f = Fibonacci(3, big)
+        assert f.index == 478000
+        assert f.sequence()[1] == Fibonacci.nth(478002)
+
+        for wrong in (4, 6, 7, 9, big + 1, big - 1, 10**1000):
+            with pytest.raises(ValueError):
+                Fibonacci(seed=wrong)
+
+    def test_from_index(self):
+        assert Fibonacci.from_index(10, 5).sequence() == \
+            [55, 89, 144, 233, 377]
+        assert Fibonacci.from_index(-6, -3).sequence() == [-21, 13, -8]
+
+        # Windows match the seed-based constructor and nth on both sides of
+        # zero, in both directions.
+        for index in (-40, -7, -1, 0, 1, 2, 30, 2000):
+            for length in (1, 2, 15, -1, -2, -15, None):
+                f = Fibonacci.from_index(index, length)
+                assert f.index == index
+                assert f.seed == Fibonacci.nth(index + 1)
+                if length is None:
+                    seq = f.sequence()
+                    assert [next(seq) for _ in range(5)] == \
+                        [Fibonacci.nth(index + 1 + i) for i in range(5)]
+                    continue
+                lo, hi = f._bounds()
+                expected = [Fibonacci.nth(k + 1) for k in range(lo, hi + 1)]
+                assert f.sequence() == expected
+                assert list(f.iter_sequence(reverse=True)) == expected[::-1]
+                assert f.stats()["sum"] == sum(expected)
+                assert json.loads(f.json())["sequence"] == expected
+                if index >= 0 and index != 2:   # F(1) = F(2) = 1
+                    assert f.sequence() == Fibonacci(length, f.seed).sequence()
+
+        with pytest.raises(ValueError):
+            Fibonacci.from_index(5, 0)
+
     def test_sequence(self):
         test_seq1 = [0, 1, 1, 2, 3, 5, 8, 13, 21, 34]
         test_seq2 = [55, 89, 144, 233, 377, 610]
@@ -83,8 +133,75 @@ class TestFibonacci:
         # 499th
         assert f.nth(500) == 86168291600238450732788312165664788095941068326060883324529903470149056115823592713458328176574447204501
 
-        with pytest.raises(ValueError):
-            f.nth(0)
+    def test_nth_negative(self):
+        # Positions below 1 map to negative indices: position = n + 1.
+        assert Fibonacci.nth(0) == 1
+        assert Fibonacci.nth(-1) == -1
+        assert Fibonacci.nth(-7) == -21
+
+        for n in range(1, 300):
+            assert Fibonacci.nth(1 - n) == (-1)**(n + 1) * Fibonacci.nth(n + 1)
+
+    def test_nth_exact(self):
+        a, b = 0, 1
+        for position in range(1, 2001):
+            assert Fibonacci.nth(position) == a
+            a, b = b, a + b
+
+        # F(10^6) has 208988 digits and its last digits are known.
+        big = Fibonacci.nth(10**6 + 1)
+        assert big.bit_length() == 694241
+        assert big % 10**10 == 8242546875
+
+    def test_nth_many(self):
+        assert Fibonacci.nth_many([20, 1, 20, 10]) == [4181, 0, 4181, 34]
+        assert Fibonacci.nth_many([]) == []
+
+        positions = [5000, 3, 10**5, 5001, 4990, 10**5 - 200, 1, 7]
+        assert Fibonacci.nth_many(positions) == [
+            Fibonacci.nth(p) for p in positions]
+
+        positions = [3, 0, -5, 200, -300]
+        assert Fibonacci.nth_many(positions) == [
+            Fibonacci.nth(p) for p in positions]
+
+    def test_iter_nth_many(self):
+        genmany = Fibonacci.iter_nth_many([20, 1, 20, 10])
+        assert isinstance(genmany, types.GeneratorType)
+        assert list(genmany) == [(1, 0), (10, 34), (20, 4181)]
+
+    def test_nth_approximate(self):
+        approx = Fibonacci.nth(500, approximate=True)
+        assert isinstance(approx, decimal.Decimal)
+        assert round(approx) == Fibonacci.nth(500)
+
+        approx = Fibonacci.nth(10**6 + 1, approximate=True, digits=30)
+        assert approx.adjusted() == 208987
+        assert str(approx).startswith("1.953282128707757731")
+
+        # By default all digits are computed, so the result is exact.
+        for position in (0, 1, 2, 3, -7, 2001, -2000):
+            assert Fibonacci.nth(position, approximate=True) == \
+                Fibonacci.nth(position)
+
+        for digits in (0, -5):
+            with pytest.raises(ValueError, match="cifara"):
+                Fibonacci.nth(1, approximate=True, digits=digits)
+        assert Fibonacci.nth(100, approximate=True, digits=1) == \
+            decimal.Decimal("2E+20")
+
+    def test_decimal_context(self):
+        # The module does not change the caller's context, and results do
+        # not depend on it, so other threads get the same values.
+        assert decimal.getcontext().prec == 28
+        results = []
+        thread = threading.Thread(target=lambda: results.append(
+            Fibonacci.nth(1501, approximate=True)))
+        with decimal.localcontext() as ctx:
+            ctx.prec = 5
+            thread.start()
+            thread.join()
+            assert results == [Fibonacci.nth(1501, approximate=True)]
 
     def test_json(self):
         test_json = {
@@ -102,6 +219,116 @@ class TestFibonacci:
 
         assert decoded_result_json == test_json
 
+        for length, seed in ((1, 0), (-10, 5), (300, 89), (-300, 89)):
+            f = Fibonacci(length, seed)
+            expected = {"sequence": f.sequence()}
+            expected.update(f.stats())
+            assert f.json() == json.dumps(expected)
+
+        # Numbers above the 4300-digit limit of str() are written too.
+        big = Fibonacci.nth(30001)
+        document = Fibonacci(1, big).json()
+        assert document.startswith('{"sequence": [' +
+                                   formatting.to_str(big) + "]")
+
         f = Fibonacci()
         with pytest.raises(ValueError):
             f.json()
+
+    def test_json_encoding(self):
+        f = Fibonacci(-10, 5)
+        seq = f.sequence()
+        stats = f.stats()
+
+        decoded = json.loads(f.json(encoding="hex"))
+        assert [int(x, 16) for x in decoded["sequence"]] == seq
+        assert int(decoded["sum"], 16) == stats["sum"]
+        assert decoded["evens"] == stats["evens"]
+
+        decoded = json.loads(f.json(encoding="base64"))
+        assert [int.from_bytes(base64.b64decode(x), "big", signed=True)
+                for x in decoded["sequence"]] == seq
+
+        assert "".join(f.iter_json(7, encoding="hex")) == \
+            f.json(encoding="hex")
+        with pytest.raises(ValueError):
+            f.iter_json(encoding="octal")
+
+    def test_stats(self):
+        assert Fibonacci(10).stats() == {"sum": 88, "evens": 4, "odds": 6}
+
+        for length in (1, 2, 3, 7, -1, -2, -3, -10, -25):
+            for seed in (0, 1, 2, 5, 144):
+                seq = Fibonacci(length, seed).sequence()
+                evens = sum(1 for x in seq if x % 2 == 0)
+                assert Fibonacci(length, seed).stats() == {
+                    "sum": sum(seq),
+                    "evens": evens,
+                    "odds": len(seq) - evens
+                }
+
+        stats = Fibonacci(10**6).stats()
+        assert stats["sum"] == Fibonacci.nth(10**6 + 2) - 1
+        assert stats["evens"] == 333334
+        assert stats["odds"] == 666666
+
+        with pytest.raises(ValueError):
+            Fibonacci().stats()
+
+    def test_iter_json(self):
+        for length, seed in ((10, 0), (1, 5), (-1, 5), (-10, 5), (300, 89)):
+            f = Fibonacci(length, seed)
+            expected = f.json()
+
+            assert "".join(f.iter_json()) == expected
+            assert "".join(f.iter_json(chunk_size=7)) == expected
+            assert b"".join(f.iter_json(binary=True)) == expected.encode()
+
+        chunks = list(Fibonacci(300).iter_json(chunk_size=100))
+        assert len(chunks) > 1
+        assert all(len(chunk) >= 100 for chunk in chunks[:-1])
+
+        with pytest.raises(ValueError):
+            Fibonacci().iter_json()
+
+    def test_write_json(self, tmp_path):
+        f = Fibonacci(-500, 55)
+
+        text = io.StringIO()
+        f.write_json(text)
+        assert text.getvalue() == f.json()
+
+        data = io.BytesIO()
+        f.write_json(data, buffer_size=10)
+        assert data.getvalue() == f.json().encode()
+
+        path = tmp_path / "seq.json"
+        f.write_json(path, buffer_size=1024)
+        assert path.read_text() == f.json()
+        f.write_json(str(path))
+        assert path.read_text() == f.json()
+
+    def test_iter_sequence(self):
+        for length in (1, 2, 10, -1, -2, -10, -300):
+            for seed in (0, 1, 5, 144):
+                f = Fibonacci(length, seed)
+                seq = f.sequence()
+
+                assert list(f.iter_sequence()) == seq
+                assert list(f.iter_sequence(reverse=True)) == seq[::-1]
+
+        genseq = Fibonacci(seed=5).iter_sequence()
+        assert [next(genseq) for _ in range(4)] == [5, 8, 13, 21]
+
+        genseq = Fibonacci(seed=1).iter_sequence(reverse=True)
+        assert [next(genseq) for _ in range(6)] == [1, 0, 1, -1, 2, -3]
+
+        genseq = Fibonacci(seed=0).iter_sequence(reverse=True)
+        assert [next(genseq) for _ in range(4)] == [0, 1, -1, 2]
+
+    def test_sequence_backward_long(self):
+        seq = Fibonacci(-200000, 0).sequence()
+        assert len(seq) == 200000
+        assert seq[-1] == 0
+        assert seq[0] == Fibonacci.nth(-199998)
+        assert seq[1] == Fibonacci.nth(-199997)
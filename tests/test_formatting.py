@@ -0,0 +1,77 @@
+import itertools
+import sys
+
+import pytest
+
+from merifib import formatting
+from merifib.fibonacci import Fibonacci
+
+
+class TestFormatting:
+
+    def test_digit_count(self):
+        for n in (0, 9, 10, -10, 10**4299, 10**4300 - 1, 10**4300, 10**5000,
+                  Fibonacci.nth(10**5)):
+            assert formatting.digit_count(n) == len(formatting.to_str(abs(n)))
+
+    def test_to_str(self):
+        big = Fibonacci.nth(10**5)
+        text = formatting.to_str(big)
+        assert int(text[-4000:]) == big % 10**4000
+        assert text.startswith("1605285768")
+        assert formatting.to_str(-big) == "-" + text
+        assert formatting.to_str(10**8000) == "1" + "0" * 8000
+
+    def test_to_str_limit(self):
+        # Both sides of the str() threshold and of the power-of-two splits,
+        # compared with str() with the digit limit lifted.
+        old = sys.get_int_max_str_digits()
+        numbers = [Fibonacci.nth(k) for k in (20000, 20200, 50000, 10**5)]
+        numbers += [2**k + d for k in (128, 1024, 14000, 65536)
+                    for d in (-1, 0, 1)]
+        try:
+            sys.set_int_max_str_digits(0)
+            expected = [str(n) for n in numbers]
+            # A lower limit makes str() fail sooner, to_str() still works.
+            sys.set_int_max_str_digits(1000)
+            assert [formatting.to_str(n) for n in numbers] == expected
+            assert formatting.digit_count(numbers[0]) == len(expected[0])
+        finally:
+            sys.set_int_max_str_digits(old)
+
+    def test_encode(self):
+        assert formatting.encode(-255) == "-255"
+        assert formatting.encode(255, "hex") == "0xff"
+        assert formatting.encode(-255, "hex") == "-0xff"
+        assert formatting.to_bytes(0) == b"\x00"
+        assert formatting.to_bytes(128) == b"\x00\x80"
+        assert formatting.to_bytes(-1) == b"\xff"
+        # Minimal two's-complement length around the byte boundary.
+        assert formatting.to_bytes(127) == b"\x7f"
+        assert formatting.to_bytes(-128) == b"\x80"
+        assert formatting.to_bytes(-129) == b"\xff\x7f"
+        for n in itertools.chain.from_iterable(
+                (-2**k - 1, -2**k, 2**k - 1, 2**k) for k in range(100)):
+            data = formatting.to_bytes(n)
+            assert int.from_bytes(data, "big", signed=True) == n
+            assert len(data) == 1 or \
+                int.from_bytes(data[1:], "big", signed=True) != n
+        assert formatting.encode(255, "base64") == "AP8="
+        with pytest.raises(ValueError):
+            formatting.encode(1, "octal")
+
+    def test_format_number(self):
+        assert formatting.format_number(12345, 10) == "12345"
+        assert formatting.format_number(1234567890123, 6) == \
+            "123…(13 cifara)…123"
+        assert formatting.format_number(-1234567890123, 6) == \
+            "-123…(13 cifara)…123"
+        assert formatting.format_number(10**20, 4) == "10…(21 cifara)…00"
+
+        big = Fibonacci.nth(10**6 + 1)
+        assert formatting.format_number(big, 20) == \
+            "1953282128…(208988 cifara)…8242546875"
+        # Parts longer than the str() digit limit.
+        text = formatting.to_str(big)
+        assert formatting.format_number(-big, 20000) == \
+            "-{}…(208988 cifara)…{}".format(text[:10000], text[-10000:])
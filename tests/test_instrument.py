@@ -0,0 +1,107 @@
+import pytest
+
+from merifib import instrument
+from merifib.fibonacci import Fibonacci
+
+
+@pytest.fixture
+def metrics():
+    m = instrument.Instrumentation()
+    yield m
+    m.disable()
+
+
+def test_disabled(metrics):
+    nth = Fibonacci.__dict__["nth"]
+    metrics.enable()
+    assert Fibonacci.__dict__["nth"] is not nth
+    metrics.disable()
+    # The original methods are restored, so there is no overhead.
+    assert Fibonacci.__dict__["nth"] is nth
+    Fibonacci.nth(10)
+    assert metrics.snapshot()["methods"] == {}
+
+
+def test_snapshot(metrics):
+    metrics.enable()
+    metrics.enable()
+    assert Fibonacci.nth(1001) == Fibonacci.nth(1001)
+    f = Fibonacci(10)
+    f.json()
+    f.sequence()
+
+    snapshot = metrics.snapshot()
+    assert snapshot["enabled"]
+    methods = snapshot["methods"]
+    assert methods["nth"]["calls"] == 2
+    assert methods["nth"]["max_result_size"] in (209, 210)
+    assert methods["nth"]["max_time"] <= methods["nth"]["total_time"]
+    assert methods["__init__"]["calls"] == 1
+    assert methods["__init__"]["max_result_size"] is None
+    assert methods["json"]["max_result_size"] == len(f.json())
+    # json() calls stats().
+    assert methods["stats"]["calls"] == 1
+    assert methods["sequence"]["calls"] == 1
+    assert methods["sequence"]["max_result_size"] == 2
+    assert set(snapshot["caches"]) == {"checkpoints", "pisano"}
+
+    metrics.reset()
+    assert metrics.snapshot()["methods"] == {}
+
+
+def test_hooks(metrics):
+    calls = []
+
+    def hook(name, elapsed, size, failed):
+        calls.append((name, size))
+
+    metrics.add_hook(hook)
+    metrics.enable()
+    Fibonacci.nth(10)
+    Fibonacci(5, 3).sequence()
+    metrics.remove_hook(hook)
+    Fibonacci.nth(10)
+    assert calls == [("nth", 2), ("__init__", None), ("sequence", 2)]
+
+
+def test_errors(metrics):
+    # Calls that raise are timed and counted, without a result size.
+    calls = []
+    metrics.add_hook(lambda name, elapsed, size, failed:
+                     calls.append((name, size, failed)))
+    metrics.enable()
+    with pytest.raises(ValueError):
+        Fibonacci(5, 4)
+    Fibonacci(5)
+
+    stats = metrics.snapshot()["methods"]["__init__"]
+    assert stats["calls"] == 2
+    assert stats["errors"] == 1
+    assert stats["total_time"] > 0
+    assert calls == [("__init__", None, True), ("__init__", None, False)]
+
+
+def test_failing_hook(metrics):
+    # A hook that raises changes neither the result nor the exception of
+    # the measured method.
+    def hook(name, elapsed, size, failed):
+        raise RuntimeError("exporter down")
+
+    metrics.add_hook(hook)
+    metrics.enable()
+    with pytest.warns(RuntimeWarning):
+        assert Fibonacci.nth(10) == 34
+    with pytest.warns(RuntimeWarning), pytest.raises(ValueError):
+        Fibonacci(5, 4)
+
+
+def test_result_size():
+    # The digit count is estimated from the bit length and may be one too
+    # large.
+    assert instrument.result_size(0) == 1
+    assert instrument.result_size(-1000) == 4
+    assert instrument.result_size(-999) in (3, 4)
+    assert instrument.result_size([1, -55]) == 2
+    assert instrument.result_size("abc") == 3
+    assert instrument.result_size([]) is None
+    assert instrument.result_size({"sum": 1}) is None
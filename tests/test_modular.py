@@ -0,0 +1,101 @@
+import itertools
+
+import pytest
+
+from merifib.fibonacci import Fibonacci
+from merifib.modular import (TABLE_LIMIT, PisanoCache, _factorize,
+                             _fib_pair_mod, _period, _residues, fib_mod,
+                             iter_mod, pisano, pisano_period)
+
+
+class TestModular:
+
+    def test_pisano_period(self):
+        periods = [1, 3, 8, 6, 20, 24, 16, 12, 24, 60]
+        assert [pisano_period(m) for m in range(1, 11)] == periods
+        # 65537 is a prime congruent to 2 mod 5, so the period divides
+        # 2 * (65537 + 1).
+        period = pisano_period(TABLE_LIMIT + 1)
+        assert period == 14564
+        assert 2 * (TABLE_LIMIT + 2) % period == 0
+        assert _fib_pair_mod(period, TABLE_LIMIT + 1) == (0, 1)
+
+        with pytest.raises(ValueError):
+            pisano_period(0)
+
+    def test_large_period(self):
+        # Periods from the factorization agree with the direct scan.
+        for m in itertools.chain(range(1, 500), (2**17, 3**11, 5**8, 100000,
+                                                 7 * 1000003)):
+            assert _period(m) == len(_residues(m))
+
+        assert pisano_period(10**12) == 15 * 10**11
+        for m in (2**61 - 1, 10**30 + 57, 12345678901234567890123):
+            period = pisano_period(m)
+            assert _fib_pair_mod(period, m) == (0, 1)
+            assert all(_fib_pair_mod(period // q, m) != (0, 1)
+                       for q in _factorize(period))
+
+    def test_fib_mod(self):
+        for m in (1, 2, 10, 1000, TABLE_LIMIT + 1, 10**20):
+            for n in range(-50, 300):
+                assert fib_mod(n, m) == Fibonacci.nth(n + 1) % m
+
+        assert fib_mod(10**18, 1000) == 875
+
+    def test_iter_mod(self):
+        for m in (7, 10**20):
+            expected = [Fibonacci.nth(n + 1) % m for n in range(-20, 200)]
+            assert list(itertools.islice(iter_mod(-20, m), 220)) == expected
+
+    def test_cache(self):
+        c = PisanoCache(max_entries=80)
+        assert len(c.table(10)) == 60
+        assert c.table(10) is c.table(10)
+        assert c.table(TABLE_LIMIT + 1) is None
+
+        c.table(11)  # Period 10, fits together with 10.
+        c.table(9)   # Period 24, evicts the table for 10.
+        stats = c.stats()
+        assert stats["tables"] == 2
+        assert stats["evictions"] == 1
+        assert stats["hits"] == 2
+
+        pisano.clear()
+        fib_mod(10, 10)
+        fib_mod(11, 10)
+        assert pisano.stats()["misses"] == 1
+        assert pisano.stats()["hits"] == 1
+
+
+class TestFibonacciModular:
+
+    def test_nth_mod(self):
+        for position in (-10, 0, 1, 2, 500, 10**5):
+            for m in (3, 1000, 2**61 - 1):
+                assert Fibonacci.nth_mod(position, m) == \
+                    Fibonacci.nth(position) % m
+
+    def test_sequence_mod(self):
+        for length in (1, 5, 100, -1, -5, -100):
+            for seed in (0, 1, 13, 144):
+                f = Fibonacci(length, seed)
+                for m in (10, 2**64 + 13):
+                    assert f.sequence_mod(m) == [x % m for x in f.sequence()]
+
+        genseq = Fibonacci(seed=13).sequence_mod(10)
+        assert [next(genseq) for _ in range(5)] == [3, 1, 4, 5, 9]
+
+    def test_stats_mod(self):
+        for length in (1, 10, 100, -1, -10, -100):
+            f = Fibonacci(length, 89)
+            stats = f.stats()
+            for m in (7, 10**30):
+                assert f.stats_mod(m) == {
+                    "sum": stats["sum"] % m,
+                    "evens": stats["evens"],
+                    "odds": stats["odds"]
+                }
+
+        with pytest.raises(ValueError):
+            Fibonacci().stats_mod(7)
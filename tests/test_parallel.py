@@ -0,0 +1,40 @@
+import itertools
+
+import pytest
+
+from merifib import parallel
+from merifib.fibonacci import Fibonacci
+
+
+class TestParallel:
+
+    def test_sequence_parallel(self):
+        for length, seed in ((1, 0), (10, 0), (1000, 13), (-1000, 13),
+                             (-1001, 0)):
+            f = Fibonacci(length, seed)
+            assert f.sequence_parallel(workers=2, chunk_size=64) == \
+                f.sequence()
+
+        # Shorter than one chunk, computed without a process pool.
+        assert Fibonacci(10).sequence_parallel() == Fibonacci(10).sequence()
+
+    def test_infinite(self):
+        genseq = Fibonacci(seed=55).sequence_parallel(workers=2, chunk_size=7)
+        expected = list(itertools.islice(Fibonacci(seed=55).sequence(), 50))
+        assert list(itertools.islice(genseq, 50)) == expected
+        genseq.close()
+
+    def test_iter_chunks(self):
+        f = Fibonacci(100, 3)
+        chunks = list(parallel.iter_chunks(f, workers=2, chunk_size=30))
+        assert [len(c) for c in chunks] == [30, 30, 30, 10]
+        assert sum(chunks, []) == f.sequence()
+
+        with pytest.raises(ValueError):
+            parallel.iter_chunks(f, chunk_size=0)
+
+        with pytest.raises(ValueError):
+            parallel.iter_chunks(f, workers=0)
+
+        with pytest.raises(ValueError):
+            parallel.sequence(Fibonacci())
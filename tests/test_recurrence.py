@@ -0,0 +1,86 @@
+import pytest
+
+from merifib.fibonacci import Fibonacci
+from merifib.recurrence import LinearRecurrence, _power
+
+
+def naive(coefficients, initial, n):
+    x = list(initial)
+    while len(x) < n:
+        x.append(sum(c * x[-i] for i, c in enumerate(coefficients, 1)))
+    return x[:n]
+
+
+CASES = [
+    ((1, 1), (0, 1)),           # Fibonacci
+    ((1, 1), (2, 1)),           # Lucas
+    ((1, 1), (7, -3)),
+    ((1, 1, 1), (0, 0, 1)),     # Tribonacci
+    ((2,), (3,)),
+    ((2, -1), (1, 5)),
+    ((1, 2), (0, 1)),           # Jacobsthal
+    ((0, 0, 1), (4, 5, 6)),
+    ((3, 0, -2, 1), (1, -1, 2, 7)),
+]
+
+
+class TestLinearRecurrence:
+
+    @pytest.mark.parametrize("coefficients, initial", CASES)
+    def test_sequence(self, coefficients, initial):
+        r = LinearRecurrence(coefficients, initial)
+        expected = naive(coefficients, initial, 80)
+        assert [r.nth(n) for n in range(70)] == expected[:70]
+        for start in range(0, 70, 9):
+            assert r.sequence(10, start) == expected[start:start + 10]
+            assert r.sequence_mod(10, 7, start) == \
+                [x % 7 for x in expected[start:start + 10]]
+            assert r.nth_mod(start, 13) == expected[start] % 13
+
+    @pytest.mark.parametrize("coefficients, initial", CASES)
+    def test_stats(self, coefficients, initial):
+        r = LinearRecurrence(coefficients, initial)
+        expected = naive(coefficients, initial, 80)
+        for start in range(0, 60, 7):
+            for length in (0, 1, 5, 20):
+                window = expected[start:start + length]
+                evens = sum(1 for x in window if x % 2 == 0)
+                assert r.stats(length, start) == {
+                    "sum": sum(window), "evens": evens,
+                    "odds": length - evens}
+
+    def test_fibonacci(self):
+        # Fibonacci coefficients use the Fibonacci engine; the generic
+        # Kitamasa jump gives the same numbers.
+        n = 5000
+        assert LinearRecurrence.fibonacci().nth(n) == Fibonacci.nth(n + 1)
+        assert sum(x * y for x, y in zip(_power(n, (1, 1)), (0, 1))) == \
+            Fibonacci.nth(n + 1)
+        lucas = LinearRecurrence.lucas()
+        assert lucas.nth(n) == Fibonacci.nth(n) + Fibonacci.nth(n + 2)
+        assert lucas.nth_mod(10**18, 1000) == \
+            (Fibonacci.nth_mod(10**18, 1000) +
+             Fibonacci.nth_mod(10**18 + 2, 1000)) % 1000
+        assert lucas.stats(1000, 3000)["sum"] == \
+            sum(lucas.sequence(1000, 3000))
+
+    def test_large(self):
+        t = LinearRecurrence.kbonacci(3)
+        window = t.sequence(5, 3000)
+        assert window[3] == sum(window[:3])
+        assert t.nth(3004) == window[4]
+        assert t.nth_mod(3004, 10**9) == window[4] % 10**9
+        assert t.nth_mod(10**30, 1) == 0
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            LinearRecurrence((), ())
+        with pytest.raises(ValueError):
+            LinearRecurrence((1, 1), (0,))
+        r = LinearRecurrence.kbonacci(4)
+        with pytest.raises(ValueError):
+            r.nth(-1)
+        with pytest.raises(ValueError):
+            r.sequence(-1)
+        with pytest.raises(ValueError):
+            r.nth_mod(5, 0)
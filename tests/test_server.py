@@ -0,0 +1,135 @@
+import asyncio
+import time
+
+from merifib import loadtest, server, table
+from merifib.fibonacci import Fibonacci
+
+
+def serve(check, **kwargs):
+    # Run check(srv, get) against a server on a free local port.
+    async def main():
+        async with server.Server(workers=1, **kwargs) as srv:
+            port = await srv.start("127.0.0.1", 0)
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+            async def get(path):
+                return await loadtest.request(reader, writer, path)
+
+            try:
+                await check(srv, get, port)
+            finally:
+                writer.close()
+
+    asyncio.run(main())
+
+
+def test_endpoints():
+    async def check(srv, get, port):
+        assert await get("/nth?position=10") == (200, b"34")
+        assert await get("/sequence?length=5&seed=13") == \
+            (200, b"13\n21\n34\n55\n89\n")
+        assert await get("/json?length=-3&seed=8") == \
+            (200, Fibonacci(-3, 8).json().encode())
+
+        assert (await get("/sequence?length=5&seed=4"))[0] == 400
+        assert (await get("/nth?position=x"))[0] == 400
+        assert (await get("/nth"))[0] == 400
+        assert (await get("/unknown"))[0] == 404
+
+    serve(check)
+
+
+def test_malformed_request():
+    async def check(srv, get, port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"GARBAGE\r\n\r\n")
+        response = await reader.read()
+        writer.close()
+        assert response.startswith(b"HTTP/1.1 400 Bad Request\r\n")
+        assert b"Connection: close" in response
+        # The server keeps serving other connections.
+        assert await get("/nth?position=10") == (200, b"34")
+
+    serve(check)
+
+
+def test_close_does_not_block():
+    # Shutting the pool down waits for the busy worker in a thread, so the
+    # event loop keeps running meanwhile.
+    async def main():
+        srv = server.Server(workers=1)
+        await srv.start("127.0.0.1", 0)
+        busy = srv._run(time.sleep, 0.5)
+        await asyncio.sleep(0.1)
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.ensure_future(tick())
+        await srv.close()
+        ticker.cancel()
+        await busy
+        assert ticks > 10
+
+    asyncio.run(main())
+
+
+def test_stream():
+    async def check(srv, get, port):
+        status, body = await get("/sequence?length=-25&seed=832040")
+        assert status == 200
+        assert body.split() == \
+            [str(n).encode() for n in Fibonacci(-25, 832040).sequence()]
+
+        status, body = await get("/json?length=25")
+        assert body == Fibonacci(25).json().encode()
+
+        # Streamed responses are not cached.
+        assert srv.cache.stats()["entries"] == 0
+
+    serve(check, stream_threshold=10, chunk_size=4)
+
+
+def test_cache_and_coalescing():
+    async def check(srv, get, port):
+        # Concurrent identical requests share a single computation.
+        result = await loadtest.run("127.0.0.1", port, ["/nth?position=5000"],
+                                    20, 10)
+        assert result["requests"] == 20 and result["errors"] == 0
+        assert srv.computations == 1
+        assert srv.coalesced + srv.cache.hits == 19
+
+        assert await get("/nth?position=5000") == \
+            (200, str(Fibonacci.nth(5000)).encode())
+        assert srv.computations == 1
+
+    serve(check)
+
+
+def test_result_cache():
+    cache = server.ResultCache(10)
+    cache.put("a", b"12345")
+    cache.put("b", b"12345")
+    cache.put("c", b"12345678901")     # Larger than the whole budget.
+    assert cache.get("c") is None
+    assert cache.get("a") == b"12345"
+    cache.put("d", b"1")
+    assert cache.get("b") is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_table(tmp_path):
+    # Every worker process attaches the shared table.
+    path = str(tmp_path / "fib.tbl")
+    with table.Table(path, append=True) as t:
+        t.extend(2000)
+
+    async def check(srv, get, port):
+        assert await get("/nth?position=1500") == \
+            (200, str(Fibonacci.nth(1500)).encode())
+
+    serve(check, table=path)
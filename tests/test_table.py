@@ -0,0 +1,114 @@
+import os
+
+import pytest
+
+from merifib import table
+from merifib.cache import checkpoints
+from merifib.fibonacci import Fibonacci, _fib_pair
+
+
+@pytest.fixture
+def path(tmp_path):
+    yield str(tmp_path / "fib.tbl")
+    table.detach()
+
+
+class TestTable:
+
+    def test_extend(self, path):
+        with table.Table(path, append=True) as t:
+            assert len(t) == 0
+            assert t.get(0) is None
+            t.extend(1)
+            assert len(t) == 1 and t.get(0) == 0
+            t.extend(3000)
+            assert len(t) == 3000
+            assert [t.get(k) for k in range(3000)] == \
+                Fibonacci(3000).sequence()
+            assert t.get(-10) == -55
+            assert t.get(3000) is None
+            assert t.pair(2998) == _fib_pair(2998)
+            assert t.pair(2999) is None
+            assert t.window(-20, 40) == Fibonacci(-61, 102334155).sequence()
+            assert t.window(10, 3000) is None
+
+    def test_shared(self, path):
+        # A second handle (e.g. another process) sees appended numbers on
+        # its next read past the range it knows.
+        writer = table.Table(path, append=True)
+        writer.extend(100)
+        reader = table.Table(path)
+        assert len(reader) == 100
+        writer.extend(2500)
+        assert reader.get(2499) == _fib_pair(2499)[0]
+        with pytest.raises(ValueError):
+            reader.append(2500, [_fib_pair(2500)[0]])
+        reader.close()
+        writer.close()
+
+    def test_append(self, path):
+        with table.Table(path, append=True) as t:
+            assert t.append(5, [5, 8]) == 0    # Gap after the end.
+            assert t.append(0, [0, 1, 1, 2]) == 4
+            assert t.append(2, [1, 2, 3, 5]) == 2
+            assert t.window(0, 5) == [0, 1, 1, 2, 3, 5]
+
+    def test_interrupted(self, path):
+        # Leftovers of an interrupted append (data without offsets, a torn
+        # offset) are invisible to readers and dropped by the next append.
+        with table.Table(path, append=True) as t:
+            t.extend(50)
+        with open(path, "ab") as f:
+            f.write(b"garbage")
+        with open(path + ".idx", "ab") as f:
+            f.write(b"\x01\x02\x03")
+        with table.Table(path, append=True) as t:
+            assert len(t) == 50
+            t.extend(60)
+            assert t.window(0, 59) == Fibonacci(60).sequence()
+
+    def test_invalid(self, path):
+        with pytest.raises(FileNotFoundError):
+            table.Table(path)
+        with open(path + ".idx", "wb") as f:
+            f.write(b"JSON" + bytes(12))
+        open(path, "wb").close()
+        with pytest.raises(ValueError):
+            table.Table(path)
+
+
+class TestAttached:
+
+    def test_nth(self, path):
+        table.attach(path, append=True).extend(5000)
+        checkpoints.clear()
+        assert Fibonacci.nth(4000) == _fib_pair(3999)[0]
+        assert Fibonacci.nth(-3000) == Fibonacci.nth(-3000, approximate=True)
+        # Past the table the last stored pair is the starting point.
+        assert Fibonacci.nth(5050) == _fib_pair(5049)[0]
+        assert checkpoints.stats()["entries"] <= 1
+        assert len(table.attached()) == 5000
+
+    def test_sequence(self, path):
+        t = table.attach(path, append=True)
+        t.extend(1200)
+        seed = _fib_pair(1100)[0]
+
+        # A window that continues the table is appended to it ...
+        assert Fibonacci(200, seed).sequence() == \
+            [_fib_pair(k)[0] for k in range(1100, 1300)]
+        assert len(t) == 1300
+        # ... and windows inside the table are read from it.
+        assert Fibonacci(-1300, _fib_pair(1299)[0]).sequence() == \
+            Fibonacci(1300).sequence()
+        # Windows past the end are computed, but not appended.
+        assert Fibonacci(10, _fib_pair(2000)[0]).sequence()[0] == \
+            _fib_pair(2000)[0]
+        assert len(t) == 1300
+
+        table.detach()
+        assert table.attached() is None
+        table.attach(path)
+        assert Fibonacci(10, _fib_pair(1290)[0]).sequence()[-1] == \
+            _fib_pair(1299)[0]
+        assert os.path.getsize(path + ".idx") == 16 + 8 * 1300
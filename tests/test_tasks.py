@@ -0,0 +1,92 @@
+import threading
+import time
+
+from merifib.tasks import BackgroundTask
+
+
+class FakeWidget:
+    # Stands in for a Tk widget: after() callbacks are run by hand.
+
+    def __init__(self):
+        self.scheduled = {}
+        self.next_id = 0
+
+    def after(self, ms, func):
+        self.next_id += 1
+        self.scheduled[self.next_id] = func
+        return self.next_id
+
+    def after_cancel(self, after_id):
+        self.scheduled.pop(after_id, None)
+
+    def run(self):
+        scheduled, self.scheduled = self.scheduled, {}
+        for func in scheduled.values():
+            func()
+
+
+def wait_for(widget, condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+        widget.run()
+
+
+class TestBackgroundTask:
+
+    def test_done_and_error(self):
+        w = FakeWidget()
+        task = BackgroundTask(w)
+        results, errors, progress = [], [], []
+
+        task.submit(lambda job: (job.progress(0.5), 42)[1],
+                    results.append, errors.append, progress.append)
+        wait_for(w, lambda: results)
+        assert results == [42]
+        assert progress == [0.5]
+
+        task.submit(lambda job: 1 // 0, results.append, errors.append)
+        wait_for(w, lambda: errors)
+        assert isinstance(errors[0], ZeroDivisionError)
+
+        task.close()
+        assert not w.scheduled
+
+    def test_latest_request_wins(self):
+        w = FakeWidget()
+        task = BackgroundTask(w)
+        started = threading.Event()
+        results = []
+
+        def slow(job):
+            started.set()
+            while True:
+                job.check()
+                time.sleep(0.01)
+
+        task.submit(slow, results.append)
+        started.wait(5)
+        task.submit(lambda job: "first", results.append)
+        task.submit(lambda job: "second", results.append)
+
+        wait_for(w, lambda: results)
+        wait_for(w, lambda: not task.busy)
+        w.run()
+        assert results == ["second"]
+        task.close()
+
+    def test_cancel(self):
+        w = FakeWidget()
+        task = BackgroundTask(w)
+        release = threading.Event()
+        results = []
+
+        task.submit(lambda job: release.wait(5) and "done", results.append)
+        task.cancel()
+        release.set()
+
+        wait_for(w, lambda: not task.busy)
+        w.run()
+        assert results == []
+        task.close()
@@ -0,0 +1,87 @@
+import itertools
+
+import pytest
+
+from merifib.fibonacci import Fibonacci
+from merifib.view import SequenceView
+
+
+class TestView:
+
+    def test_finite(self):
+        for length, seed in ((1, 0), (10, 0), (25, 13), (-1, 5), (-30, 8)):
+            f = Fibonacci(length, seed)
+            seq = f.sequence()
+            v = f.view()
+
+            assert len(v) == len(seq)
+            assert list(v) == seq
+            # Iteration can be repeated.
+            assert list(v) == seq
+            assert list(reversed(v)) == seq[::-1]
+            assert [v[i] for i in range(-len(seq), len(seq))] == seq + seq
+            with pytest.raises(IndexError):
+                v[len(seq)]
+            with pytest.raises(IndexError):
+                v[-len(seq) - 1]
+
+    def test_slices(self):
+        seq = Fibonacci(-40, 55).sequence()
+        v = Fibonacci(-40, 55).view()
+        bounds = (None, 0, 3, -5, 17, 40, 100, -100)
+        for start, stop, step in itertools.product(
+                bounds, bounds, (None, 1, 2, 7, -1, -3, 200, -200)):
+            s = slice(start, stop, step)
+            assert list(v[s]) == seq[s], s
+            assert len(v[s]) == len(seq[s])
+        # Slices of slices.
+        assert list(v[5:35:2][::-3][1:]) == seq[5:35:2][::-3][1:]
+
+    def test_large(self):
+        v = Fibonacci(10**6).view()
+        assert v[-1] == Fibonacci.nth(10**6)
+        w = v[10**5:10**5 + 100:3]
+        assert len(w) == 34
+        expected = list(itertools.islice(
+            Fibonacci(seed=Fibonacci.nth(10**5 + 1)).sequence(), 100))[::3]
+        assert list(w) == expected
+
+        # Steps above the addition limit are taken by jumps.
+        w = v[::10**5]
+        assert list(w) == [Fibonacci.nth(k * 10**5 + 1) for k in range(10)]
+        assert list(w[::-1]) == list(w)[::-1]
+
+    def test_infinite(self):
+        v = Fibonacci(seed=5).view()
+        assert v
+        assert list(itertools.islice(v, 5)) == [5, 8, 13, 21, 34]
+        assert v[3] == 21
+        assert list(v[2:6:2]) == [13, 34]
+        assert list(itertools.islice(v[1::2], 3)) == [8, 21, 55]
+        with pytest.raises(TypeError):
+            len(v)
+        with pytest.raises(IndexError):
+            v[-1]
+        with pytest.raises(ValueError):
+            v[::-1]
+
+    def test_search(self):
+        v = Fibonacci(-12, 13).view()     # F(-4) .. F(7)
+        assert v.index(13) == 11
+        assert v.index(1) == 3            # F(-1)
+        assert v.count(1) == 3            # F(-1), F(1), F(2)
+        assert -3 in v and 4 not in v and 21 not in v
+        with pytest.raises(ValueError):
+            v.index(13, 0, 11)
+
+        inf = Fibonacci(seed=0).view()
+        assert 10**6 not in inf
+        assert Fibonacci.nth(5001) in inf
+        assert inf.index(Fibonacci.nth(5001)) == 5000
+        assert -1 not in inf
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            SequenceView(0, 5, 0)
+        with pytest.raises(ValueError):
+            SequenceView(0, -1)